@@ -19,6 +19,25 @@ if config.config_file_name is not None:
 from src.core.models import Base
 target_metadata = Base.metadata
 
+# The database URL comes from the application settings (DATABASE_URL)
+from src.core.config import settings
+from src.data.households import household_database_url, household_ids, households_enabled
+config.set_main_option("sqlalchemy.url", settings.database_url)
+
+
+def target_urls() -> list:
+    """Databases to migrate.
+
+    With HOUSEHOLDS_DIR set, every household database is migrated in turn;
+    ``alembic -x household=<id> upgrade head`` targets a single one (this is
+    also how a new household database gets created).
+    """
+    if not households_enabled():
+        return [config.get_main_option("sqlalchemy.url")]
+    household = context.get_x_argument(as_dictionary=True).get("household")
+    households = [household] if household else household_ids()
+    return [household_database_url(h) for h in households]
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -37,16 +56,16 @@ def run_migrations_offline() -> None:
     script output.
 
     """
-    url = config.get_main_option("sqlalchemy.url")
-    context.configure(
-        url=url,
-        target_metadata=target_metadata,
-        literal_binds=True,
-        dialect_opts={"paramstyle": "named"},
-    )
+    for url in target_urls():
+        context.configure(
+            url=url,
+            target_metadata=target_metadata,
+            literal_binds=True,
+            dialect_opts={"paramstyle": "named"},
+        )
 
-    with context.begin_transaction():
-        context.run_migrations()
+        with context.begin_transaction():
+            context.run_migrations()
 
 
 def run_migrations_online() -> None:
@@ -56,21 +75,24 @@ def run_migrations_online() -> None:
     and associate a connection with the context.
 
     """
-    connectable = engine_from_config(
-        config.get_section(config.config_ini_section, {}),
-        prefix="sqlalchemy.",
-        poolclass=pool.NullPool,
-    )
-
-    with connectable.connect() as connection:
-        context.configure(
-            connection=connection,
-            target_metadata=target_metadata,
-            render_as_batch=True
+    for url in target_urls():
+        connectable = engine_from_config(
+            config.get_section(config.config_ini_section, {}),
+            prefix="sqlalchemy.",
+            poolclass=pool.NullPool,
+            url=url,
         )
 
-        with context.begin_transaction():
-            context.run_migrations()
+        with connectable.connect() as connection:
+            context.configure(
+                connection=connection,
+                target_metadata=target_metadata,
+                render_as_batch=True
+            )
+
+            with context.begin_transaction():
+                context.run_migrations()
+        connectable.dispose()
 
 
 if context.is_offline_mode():
@@ -0,0 +1,33 @@
+"""Add indexes for hot query shapes
+
+Revision ID: 3f9c2a7d41b8
+Revises: df607578f7ed
+Create Date: 2026-10-18 09:12:37.418201
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f9c2a7d41b8'
+down_revision: Union[str, Sequence[str], None] = 'df607578f7ed'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_points_history_member_id_timestamp', 'points_history', ['member_id', 'timestamp', 'points_change'], unique=False)
+    op.create_index(op.f('ix_points_history_reward_id'), 'points_history', ['reward_id'], unique=False)
+    op.create_index('ix_tasks_assigned_to_id_status', 'tasks', ['assigned_to_id', 'status'], unique=False)
+    op.create_index(op.f('ix_tasks_created_at'), 'tasks', ['created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_tasks_created_at'), table_name='tasks')
+    op.drop_index('ix_tasks_assigned_to_id_status', table_name='tasks')
+    op.drop_index(op.f('ix_points_history_reward_id'), table_name='points_history')
+    op.drop_index('ix_points_history_member_id_timestamp', table_name='points_history')
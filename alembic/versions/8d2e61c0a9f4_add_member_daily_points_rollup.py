@@ -0,0 +1,48 @@
+"""Add member_daily_points rollup
+
+Revision ID: 8d2e61c0a9f4
+Revises: 3f9c2a7d41b8
+Create Date: 2026-10-18 10:04:52.730114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d2e61c0a9f4'
+down_revision: Union[str, Sequence[str], None] = '3f9c2a7d41b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('member_daily_points',
+    sa.Column('member_id', sa.Integer(), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('points_earned', sa.Integer(), nullable=False),
+    sa.Column('points_spent', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['member_id'], ['family_members.id'], ),
+    sa.PrimaryKeyConstraint('member_id', 'day')
+    )
+
+    # Backfill from the existing history
+    op.execute(
+        """
+        INSERT INTO member_daily_points (member_id, day, points_earned, points_spent)
+        SELECT member_id,
+               date(timestamp),
+               SUM(CASE WHEN points_change > 0 THEN points_change ELSE 0 END),
+               SUM(CASE WHEN points_change < 0 THEN -points_change ELSE 0 END)
+        FROM points_history
+        GROUP BY member_id, date(timestamp)
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('member_daily_points')
@@ -0,0 +1,50 @@
+"""Add tasks.expires_at
+
+Revision ID: b7e4c1d93a52
+Revises: 8d2e61c0a9f4
+Create Date: 2026-10-18 14:21:07.415302
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e4c1d93a52'
+down_revision: Union[str, Sequence[str], None] = '8d2e61c0a9f4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('tasks', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('expires_at', sa.DateTime(), nullable=True))
+        batch_op.create_index('ix_tasks_status_expires_at', ['status', 'expires_at'], unique=False)
+
+    # Backfill with the same rule as calculate_expiration_time (a month counts as 30 days),
+    # keeping the fractional seconds of created_at so the stored format matches the ORM's
+    op.execute(
+        """
+        UPDATE tasks
+        SET expires_at = datetime(
+                created_at,
+                '+' || (duration_value * CASE duration_unit
+                                             WHEN 'days' THEN 1
+                                             WHEN 'weeks' THEN 7
+                                             WHEN 'months' THEN 30
+                                         END) || ' days'
+            ) || substr(created_at, 20)
+        WHERE duration_value IS NOT NULL
+          AND duration_unit IN ('days', 'weeks', 'months')
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('tasks', schema=None) as batch_op:
+        batch_op.drop_index('ix_tasks_status_expires_at')
+        batch_op.drop_column('expires_at')
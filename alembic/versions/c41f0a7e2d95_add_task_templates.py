@@ -0,0 +1,58 @@
+"""Add task_templates and recurring task occurrences
+
+Revision ID: c41f0a7e2d95
+Revises: b7e4c1d93a52
+Create Date: 2026-10-18 16:05:42.118034
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41f0a7e2d95'
+down_revision: Union[str, Sequence[str], None] = 'b7e4c1d93a52'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('task_templates',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('description', sa.String(), nullable=False),
+    sa.Column('points', sa.Integer(), nullable=False),
+    sa.Column('assigned_to_id', sa.Integer(), nullable=True),
+    sa.Column('duration_value', sa.Integer(), nullable=False),
+    sa.Column('duration_unit', sa.String(), nullable=False),
+    sa.Column('starts_at', sa.DateTime(), nullable=False),
+    sa.Column('active', sa.Boolean(), nullable=False),
+    sa.Column('generated_until', sa.DateTime(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['assigned_to_id'], ['family_members.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('task_templates', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_task_templates_id'), ['id'], unique=False)
+
+    with op.batch_alter_table('tasks', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('template_id', sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column('occurrence_at', sa.DateTime(), nullable=True))
+        batch_op.create_foreign_key('fk_tasks_template_id_task_templates', 'task_templates', ['template_id'], ['id'])
+        batch_op.create_index('ix_tasks_template_id_occurrence_at', ['template_id', 'occurrence_at'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('tasks', schema=None) as batch_op:
+        batch_op.drop_index('ix_tasks_template_id_occurrence_at')
+        batch_op.drop_constraint('fk_tasks_template_id_task_templates', type_='foreignkey')
+        batch_op.drop_column('occurrence_at')
+        batch_op.drop_column('template_id')
+
+    with op.batch_alter_table('task_templates', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_task_templates_id'))
+
+    op.drop_table('task_templates')
@@ -0,0 +1,30 @@
+"""Add family_members.points_version
+
+Revision ID: e5a8d3f17c60
+Revises: c41f0a7e2d95
+Create Date: 2026-10-18 18:42:13.507219
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a8d3f17c60'
+down_revision: Union[str, Sequence[str], None] = 'c41f0a7e2d95'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('family_members', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('points_version', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('family_members', schema=None) as batch_op:
+        batch_op.drop_column('points_version')
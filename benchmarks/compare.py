@@ -0,0 +1,77 @@
+"""
+Comparaison de deux résultats de benchmark.
+
+    python -m benchmarks.compare .benchmarks/latest.json .benchmarks/baseline.json --threshold 0.2
+
+Un cas est en régression lorsque sa médiane dépasse celle de la référence de plus de
+`threshold` (en proportion) et de plus de `min_delta_ms` : l'écart absolu minimal évite de
+signaler le bruit de mesure des opérations de quelques dizaines de microsecondes.
+"""
+import argparse
+import json
+import sys
+from typing import List, Optional
+
+DEFAULT_THRESHOLD = 0.2
+DEFAULT_MIN_DELTA_MS = 0.5
+
+def load_results(path: str) -> dict:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+def compare_results(current: dict, baseline: dict, threshold: float = DEFAULT_THRESHOLD, min_delta_ms: float = DEFAULT_MIN_DELTA_MS) -> List[dict]:
+    """
+    Compare les médianes des cas présents dans les deux résultats.
+
+    Returns:
+        Une ligne par cas commun {name, baseline_ms, current_ms, ratio, regression},
+        triée par ratio décroissant.
+    """
+    rows = []
+    for name, result in current["results"].items():
+        reference = baseline["results"].get(name)
+        if reference is None:
+            continue
+        baseline_ms, current_ms = reference["median_ms"], result["median_ms"]
+        ratio = current_ms / baseline_ms if baseline_ms else float("inf")
+        rows.append({
+            "name": name,
+            "baseline_ms": baseline_ms,
+            "current_ms": current_ms,
+            "ratio": ratio,
+            "regression": ratio > 1 + threshold and current_ms - baseline_ms > min_delta_ms,
+        })
+    return sorted(rows, key=lambda row: row["ratio"], reverse=True)
+
+def format_comparison(rows: List[dict]) -> str:
+    width = max((len(row["name"]) for row in rows), default=4)
+    lines = [f"{'case':<{width}}  {'baseline':>10}  {'current':>10}  {'ratio':>7}"]
+    for row in rows:
+        flag = "  REGRESSION" if row["regression"] else ""
+        lines.append(
+            f"{row['name']:<{width}}  {row['baseline_ms']:>8.2f}ms  {row['current_ms']:>8.2f}ms  {row['ratio']:>6.2f}x{flag}"
+        )
+    return "\n".join(lines)
+
+def report(current: dict, baseline: dict, threshold: float, min_delta_ms: float) -> int:
+    """Affiche la comparaison ; retourne le code de sortie (1 en cas de régression)."""
+    rows = compare_results(current, baseline, threshold, min_delta_ms)
+    print(format_comparison(rows))
+    regressions = [row for row in rows if row["regression"]]
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) above {threshold:.0%} (and {min_delta_ms}ms)")
+        return 1
+    print(f"\nNo regression above {threshold:.0%}")
+    return 0
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare two benchmark result files")
+    parser.add_argument("current")
+    parser.add_argument("baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--min-delta-ms", type=float, default=DEFAULT_MIN_DELTA_MS)
+    args = parser.parse_args(argv)
+    return report(load_results(args.current), load_results(args.baseline), args.threshold, args.min_delta_ms)
+
+if __name__ == "__main__":
+    sys.exit(main())
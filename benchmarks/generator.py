@@ -0,0 +1,145 @@
+"""
+Générateur de foyers synthétiques pour les benchmarks.
+
+Les données sont tirées d'un `random.Random(seed)` : un même jeu de paramètres produit
+toujours le même foyer, à la date de fin près : elle vaut par défaut l'instant présent, pour
+que les statistiques hebdomadaires et mensuelles portent sur des données.
+"""
+import random
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, UTC
+from sqlalchemy import insert, update, bindparam
+from sqlalchemy.orm import Session
+from typing import Optional
+from src.core.models import FamilyMember, PointsHistory, Reward, Task, TaskCompletion
+from src.data.daily_points import rebuild_member_daily_points
+from src.data.database import calculate_expiration_time, DURATION_UNITS
+
+# Lignes par executemany : borne la mémoire des listes de paramètres
+INSERT_BATCH_SIZE = 10_000
+
+@dataclass
+class HouseholdSpec:
+    members: int = 6
+    tasks: int = 20_000
+    rewards: int = 20
+    years: float = 3.0
+    completion_ratio: float = 0.85  # part des tâches terminées
+    shared_ratio: float = 0.3       # part des tâches terminées à plusieurs
+    claim_ratio: float = 0.2        # probabilité de réclamer une récompense après des points gagnés
+    seed: int = 42
+
+def _insert(db: Session, model, rows: list):
+    for start in range(0, len(rows), INSERT_BATCH_SIZE):
+        db.execute(insert(model.__table__), rows[start:start + INSERT_BATCH_SIZE])
+
+def generate_household(db: Session, spec: HouseholdSpec, end: Optional[datetime] = None) -> dict:
+    """
+    Remplit une base vide avec un foyer synthétique.
+
+    Les tâches sont réparties sur `spec.years` années jusqu'à `end` ; chaque tâche terminée
+    produit ses participations et ses entrées d'historique, et les membres dépensent une
+    partie de leurs points en récompenses. Les totaux et `member_daily_points` sont
+    cohérents avec l'historique généré.
+
+    Returns:
+        Le nombre de lignes créées par table, avec les paramètres utilisés.
+    """
+    rng = random.Random(spec.seed)
+    end = end or datetime.now(UTC)
+    span = timedelta(days=365 * spec.years).total_seconds()
+
+    members = [{"id": i + 1, "name": f"Membre {i + 1}", "total_points": 0} for i in range(spec.members)]
+    rewards = [
+        {"id": i + 1, "name": f"Récompense {i + 1}", "cost": rng.randint(5, 150), "description": None}
+        for i in range(spec.rewards)
+    ]
+    member_ids = [m["id"] for m in members]
+    balances = dict.fromkeys(member_ids, 0)
+
+    created = sorted(end - timedelta(seconds=rng.uniform(0, span)) for _ in range(spec.tasks))
+    tasks, completions, history = [], [], []
+    for task_id, created_at in enumerate(created, start=1):
+        duration_value, duration_unit, expires_at = None, None, None
+        if rng.random() < 0.7:
+            duration_value, duration_unit = rng.randint(1, 3), rng.choice(DURATION_UNITS)
+            expires_at = calculate_expiration_time(created_at, duration_value, duration_unit)
+        points = rng.choice((5, 10, 10, 15, 20, 30, 50))
+        task = {
+            "id": task_id,
+            "description": f"Quête {task_id}",
+            "points": points,
+            "assigned_to_id": rng.choice(member_ids) if rng.random() < 0.8 else None,
+            "status": "pending",
+            "created_at": created_at,
+            "completed_at": None,
+            "duration_value": duration_value,
+            "duration_unit": duration_unit,
+            "expires_at": expires_at,
+        }
+        tasks.append(task)
+
+        deadline = min(expires_at or created_at + timedelta(days=2), end)
+        if rng.random() >= spec.completion_ratio or deadline <= created_at:
+            if expires_at is not None and expires_at < end:
+                task["status"] = "expired"
+            continue
+
+        completed_at = created_at + (deadline - created_at) * rng.random()
+        task["status"], task["completed_at"] = "completed", completed_at
+        if spec.members > 1 and rng.random() < spec.shared_ratio:
+            doers = rng.sample(member_ids, 2)
+        else:
+            doers = [task["assigned_to_id"] or rng.choice(member_ids)]
+        for member_id in doers:
+            completion_id = len(completions) + 1
+            completions.append({"id": completion_id, "task_id": task_id, "member_id": member_id, "completed_at": completed_at})
+            share = points // len(doers)
+            history.append({
+                "member_id": member_id,
+                "task_completion_id": completion_id,
+                "reward_id": None,
+                "points_change": share,
+                "reason": f"Completed task: Quête {task_id}",
+                "timestamp": completed_at,
+            })
+            balances[member_id] += share
+
+            if rng.random() < spec.claim_ratio:
+                reward = rng.choice(rewards)
+                if balances[member_id] >= reward["cost"]:
+                    balances[member_id] -= reward["cost"]
+                    history.append({
+                        "member_id": member_id,
+                        "task_completion_id": None,
+                        "reward_id": reward["id"],
+                        "points_change": -reward["cost"],
+                        "reason": f"Reward '{reward['name']}' claimed",
+                        "timestamp": min(completed_at + timedelta(minutes=rng.randint(1, 600)), end),
+                    })
+
+    _insert(db, FamilyMember, members)
+    _insert(db, Reward, rewards)
+    _insert(db, Task, tasks)
+    _insert(db, TaskCompletion, completions)
+    _insert(db, PointsHistory, history)
+    db.execute(
+        update(FamilyMember.__table__)
+        .where(FamilyMember.__table__.c.id == bindparam("member_id"))
+        .values(total_points=bindparam("points")),
+        [{"member_id": member_id, "points": points} for member_id, points in balances.items()],
+    )
+    db.commit()
+    daily_rows = rebuild_member_daily_points(db)
+
+    return {
+        **asdict(spec),
+        "rows": {
+            "family_members": len(members),
+            "rewards": len(rewards),
+            "tasks": len(tasks),
+            "task_completions": len(completions),
+            "points_history": len(history),
+            "member_daily_points": daily_rows,
+        },
+    }
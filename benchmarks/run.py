@@ -0,0 +1,416 @@
+"""
+Benchmarks de la couche de données et des principales routes de l'API.
+
+    python -m benchmarks.run --tasks 20000 --years 3 --output .benchmarks/latest.json
+    python -m benchmarks.run --baseline .benchmarks/baseline.json --threshold 0.2
+
+Un foyer synthétique (voir `benchmarks.generator`) est créé dans une base SQLite temporaire,
+avec le schéma, les pragmas et le pool de l'application. Chaque cas est exécuté une fois à
+vide puis `--repeat` fois ; la préparation éventuelle (tâche à valider, vidage du cache de
+réponses...) n'est pas chronométrée. Les routes sont appelées via `TestClient`, cache de
+réponses vidé : c'est le coût de construction de la réponse qui est mesuré.
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import sqlite3
+import statistics as stats
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, UTC
+from typing import Any, Callable, List, Optional
+import sqlalchemy
+from fastapi.testclient import TestClient
+from sqlalchemy import func, insert, update
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import sessionmaker
+from benchmarks.compare import DEFAULT_MIN_DELTA_MS, DEFAULT_THRESHOLD, load_results, report
+from benchmarks.generator import HouseholdSpec, generate_household
+from src.core import schemas
+from src.core.config import settings
+from src.core.models import Base, FamilyMember, PointsHistory, Reward, Task, TaskTemplate
+from src.data import async_database, async_statistics, daily_points, database, recurring, statistics
+from src.data.async_database import create_async_sqlite_engine
+from src.data.database import create_sqlite_engine
+
+RESULTS_VERSION = 1
+
+class Household:
+    """Identifiants utiles aux cas, relevés une fois le foyer généré."""
+
+    def __init__(self, db):
+        # Le membre le plus actif : historique et statistiques les plus volumineux
+        self.member_id = (
+            db.query(PointsHistory.member_id)
+            .group_by(PointsHistory.member_id)
+            .order_by(func.count().desc())
+            .limit(1)
+            .scalar()
+        )
+        self.member_ids = [member_id for (member_id,) in db.query(FamilyMember.id).order_by(FamilyMember.id)]
+        self.reward_id = db.query(Reward.id).order_by(Reward.cost).limit(1).scalar()
+        self.task_id = db.query(func.max(Task.id)).scalar()
+        self.week_ago = datetime.now(UTC) - timedelta(days=7)
+        self.counter = 0
+
+    def unique(self, prefix: str) -> str:
+        self.counter += 1
+        return f"{prefix} {self.counter}"
+
+    def pending_tasks(self, db, count: int = 1) -> List[int]:
+        """Insère `count` tâches en attente, sans échéance, et retourne leurs identifiants."""
+        rows = [{"description": self.unique("Bench"), "points": 10, "status": "pending", "created_at": datetime.now(UTC)} for _ in range(count)]
+        ids = db.execute(insert(Task).returning(Task.id), rows).scalars().all()
+        db.commit()
+        return list(ids)
+
+    def fund(self, db, points: int = 1000):
+        """Garantit au membre de référence de quoi réclamer une récompense."""
+        db.execute(update(FamilyMember).where(FamilyMember.id == self.member_id).values(total_points=FamilyMember.total_points + points))
+        db.commit()
+
+def _completion(member_id: int) -> List[schemas.TaskCompletionData]:
+    return [schemas.TaskCompletionData(member_id=member_id, percentage=100)]
+
+def _templates(db, household: Household, count: int = 20):
+    starts_at = datetime.now(UTC) - timedelta(days=30)
+    db.add_all(
+        TaskTemplate(description=household.unique("Récurrente"), points=5, duration_value=1, duration_unit="days", starts_at=starts_at, active=True)
+        for _ in range(count)
+    )
+    db.commit()
+
+SCALED_TEMPLATES = "Récurrente à grande échelle"
+
+def _drop_scaled_templates(db):
+    """Retire les modèles de `_scaled_templates` et leurs occurrences, pour ne pas alourdir les cas suivants."""
+    template_ids = [template_id for (template_id,) in db.query(TaskTemplate.id).filter(TaskTemplate.description.startswith(SCALED_TEMPLATES))]
+    if template_ids:
+        db.query(Task).filter(Task.template_id.in_(template_ids)).delete(synchronize_session=False)
+        db.query(TaskTemplate).filter(TaskTemplate.id.in_(template_ids)).delete(synchronize_session=False)
+        db.commit()
+
+def _scaled_templates(db, household: Household):
+    # 300 modèles quotidiens sur 180 jours : 54 000 occurrences par exécution
+    _drop_scaled_templates(db)
+    starts_at = datetime.now(UTC) - timedelta(days=30)
+    db.add_all(
+        TaskTemplate(description=household.unique(SCALED_TEMPLATES), points=1, duration_value=1, duration_unit="days", starts_at=starts_at, active=True)
+        for _ in range(300)
+    )
+    db.commit()
+
+# (nom, préparation(db, foyer) -> argument, exécution(db, foyer, argument))
+SYNC_CASES: List[tuple] = [
+    ("database.get_family_members", None, lambda db, h, _: database.get_family_members(db)),
+    ("database.get_family_member_by_id", None, lambda db, h, _: database.get_family_member_by_id(db, h.member_id)),
+    ("database.get_tasks_for_member", None, lambda db, h, _: database.get_tasks_for_member(db, h.member_id)),
+    ("database.get_tasks_for_member_by_status", None, lambda db, h, _: database.get_tasks_for_member_by_status(db, h.member_id, "completed")),
+    ("database.get_task_by_id", None, lambda db, h, _: database.get_task_by_id(db, h.task_id)),
+    ("database.get_all_tasks", None, lambda db, h, _: database.get_all_tasks(db)),
+    ("database.get_tasks_created_after", None, lambda db, h, _: database.get_tasks_created_after(db, h.week_ago)),
+    ("database.get_rewards", None, lambda db, h, _: database.get_rewards(db)),
+    ("database.get_reward_by_id", None, lambda db, h, _: database.get_reward_by_id(db, h.reward_id)),
+    ("database.get_points_history_for_member", None, lambda db, h, _: database.get_points_history_for_member(db, h.member_id)),
+    ("database.get_daily_points_for_member[weekly]", None, lambda db, h, _: database.get_daily_points_for_member(db, h.member_id, "weekly")),
+    ("database.get_daily_points_for_member[monthly]", None, lambda db, h, _: database.get_daily_points_for_member(db, h.member_id, "monthly")),
+    ("database.get_claimed_rewards_for_member", None, lambda db, h, _: database.get_claimed_rewards_for_member(db, h.member_id)),
+    ("database.create_family_member", None, lambda db, h, _: database.create_family_member(db, h.unique("Membre bench"))),
+    ("database.update_family_member", None, lambda db, h, _: database.update_family_member(db, h.member_ids[-1], name=h.unique("Renommé"))),
+    ("database.create_task", None, lambda db, h, _: database.create_task(db, h.unique("Bench"), 10, h.member_id, 1, "days")),
+    ("database.update_task", lambda db, h: h.pending_tasks(db)[0], lambda db, h, task_id: database.update_task(db, task_id, points=20)),
+    ("database.delete_task", lambda db, h: h.pending_tasks(db)[0], lambda db, h, task_id: database.delete_task(db, task_id)),
+    ("database.complete_task", lambda db, h: h.pending_tasks(db)[0], lambda db, h, task_id: database.complete_task(db, task_id, _completion(h.member_id))),
+    ("database.create_reward", None, lambda db, h, _: database.create_reward(db, h.unique("Récompense bench"), 10)),
+    ("database.update_reward", None, lambda db, h, _: database.update_reward(db, h.reward_id, description=h.unique("Description"))),
+    ("database.claim_reward", lambda db, h: h.fund(db), lambda db, h, _: database.claim_reward(db, h.member_id, h.reward_id)),
+    (
+        "database.create_tasks_bulk[100]",
+        None,
+        lambda db, h, _: database.create_tasks_bulk(db, [schemas.TaskCreate(description=h.unique("Bulk"), points=5, assigned_to_id=h.member_id) for _ in range(100)]),
+    ),
+    (
+        "database.complete_tasks_bulk[100]",
+        lambda db, h: h.pending_tasks(db, 100),
+        lambda db, h, task_ids: database.complete_tasks_bulk(db, [schemas.TaskBulkCompletionItem(task_id=i, completions=_completion(h.member_id)) for i in task_ids]),
+    ),
+    ("database.expire_overdue_tasks", None, lambda db, h, _: database.expire_overdue_tasks(db)),
+    ("statistics.get_points_by_user_per_period[weekly]", None, lambda db, h, _: statistics.get_points_by_user_per_period(db, "weekly")),
+    ("statistics.get_points_by_user_per_period[monthly]", None, lambda db, h, _: statistics.get_points_by_user_per_period(db, "monthly")),
+    ("statistics.get_most_used_rewards", None, lambda db, h, _: statistics.get_most_used_rewards(db)),
+    ("daily_points.rebuild_member_daily_points", None, lambda db, h, _: daily_points.rebuild_member_daily_points(db)),
+    ("recurring.generate_recurring_tasks[20 templates]", _templates, lambda db, h, _: recurring.generate_recurring_tasks(db, datetime.now(UTC) + timedelta(days=14))),
+    (
+        "recurring.generate_recurring_tasks[300 templates x 180 days]",
+        _scaled_templates,
+        lambda db, h, _: recurring.generate_recurring_tasks(db, datetime.now(UTC) + timedelta(days=149)),
+    ),
+]
+
+# (nom, coroutine(db, foyer)) : lectures utilisées par les routes asynchrones
+ASYNC_CASES: List[tuple] = [
+    ("async_database.get_member_summaries", lambda db, h: async_database.get_member_summaries(db)),
+    ("async_database.get_all_task_rows", lambda db, h: async_database.get_all_task_rows(db)),
+    ("async_database.get_tasks_page[50]", lambda db, h: async_database.get_tasks_page(db, 50)),
+    ("async_database.get_task_rows_for_member_by_status", lambda db, h: async_database.get_task_rows_for_member_by_status(db, h.member_id, "completed")),
+    ("async_database.get_points_history_page[50]", lambda db, h: async_database.get_points_history_page(db, h.member_id, 50)),
+    ("async_database.get_daily_points_for_member[monthly]", lambda db, h: async_database.get_daily_points_for_member(db, h.member_id, "monthly")),
+    ("async_database.get_claimed_rewards_for_member", lambda db, h: async_database.get_claimed_rewards_for_member(db, h.member_id)),
+    ("async_statistics.get_points_by_user_per_period[monthly]", lambda db, h: async_statistics.get_points_by_user_per_period(db, "monthly")),
+    ("async_statistics.get_most_used_rewards", lambda db, h: async_statistics.get_most_used_rewards(db)),
+]
+
+# (nom, méthode, requête(db, foyer) -> (url, corps JSON))
+API_CASES: List[tuple] = [
+    ("GET /api/members", "GET", lambda db, h: ("/api/members", None)),
+    ("GET /api/tasks", "GET", lambda db, h: ("/api/tasks", None)),
+    ("GET /api/rewards", "GET", lambda db, h: ("/api/rewards", None)),
+    ("GET /api/leaderboard", "GET", lambda db, h: ("/api/leaderboard", None)),
+    ("GET /api/v1/leaderboard?top=10", "GET", lambda db, h: ("/api/v1/leaderboard?top=10", None)),
+    ("GET /api/v1/leaderboard?around={id}", "GET", lambda db, h: (f"/api/v1/leaderboard?around={h.member_id}&radius=5", None)),
+    ("GET /api/v1/dashboard", "GET", lambda db, h: ("/api/v1/dashboard", None)),
+    ("GET /api/v1/tasks", "GET", lambda db, h: ("/api/v1/tasks", None)),
+    ("GET /api/v1/statistiques?period=monthly", "GET", lambda db, h: ("/api/v1/statistiques?period=monthly", None)),
+    ("GET /api/v1/members/{id}/details", "GET", lambda db, h: (f"/api/v1/members/{h.member_id}/details?period=monthly", None)),
+    ("GET /api/v1/members/{id}/history", "GET", lambda db, h: (f"/api/v1/members/{h.member_id}/history", None)),
+    ("GET /api/v1/history/export", "GET", lambda db, h: ("/api/v1/history/export", None)),
+    ("GET / (page)", "GET", lambda db, h: ("/", None)),
+    ("GET /members/{id} (page)", "GET", lambda db, h: (f"/members/{h.member_id}", None)),
+    ("POST /api/tasks", "POST", lambda db, h: ("/api/tasks", {"description": h.unique("API"), "points": 10, "assigned_to_id": h.member_id})),
+    (
+        "POST /api/tasks/{id}/complete",
+        "POST",
+        lambda db, h: (f"/api/tasks/{h.pending_tasks(db)[0]}/complete", {"completions": [{"member_id": h.member_id, "percentage": 100}]}),
+    ),
+]
+
+def summarize(timings: List[float]) -> dict:
+    return {
+        "runs": len(timings),
+        "min_ms": min(timings) * 1000,
+        "median_ms": stats.median(timings) * 1000,
+        "mean_ms": stats.fmean(timings) * 1000,
+        "max_ms": max(timings) * 1000,
+    }
+
+def measure(run: Callable[[], Any], repeat: int, setup: Optional[Callable[[], Any]] = None) -> dict:
+    """Chronomètre `run(argument)` après une exécution à vide ; `setup` n'est pas chronométré."""
+    timings = []
+    for index in range(repeat + 1):
+        argument = setup() if setup else None
+        start = time.perf_counter()
+        run(argument)
+        elapsed = time.perf_counter() - start
+        if index:
+            timings.append(elapsed)
+    return summarize(timings)
+
+def _selected(name: str, only: Optional[str]) -> bool:
+    return only is None or only in name
+
+def run_data_cases(session_factory, household: Household, repeat: int, only: Optional[str]) -> dict:
+    results = {}
+    for name, setup, run in SYNC_CASES:
+        if not _selected(name, only):
+            continue
+
+        # Une session neuve par exécution, comme pour une requête
+        def prepare():
+            db = session_factory()
+            return db, setup(db, household) if setup else None
+
+        def execute(prepared):
+            db, argument = prepared
+            try:
+                run(db, household, argument)
+            finally:
+                db.close()
+
+        results[name] = measure(execute, repeat, prepare)
+    return results
+
+def run_async_cases(url: str, household: Household, repeat: int, only: Optional[str]) -> dict:
+    cases = [(name, run) for name, run in ASYNC_CASES if _selected(name, only)]
+    if not cases:
+        return {}
+
+    async def collect():
+        async_engine = create_async_sqlite_engine(url)
+        async_session_factory = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+        results = {}
+        try:
+            for name, run in cases:
+                timings = []
+                for index in range(repeat + 1):
+                    async with async_session_factory() as db:
+                        start = time.perf_counter()
+                        await run(db, household)
+                        elapsed = time.perf_counter() - start
+                    if index:
+                        timings.append(elapsed)
+                results[name] = summarize(timings)
+        finally:
+            await async_engine.dispose()
+        return results
+
+    return asyncio.run(collect())
+
+def run_api_cases(url: str, session_factory, household: Household, repeat: int, only: Optional[str]) -> dict:
+    cases = [case for case in API_CASES if _selected(case[0], only)]
+    if not cases:
+        return {}
+
+    # Importée ici : l'application lit `settings` au démarrage (lifespan)
+    from src.api.cache import response_cache
+    from src.api.leaderboard import leaderboards
+    from src.data.async_database import get_async_db, get_async_read_db
+    from src.data.database import get_db, get_read_db
+    from src.main import app
+
+    async_engine = create_async_sqlite_engine(url)
+    async_session_factory = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+    # Les routes GET passent, comme en production, par des connexions en lecture seule
+    read_engine = create_sqlite_engine(url, read_only=True)
+    read_session_factory = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+    async_read_engine = create_async_sqlite_engine(url, read_only=True)
+    async_read_session_factory = async_sessionmaker(async_read_engine, autoflush=False, expire_on_commit=False)
+
+    def session_dependency(factory):
+        def dependency():
+            with factory() as db:
+                yield db
+        return dependency
+
+    def async_session_dependency(factory):
+        async def dependency():
+            async with factory() as db:
+                yield db
+        return dependency
+
+    app.dependency_overrides[get_db] = session_dependency(session_factory)
+    app.dependency_overrides[get_read_db] = session_dependency(read_session_factory)
+    app.dependency_overrides[get_async_db] = async_session_dependency(async_session_factory)
+    app.dependency_overrides[get_async_read_db] = async_session_dependency(async_read_session_factory)
+    # Construit depuis la base du banc à la première requête
+    leaderboards.clear()
+    results = {}
+    try:
+        with TestClient(app) as client, session_factory() as db:
+            for name, method, build in cases:
+                def setup():
+                    response_cache.clear()
+                    return build(db, household)
+
+                def run(request):
+                    url, body = request
+                    response = client.request(method, url, json=body)
+                    response.read()
+                    assert response.status_code < 400, f"{name}: HTTP {response.status_code} {response.text[:200]}"
+
+                results[name] = measure(run, repeat, setup)
+            client.portal.call(async_engine.dispose)
+            client.portal.call(async_read_engine.dispose)
+    finally:
+        app.dependency_overrides.clear()
+        read_engine.dispose()
+    return results
+
+def environment() -> dict:
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "sqlalchemy": sqlalchemy.__version__,
+        "sqlite": sqlite3.sqlite_version,
+        "platform": platform.platform(),
+    }
+
+def run_benchmarks(spec: HouseholdSpec, repeat: int = 5, only: Optional[str] = None, api: bool = True) -> dict:
+    """Génère le foyer dans une base temporaire, exécute les cas et retourne les résultats."""
+    settings.cast_discovery_enabled = False
+    settings.task_expiry_sweep_interval = 0
+    settings.recurring_tasks_interval = 0
+    settings.leaderboard_warm_up = False
+
+    with tempfile.TemporaryDirectory(prefix="bench-") as directory:
+        url = f"sqlite:///{os.path.join(directory, 'bench.db')}"
+        engine = create_sqlite_engine(url)
+        session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        try:
+            Base.metadata.create_all(bind=engine)
+            start = time.perf_counter()
+            with session_factory() as db:
+                household_info = generate_household(db, spec)
+                household = Household(db)
+            household_info["generation_s"] = round(time.perf_counter() - start, 3)
+
+            results = run_data_cases(session_factory, household, repeat, only)
+            with session_factory() as db:
+                _drop_scaled_templates(db)
+            results.update(run_async_cases(url, household, repeat, only))
+            if api:
+                results.update(run_api_cases(url, session_factory, household, repeat, only))
+        finally:
+            engine.dispose()
+
+    return {
+        "version": RESULTS_VERSION,
+        "created_at": datetime.now(UTC).isoformat(),
+        "environment": environment(),
+        "household": household_info,
+        "repeat": repeat,
+        "results": results,
+    }
+
+def main(argv: Optional[List[str]] = None) -> int:
+    defaults = HouseholdSpec()
+    parser = argparse.ArgumentParser(description="Benchmark the data layer and API routes on a synthetic household")
+    parser.add_argument("--members", type=int, default=defaults.members)
+    parser.add_argument("--tasks", type=int, default=defaults.tasks)
+    parser.add_argument("--rewards", type=int, default=defaults.rewards)
+    parser.add_argument("--years", type=float, default=defaults.years)
+    parser.add_argument("--completion-ratio", type=float, default=defaults.completion_ratio)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per case (after one warm-up run)")
+    parser.add_argument("--only", help="Only run cases whose name contains this string")
+    parser.add_argument("--no-api", action="store_true", help="Skip the API routes")
+    parser.add_argument("--output", default=".benchmarks/latest.json")
+    parser.add_argument("--baseline", help="Result file to compare against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="Allowed slowdown of the median (0.2 = 20%%)")
+    parser.add_argument("--min-delta-ms", type=float, default=DEFAULT_MIN_DELTA_MS)
+    args = parser.parse_args(argv)
+
+    spec = HouseholdSpec(
+        members=args.members,
+        tasks=args.tasks,
+        rewards=args.rewards,
+        years=args.years,
+        completion_ratio=args.completion_ratio,
+        seed=args.seed,
+    )
+    results = run_benchmarks(spec, repeat=args.repeat, only=args.only, api=not args.no_api)
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+
+    rows = results["household"]["rows"]
+    print(f"Household: {', '.join(f'{count} {table}' for table, count in rows.items())} (generated in {results['household']['generation_s']}s)")
+    for name, result in results["results"].items():
+        print(f"{name:<60} {result['median_ms']:>10.2f}ms")
+    print(f"Results written to {args.output}")
+
+    if args.baseline:
+        print()
+        return report(results, load_results(args.baseline), args.threshold, args.min_delta_ms)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
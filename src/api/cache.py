@@ -0,0 +1,82 @@
+import hashlib
+import uuid
+from fastapi import APIRouter, Request
+from fastapi.responses import Response
+from pydantic_core import to_json
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional
+from src.core.cache import ResponseCache
+from src.core.config import settings
+from src.data.changes import on_commit, versions
+from src.data.households import current_household
+
+router = APIRouter()
+
+response_cache = ResponseCache(
+    max_entries=settings.response_cache_max_entries,
+    max_bytes=settings.response_cache_max_bytes,
+)
+# Chaque commit invalide les étiquettes des tables modifiées
+on_commit(response_cache.invalidate)
+
+# Les compteurs de version repartent de zéro à chaque démarrage : l'ETag inclut un identifiant de processus
+_instance_id = uuid.uuid4().hex[:8]
+
+def tags_version(tags: Iterable[str]) -> str:
+    """Version courante des étiquettes : change à chaque commit sur l'une des tables et à chaque démarrage."""
+    return f"{_instance_id}-" + ".".join(str(v) for v in versions(tags))
+
+def etag_for(key: str, tags: Iterable[str]) -> str:
+    """ETag fort d'une réponse, dérivé des versions des étiquettes dont elle dépend."""
+    key_hash = hashlib.blake2b(key.encode(), digest_size=6).hexdigest()
+    version = ".".join(str(v) for v in versions(tags))
+    return f'"{_instance_id}-{key_hash}-{version}"'
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Indique si l'en-tête If-None-Match de la requête désigne `etag`."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = {value.strip().removeprefix("W/") for value in header.split(",")}
+    return "*" in candidates or etag in candidates
+
+async def cached_response(
+    request: Request,
+    tags: Iterable[str],
+    build: Callable[[], Awaitable[Any]],
+    key: Optional[str] = None,
+    store: bool = True,
+) -> Response:
+    """
+    Sert une réponse JSON depuis le cache, ou la calcule avec `build` et la met en cache.
+
+    La réponse porte un ETag dérivé des versions des étiquettes : si le client présente
+    cet ETag dans If-None-Match, on répond 304 sans interroger la base.
+
+    Args:
+        request: La requête, dont le chemin et la query string forment la clé.
+        tags: Les étiquettes (tables) dont dépend la réponse.
+        build: Coroutine retournant le contenu à sérialiser.
+        key: Clé explicite, pour les réponses qui dépendent d'autre chose que l'URL.
+        store: False pour les réponses trop variables pour être mises en cache (ETag conservé).
+    """
+    tags = tuple(tags)
+    # Les foyers partagent le cache : la clé inclut toujours le foyer de la requête
+    key = f"{current_household.get()}:{key or f'{request.url.path}?{request.url.query}'}"
+    # L'ETag est calculé avant la lecture : il ne peut pas annoncer un contenu plus récent que le corps
+    headers = {"ETag": etag_for(key, tags), "Cache-Control": "no-cache"}
+    if etag_matches(request, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+
+    body = response_cache.get(key) if store else None
+    if body is None:
+        generation = response_cache.generation(tags)
+        # Encodage direct en octets par pydantic-core (modèles, listes, dictionnaires, dates)
+        body = to_json(await build())
+        if store:
+            response_cache.set(key, body, tags, generation)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+@router.get("/cache/stats", response_model=Dict[str, int])
+def read_cache_stats():
+    """Compteurs du cache de réponses (succès, échecs, taille, évictions)."""
+    return response_cache.stats()
@@ -0,0 +1,212 @@
+import json
+import logging
+import os
+import threading
+import uuid
+from concurrent.futures import Future
+from typing import Callable, Dict, List, Optional
+
+import pychromecast
+import zeroconf
+from pychromecast.discovery import CastBrowser, SimpleCastListener
+from pychromecast.models import CastInfo, HostServiceInfo
+
+from src.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+def _default_browser_factory(listener: SimpleCastListener, known_hosts: List[str]) -> CastBrowser:
+    return CastBrowser(listener, zeroconf.Zeroconf(), known_hosts)
+
+class ChromecastRegistry:
+    """
+    Registre des Chromecasts maintenu par une découverte mDNS en arrière-plan.
+
+    Le navigateur de découverte tourne pendant toute la vie de l'application : lister les
+    appareils est une simple lecture en mémoire. Les connexions sont mises en cache et les
+    recherches concurrentes d'un même appareil partagent une seule attente/connexion.
+    Les derniers hôtes connus sont persistés pour se connecter directement au démarrage.
+    """
+
+    def __init__(
+        self,
+        known_hosts_path: Optional[str] = None,
+        browser_factory: Callable[[SimpleCastListener, List[str]], CastBrowser] = _default_browser_factory,
+        connect: Optional[Callable[[CastInfo], pychromecast.Chromecast]] = None,
+        lookup_timeout: float = 10,
+    ):
+        self.known_hosts_path = known_hosts_path
+        self.lookup_timeout = lookup_timeout
+        self._browser_factory = browser_factory
+        self._connect = connect or self._connect_with_browser
+        self._browser: Optional[CastBrowser] = None
+        self._devices: Dict[uuid.UUID, CastInfo] = {}
+        self._known_hosts: Dict[uuid.UUID, CastInfo] = {}
+        self._casts: Dict[uuid.UUID, pychromecast.Chromecast] = {}
+        self._in_flight: Dict[uuid.UUID, Future] = {}
+        self._lock = threading.Lock()
+        self._device_found = threading.Condition(self._lock)
+        self._load_known_hosts()
+
+    # Cycle de vie
+
+    def start(self):
+        """Démarre la découverte en arrière-plan (à appeler au démarrage de l'application)."""
+        if self._browser is not None:
+            return
+        listener = SimpleCastListener(
+            add_callback=self._on_cast_found,
+            remove_callback=self._on_cast_removed,
+            update_callback=self._on_cast_found,
+        )
+        with self._lock:
+            known_hosts = sorted({info.host for info in self._known_hosts.values()})
+        self._browser = self._browser_factory(listener, known_hosts)
+        self._browser.start_discovery()
+
+    def stop(self):
+        browser, self._browser = self._browser, None
+        if browser is not None:
+            browser.stop_discovery()
+        with self._lock:
+            casts, self._casts = list(self._casts.values()), {}
+        for cast in casts:
+            try:
+                cast.disconnect(timeout=1)
+            except Exception as e:
+                logger.warning(f"Error disconnecting Chromecast {cast.name}: {e}")
+
+    # Lectures
+
+    def devices(self) -> List[Dict[str, str]]:
+        """Liste des appareils connus, sans scan réseau."""
+        with self._lock:
+            infos = list(self._devices.values())
+        return [
+            {"name": info.friendly_name or str(info.uuid), "uuid": str(info.uuid)}
+            for info in sorted(infos, key=lambda info: info.friendly_name or "")
+        ]
+
+    def get_chromecast(self, uuid_str: str) -> Optional[pychromecast.Chromecast]:
+        """
+        Retourne une connexion au Chromecast demandé (bloquant).
+
+        Les appels concurrents pour un même appareil sont regroupés sur une seule
+        recherche. Retourne None si l'appareil n'apparaît pas avant `lookup_timeout`.
+        """
+        target_uuid = uuid.UUID(uuid_str)
+        with self._lock:
+            cast = self._casts.get(target_uuid)
+            if cast is not None:
+                return cast
+            future = self._in_flight.get(target_uuid)
+            leader = future is None
+            if leader:
+                future = self._in_flight[target_uuid] = Future()
+
+        if not leader:
+            return future.result()
+
+        try:
+            cast = self._lookup(target_uuid)
+            future.set_result(cast)
+            return cast
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._in_flight.pop(target_uuid, None)
+
+    def _lookup(self, target_uuid: uuid.UUID) -> Optional[pychromecast.Chromecast]:
+        with self._device_found:
+            self._device_found.wait_for(lambda: target_uuid in self._devices, timeout=self.lookup_timeout)
+            info = self._devices.get(target_uuid)
+        if info is None:
+            return None
+        cast = self._connect(info)
+        with self._lock:
+            self._casts[target_uuid] = cast
+        return cast
+
+    def _connect_with_browser(self, info: CastInfo) -> pychromecast.Chromecast:
+        zconf = getattr(self._browser, "zc", None)
+        return pychromecast.get_chromecast_from_cast_info(info, zconf)
+
+    # Callbacks du navigateur
+
+    def _on_cast_found(self, cast_uuid: uuid.UUID, service: str):
+        browser = self._browser
+        info = browser.devices.get(cast_uuid) if browser is not None else None
+        if info is None:
+            return
+        with self._device_found:
+            previous = self._devices.get(cast_uuid)
+            self._devices[cast_uuid] = info
+            self._known_hosts[cast_uuid] = info
+            if previous is not None and (previous.host, previous.port) != (info.host, info.port):
+                # L'appareil a changé d'adresse : la connexion en cache n'est plus valide
+                self._casts.pop(cast_uuid, None)
+            self._device_found.notify_all()
+        self._save_known_hosts()
+
+    def _on_cast_removed(self, cast_uuid: uuid.UUID, service: str, cast_info: CastInfo):
+        with self._lock:
+            self._devices.pop(cast_uuid, None)
+            self._casts.pop(cast_uuid, None)
+
+    # Persistance des hôtes connus
+
+    def _load_known_hosts(self):
+        if not self.known_hosts_path or not os.path.exists(self.known_hosts_path):
+            return
+        try:
+            with open(self.known_hosts_path, encoding="utf-8") as f:
+                entries = json.load(f)
+            for uuid_str, entry in entries.items():
+                cast_uuid = uuid.UUID(uuid_str)
+                self._known_hosts[cast_uuid] = CastInfo(
+                    {HostServiceInfo(entry["host"], entry["port"])},
+                    cast_uuid,
+                    entry.get("model_name"),
+                    entry.get("friendly_name"),
+                    entry["host"],
+                    entry["port"],
+                    entry.get("cast_type"),
+                    entry.get("manufacturer"),
+                )
+            # Au démarrage à froid, les derniers hôtes connus sont utilisables sans découverte
+            self._devices.update(self._known_hosts)
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable Chromecast hosts file {self.known_hosts_path}: {e}")
+
+    def _save_known_hosts(self):
+        if not self.known_hosts_path:
+            return
+        with self._lock:
+            entries = {
+                str(info.uuid): {
+                    "host": info.host,
+                    "port": info.port,
+                    "friendly_name": info.friendly_name,
+                    "model_name": info.model_name,
+                    "cast_type": info.cast_type,
+                    "manufacturer": info.manufacturer,
+                }
+                for info in self._known_hosts.values()
+            }
+        try:
+            directory = os.path.dirname(self.known_hosts_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{self.known_hosts_path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entries, f, indent=2)
+            os.replace(tmp_path, self.known_hosts_path)
+        except OSError as e:
+            logger.warning(f"Could not persist Chromecast hosts to {self.known_hosts_path}: {e}")
+
+cast_registry = ChromecastRegistry(
+    known_hosts_path=settings.cast_known_hosts_path,
+    lookup_timeout=settings.cast_lookup_timeout,
+)
@@ -0,0 +1,56 @@
+from datetime import datetime, timedelta, UTC
+from fastapi import APIRouter, Depends, Query, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.data.async_database import get_async_read_db, get_member_summaries, get_task_rows_created_after, get_reward_rows
+from src.core import schemas
+from src.api.cache import cached_response
+
+router = APIRouter()
+
+# Fenêtre des tâches récentes affichées par le tableau de bord
+DASHBOARD_DAYS = 7
+
+def tasks_window_start(days: int = DASHBOARD_DAYS) -> datetime:
+    """Début de la fenêtre des tâches récentes, arrondi à l'heure pour que la réponse reste cachable."""
+    return (datetime.now(UTC) - timedelta(days=days)).replace(minute=0, second=0, microsecond=0)
+
+@router.get("/dashboard", response_model=schemas.DashboardSnapshot)
+async def read_dashboard(
+    request: Request,
+    days: int = Query(DASHBOARD_DAYS, ge=1, le=31, description="Nombre de jours de tâches récentes"),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """
+    Récupère en une seule requête tout ce qu'affiche le tableau de bord :
+    classement, membres, tâches récentes et récompenses.
+    """
+    tasks_since = tasks_window_start(days)
+    return await cached_response(
+        request,
+        ("members", "tasks", "rewards"),
+        lambda: build_dashboard(db, tasks_since),
+        key=f"{request.url.path}?days={days}&since={tasks_since.isoformat()}",
+    )
+
+async def build_dashboard(db: AsyncSession, tasks_since: datetime):
+    """Assemble l'instantané du tableau de bord (une requête pour les membres, deux pour les tâches, une pour les récompenses)."""
+    members = [schemas.MemberSummary.model_validate(row) for row in await get_member_summaries(db)]
+    tasks = await get_task_rows_created_after(db, tasks_since)
+    rewards = await get_reward_rows(db)
+
+    # Les ex aequo partagent le même rang
+    leaderboard = []
+    for position, member in enumerate(members, start=1):
+        if leaderboard and leaderboard[-1].total_points == member.total_points:
+            rank = leaderboard[-1].rank
+        else:
+            rank = position
+        leaderboard.append(schemas.LeaderboardEntry(rank=rank, **member.model_dump()))
+
+    return schemas.DashboardSnapshot(
+        leaderboard=leaderboard,
+        members=sorted(members, key=lambda member: member.name.lower()),
+        tasks=schemas.TaskList.validate_python(tasks),
+        rewards=schemas.RewardList.validate_python(rewards, from_attributes=True),
+        tasks_since=tasks_since,
+    )
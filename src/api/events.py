@@ -0,0 +1,53 @@
+import asyncio
+import json
+from fastapi import APIRouter, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+from typing import Any, Dict
+from src.core.config import settings
+from src.core.events import EventBroker
+from src.data.changes import on_event
+from src.data.households import current_household
+
+router = APIRouter()
+
+event_broker = EventBroker(max_queue=settings.events_queue_size)
+
+# Les événements des fonctions d'écriture sont diffusés une fois leur transaction validée,
+# aux seuls abonnés du foyer concerné
+@on_event
+def publish_to_household(event: Dict[str, Any]):
+    event_broker.publish(event, topic=current_household.get())
+
+def format_sse(event: Dict[str, Any]) -> str:
+    """Formate un événement au format text/event-stream."""
+    payload = {key: value for key, value in event.items() if key not in ("id", "type")}
+    data = json.dumps(jsonable_encoder(payload), separators=(",", ":"))
+    return f"id: {event['id']}\nevent: {event['type']}\ndata: {data}\n\n"
+
+@router.get("/events")
+async def stream_events(request: Request):
+    """
+    Flux Server-Sent Events des changements (points des membres, quêtes créées ou terminées,
+    récompenses réclamées). Un événement `resync` demande au client de tout recharger.
+    """
+    subscription = event_broker.subscribe(current_household.get())
+
+    async def event_stream():
+        try:
+            yield f"retry: {settings.events_retry_ms}\n\n"
+            while not await request.is_disconnected():
+                try:
+                    event = await asyncio.wait_for(subscription.get(), timeout=settings.events_keepalive)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield format_sse(event)
+        finally:
+            event_broker.unsubscribe(subscription)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,116 @@
+import csv
+import io
+import json
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from typing import Optional
+from src.data.async_database import (
+    AsyncSessionLocal,
+    get_async_read_db,
+    get_family_member_by_id,
+    get_points_history_page,
+    stream_points_history,
+    POINTS_HISTORY_EXPORT_COLUMNS,
+)
+from src.api.cache import cached_response
+from src.api.pagination import decode_cursor, page
+from src.core import schemas
+from src.core.config import settings
+
+router = APIRouter()
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+async def _require_member(db: AsyncSession, member_id: int):
+    if await get_family_member_by_id(db, member_id) is None:
+        raise HTTPException(status_code=404, detail="Membre non trouvé")
+
+@router.get("/members/{member_id}/history", response_model=schemas.PointsHistoryPage)
+async def read_member_history(
+    request: Request,
+    member_id: int,
+    cursor: Optional[str] = Query(None, description="Curseur `next_cursor` de la page précédente"),
+    limit: int = Query(settings.page_size_default, ge=1, le=settings.page_size_max),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """
+    Historique des points d'un membre, du plus récent au plus ancien, page par page.
+    """
+    after = decode_cursor(cursor)
+
+    async def build():
+        await _require_member(db, member_id)
+        rows = await get_points_history_page(db, member_id, limit, after=after)
+        items, next_cursor = page(rows, limit, lambda entry: (entry.timestamp, entry.id))
+        return schemas.PointsHistoryPage(
+            items=schemas.PointsHistoryList.validate_python(items, from_attributes=True),
+            next_cursor=next_cursor,
+        )
+
+    return await cached_response(request, ("members", "points_history"), build, store=cursor is None)
+
+def _format_ndjson(rows) -> str:
+    lines = []
+    for row in rows:
+        entry = dict(zip(POINTS_HISTORY_EXPORT_COLUMNS, row))
+        entry["timestamp"] = entry["timestamp"].isoformat()
+        lines.append(json.dumps(entry, ensure_ascii=False, separators=(",", ":")))
+    return "\n".join(lines) + "\n"
+
+def _format_csv(rows) -> str:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerows(
+        [value.isoformat() if hasattr(value, "isoformat") else value for value in row]
+        for row in rows
+    )
+    return buffer.getvalue()
+
+async def _export_chunks(bind: AsyncEngine, export_format: str, member_id: Optional[int]):
+    # Session propre au flux : celle de la requête peut être fermée avant l'envoi du corps
+    # (dépendances `yield` de FastAPI < 0.118)
+    db = AsyncSessionLocal(bind=bind)
+    try:
+        if export_format == "csv":
+            header = io.StringIO()
+            csv.writer(header).writerow(POINTS_HISTORY_EXPORT_COLUMNS)
+            yield header.getvalue()
+        formatter = _format_csv if export_format == "csv" else _format_ndjson
+        async for rows in stream_points_history(db, member_id=member_id):
+            yield formatter(rows)
+    finally:
+        await db.close()
+
+def _export_response(db: AsyncSession, export_format: str, member_id: Optional[int], filename: str) -> StreamingResponse:
+    """Diffuse l'export depuis une session ouverte sur le même moteur (lecture seule) que `db`."""
+    return StreamingResponse(
+        _export_chunks(db.bind, export_format, member_id),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{export_format}"'},
+    )
+
+@router.get("/members/{member_id}/history/export")
+async def export_member_history(
+    member_id: int,
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$", description="'ndjson' ou 'csv'"),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """
+    Exporte tout l'historique de points d'un membre, en flux (mémoire constante).
+    """
+    await _require_member(db, member_id)
+    return _export_response(db, format, member_id, f"points_history_member_{member_id}")
+
+@router.get("/history/export")
+async def export_family_history(
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$", description="'ndjson' ou 'csv'"),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """
+    Exporte l'historique de points de tout le foyer, en flux (mémoire constante).
+    """
+    return _export_response(db, format, None, "points_history")
@@ -0,0 +1,64 @@
+from http.cookies import SimpleCookie
+from fastapi import Request
+from fastapi.responses import JSONResponse
+from typing import Tuple
+from urllib.parse import parse_qs
+from src.core.config import settings
+from src.data.households import UnknownHousehold, current_household, households_enabled, is_valid_household_id
+
+HOUSEHOLD_HEADER = "x-household"
+HOUSEHOLD_PARAM = "household"
+HOUSEHOLD_COOKIE = "household"
+
+def requested_household(scope) -> Tuple[str, str]:
+    """
+    Foyer demandé par la requête, et sa provenance.
+
+    Par ordre de priorité : en-tête `X-Household` (clients de l'API), paramètre `?household=`
+    puis cookie `household` (navigateur : le paramètre fixe le cookie pour les appels suivants,
+    y compris le flux SSE dont les en-têtes ne sont pas modifiables).
+    """
+    for name, value in scope["headers"]:
+        if name == HOUSEHOLD_HEADER.encode():
+            return value.decode("latin-1"), "header"
+    values = parse_qs(scope.get("query_string", b"").decode("latin-1")).get(HOUSEHOLD_PARAM)
+    if values:
+        return values[0], "query"
+    for name, value in scope["headers"]:
+        if name == b"cookie":
+            morsel = SimpleCookie(value.decode("latin-1")).get(HOUSEHOLD_COOKIE)
+            if morsel is not None:
+                return morsel.value, "cookie"
+    return settings.household_default, "default"
+
+class HouseholdMiddleware:
+    """Middleware ASGI fixant `current_household` pour la durée de la requête (multi-foyer uniquement)."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not households_enabled():
+            await self.app(scope, receive, send)
+            return
+
+        household, source = requested_household(scope)
+        if not is_valid_household_id(household):
+            response = JSONResponse(status_code=400, content={"detail": "Identifiant de foyer invalide"})
+            await response(scope, receive, send)
+            return
+
+        async def send_with_cookie(message):
+            if message["type"] == "http.response.start" and source == "query":
+                cookie = f"{HOUSEHOLD_COOKIE}={household}; Path=/; SameSite=Lax".encode("latin-1")
+                message["headers"] = list(message.get("headers", [])) + [(b"set-cookie", cookie)]
+            await send(message)
+
+        token = current_household.set(household)
+        try:
+            await self.app(scope, receive, send_with_cookie)
+        finally:
+            current_household.reset(token)
+
+async def unknown_household_handler(request: Request, exc: UnknownHousehold):
+    return JSONResponse(status_code=404, content={"detail": "Foyer inconnu"})
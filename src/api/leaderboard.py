@@ -0,0 +1,86 @@
+import logging
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from typing import Any, Dict, Optional
+from src.core import schemas
+from src.core.config import settings
+from src.core.leaderboard import Leaderboards, RankedLeaderboard
+from src.data.async_database import get_async_read_db, get_member_summaries
+from src.data.changes import on_event
+from src.data.database import get_member_summaries as load_member_summaries
+from src.data.households import current_household, households_enabled
+from src.data.jobs import for_each_household
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+leaderboards = Leaderboards()
+# Lectures successives écartées par des écritures concurrentes avant de servir un classement non installé
+LEADERBOARD_BUILD_ATTEMPTS = 3
+
+# Les événements validés tiennent à jour le classement du foyer concerné
+@on_event
+def update_leaderboard(event: Dict[str, Any]):
+    event_type = event["type"]
+    if event_type == "member.points":
+        change = lambda board: board.set_points(event["member_id"], event["total_points"], event["version"])
+    elif event_type == "member.created":
+        change = lambda board: board.upsert(event["member_id"], event["name"], event["total_points"])
+    elif event_type == "member.renamed":
+        change = lambda board: board.rename(event["member_id"], event["name"])
+    elif event_type == "member.deleted":
+        change = lambda board: board.remove(event["member_id"])
+    else:
+        return
+    leaderboards.apply(current_household.get(), change)
+
+def _warm_up(db: Session) -> int:
+    household = current_household.get()
+    generation = leaderboards.generation(household)
+    board = leaderboards.install(household, load_member_summaries(db), generation)
+    return len(board) if board is not None else 0
+
+def warm_up_leaderboards() -> int:
+    """Construit le classement de la base unique au démarrage ; en multi-foyer, chacun l'est à sa première lecture."""
+    if households_enabled():
+        return 0
+    members = for_each_household(_warm_up)
+    logger.info(f"Leaderboard built with {members} member(s)")
+    return members
+
+async def household_leaderboard(db: AsyncSession) -> RankedLeaderboard:
+    """Classement du foyer de la requête, reconstruit depuis la base s'il n'existe pas (démarrage, incohérence)."""
+    household = current_household.get()
+    board = leaderboards.get(household)
+    for _ in range(LEADERBOARD_BUILD_ATTEMPTS):
+        if board is not None:
+            return board
+        generation = leaderboards.generation(household)
+        members = await get_member_summaries(db)
+        board = leaderboards.install(household, members, generation)
+    # Écritures incessantes : la lecture sert telle quelle, la suivante retentera l'installation
+    return board or RankedLeaderboard(members)
+
+@router.get("/leaderboard", response_model=schemas.LeaderboardSlice)
+async def read_leaderboard(
+    top: int = Query(10, ge=1, le=settings.page_size_max, description="Nombre de premiers du classement"),
+    around: Optional[int] = Query(None, description="Membre autour duquel centrer l'extrait"),
+    radius: int = Query(2, ge=0, le=settings.page_size_max, description="Voisins de part et d'autre du membre `around`"),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """
+    Extrait du classement, servi depuis un classement trié en mémoire (sans requête SQL une
+    fois construit) : les `top` premiers, ou le membre `around` et ses `radius` voisins.
+
+    Les ex aequo partagent le même rang (1, 2, 2, 4) et sont départagés par le nom.
+    """
+    board = await household_leaderboard(db)
+    if around is None:
+        entries = board.top(top)
+    else:
+        entries = board.around(around, radius)
+        if entries is None:
+            raise HTTPException(status_code=404, detail="Member not found")
+    return schemas.LeaderboardSlice(total=len(board), entries=entries)
@@ -1,45 +1,55 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from src.data.database import (
-    get_db,
+from fastapi import APIRouter, Depends, HTTPException, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.data.async_database import (
+    get_async_read_db,
     get_family_member_by_id,
-    get_tasks_for_member_by_status,
+    get_task_rows_for_member_by_status,
     get_daily_points_for_member,
     get_claimed_rewards_for_member
 )
 from src.core import schemas
+from src.api.cache import cached_response
 from typing import List
 
 router = APIRouter()
 
 @router.get("/members/{member_id}/details")
-def get_member_details(
+async def get_member_details(
+    request: Request,
     member_id: int, 
     period: str = 'weekly', 
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     """
     Récupère toutes les informations détaillées pour un membre de la famille.
     """
-    member = get_family_member_by_id(db, member_id)
+    return await cached_response(
+        request,
+        ("members", "tasks", "points_history", "rewards"),
+        lambda: build_member_details(db, member_id, period),
+    )
+
+async def build_member_details(db: AsyncSession, member_id: int, period: str):
+    """Assemble les détails d'un membre (tâches, points journaliers, récompenses réclamées)."""
+    member = await get_family_member_by_id(db, member_id)
     if not member:
         raise HTTPException(status_code=404, detail="Membre non trouvé")
 
-    pending_tasks = get_tasks_for_member_by_status(db, member_id, 'pending')
-    completed_tasks = get_tasks_for_member_by_status(db, member_id, 'completed')
-    daily_points = get_daily_points_for_member(db, member_id, period)
-    claimed_rewards = get_claimed_rewards_for_member(db, member_id)
+    pending_tasks = await get_task_rows_for_member_by_status(db, member_id, 'pending')
+    completed_tasks = await get_task_rows_for_member_by_status(db, member_id, 'completed')
+    daily_points = await get_daily_points_for_member(db, member_id, period)
+    claimed_rewards = await get_claimed_rewards_for_member(db, member_id)
 
     # Conversion en schemas Pydantic pour la réponse
-    pending_tasks_response = [schemas.TaskResponse.from_orm(t) for t in pending_tasks]
-    completed_tasks_response = [schemas.TaskResponse.from_orm(t) for t in completed_tasks]
-    
+    pending_tasks_response = schemas.TaskList.validate_python(pending_tasks)
+    completed_tasks_response = schemas.TaskList.validate_python(completed_tasks)
+
     claimed_rewards_response = [
         {"name": name, "claimed_at": timestamp} for name, timestamp in claimed_rewards
     ]
 
     return {
-        "member": schemas.FamilyMemberResponse.from_orm(member),
+        "member": schemas.FamilyMemberResponse.model_validate(member),
         "pending_tasks": pending_tasks_response,
         "completed_tasks": completed_tasks_response,
         "daily_points": daily_points,
@@ -0,0 +1,84 @@
+import time
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from src.api.cache import response_cache
+from src.api.events import event_broker
+from src.core.metrics import QUERY_COUNT_BUCKETS, RequestStats, current_request_stats, registry
+
+router = APIRouter()
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+# Libellé des requêtes qui ne correspondent à aucune route (404) : borne la cardinalité
+UNMATCHED_ROUTE = "unmatched"
+
+http_requests_total = registry.counter(
+    "http_requests_total", "HTTP requests handled, by route template and status code.", ("method", "route", "status")
+)
+http_request_duration = registry.histogram(
+    "http_request_duration_seconds", "HTTP request latency, until the response is fully sent.", labelnames=("method", "route")
+)
+http_request_sql_queries = registry.histogram(
+    "http_request_sql_queries", "SQL statements executed per HTTP request.", QUERY_COUNT_BUCKETS, ("method", "route")
+)
+http_request_sql_duration = registry.histogram(
+    "http_request_sql_duration_seconds", "Time spent in SQL statements per HTTP request.", labelnames=("method", "route")
+)
+
+@registry.add_collector
+def _collect_gauges():
+    cache = response_cache.stats()
+    return [
+        ("response_cache_hits_total", "counter", "Response cache hits.", cache["hits"]),
+        ("response_cache_misses_total", "counter", "Response cache misses.", cache["misses"]),
+        ("response_cache_entries", "gauge", "Responses currently cached.", cache["entries"]),
+        ("response_cache_bytes", "gauge", "Size of the cached responses in bytes.", cache["bytes"]),
+        ("events_subscribers", "gauge", "Connected Server-Sent Events clients.", event_broker.subscriber_count),
+    ]
+
+def route_label(scope) -> str:
+    """Gabarit de la route (`/api/tasks/{task_id}`) plutôt que le chemin, pour borner la cardinalité."""
+    route = scope.get("route")
+    return getattr(route, "path", None) or UNMATCHED_ROUTE
+
+class MetricsMiddleware:
+    """
+    Middleware ASGI mesurant chaque requête HTTP : latence, statut, nombre et durée des requêtes SQL.
+
+    Les requêtes SQL sont rattachées à la requête HTTP par `current_request_stats`, renseigné
+    par les événements du moteur (voir `instrument_engine`).
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = current_request_stats.set(stats)
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - start
+            current_request_stats.reset(token)
+            method, route = scope["method"], route_label(scope)
+            http_requests_total.inc(method=method, route=route, status=status)
+            http_request_duration.observe(elapsed, method=method, route=route)
+            http_request_sql_queries.observe(stats.queries, method=method, route=route)
+            http_request_sql_duration.observe(stats.sql_seconds, method=method, route=route)
+
+@router.get("/metrics", response_class=PlainTextResponse)
+def read_metrics():
+    """Métriques du processus au format texte de Prometheus."""
+    return PlainTextResponse(registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
@@ -0,0 +1,43 @@
+import base64
+import json
+from datetime import datetime, UTC
+from fastapi import HTTPException
+from typing import Any, Optional, Tuple
+
+INVALID_CURSOR = "Invalid cursor"
+
+def encode_cursor(position: datetime, row_id: int) -> str:
+    """Encode une position de pagination (date, id) en curseur opaque."""
+    raw = json.dumps([position.isoformat(), row_id], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def decode_cursor(cursor: Optional[str]) -> Optional[Tuple[datetime, int]]:
+    """Décode un curseur produit par `encode_cursor` ; lève une erreur 400 s'il est invalide."""
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        position, row_id = json.loads(raw)
+        return datetime.fromisoformat(position), int(row_id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail=INVALID_CURSOR)
+
+def as_utc_naive(value: Optional[datetime]) -> Optional[datetime]:
+    """Ramène une date en UTC naïf, comme les dates stockées par SQLite."""
+    if value is not None and value.tzinfo is not None:
+        value = value.astimezone(UTC).replace(tzinfo=None)
+    return value
+
+def page(rows: list, limit: int, position: Any) -> Tuple[list, Optional[str]]:
+    """
+    Découpe `limit + 1` lignes lues en une page et le curseur de la suivante.
+
+    Args:
+        rows: Les lignes lues (une de plus que la taille de page).
+        limit: La taille de page.
+        position: Fonction retournant la position (date, id) d'une ligne.
+    """
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor(*position(rows[-1]))
@@ -0,0 +1,71 @@
+from fastapi import APIRouter, Depends, Query, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.api.cache import cached_response, tags_version
+from src.api.dashboard import build_dashboard, tasks_window_start
+from src.core import schemas
+from src.data.async_database import (
+    get_async_read_db,
+    get_claimed_rewards_by_member,
+    get_daily_points_by_member,
+    get_member_tasks_by_status,
+)
+from src.data.async_statistics import get_most_used_rewards, get_points_by_user_per_period
+
+router = APIRouter()
+
+SLIDESHOW_TAGS = ("members", "tasks", "points_history", "rewards")
+# Tâches terminées et récompenses affichées par diapositive de héros
+SLIDESHOW_RECENT_ITEMS = 10
+
+@router.get("/slideshow/manifest", response_model=schemas.SlideshowManifest)
+async def read_slideshow_manifest(
+    request: Request,
+    period: str = Query("weekly", pattern="^(weekly|monthly)$", description="Période des statistiques et des courbes de points"),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """
+    Toutes les diapositives du slideshow et leurs données, en une seule réponse.
+
+    `version` change dès qu'une des tables affichées est modifiée (ou que la fenêtre du tableau
+    de bord avance d'une heure) ; la réponse porte l'ETag correspondant : un client qui la
+    redemande avec If-None-Match reçoit 304 tant que rien n'a changé.
+    """
+    tasks_since = tasks_window_start()
+    # Calculée avant la lecture, comme l'ETag : elle ne peut pas annoncer un contenu plus récent que le corps
+    version = f"{tags_version(SLIDESHOW_TAGS)}-{tasks_since:%Y%m%d%H}"
+    return await cached_response(
+        request,
+        SLIDESHOW_TAGS,
+        lambda: build_slideshow_manifest(db, period, tasks_since, version),
+        key=f"{request.url.path}?period={period}&since={tasks_since.isoformat()}",
+    )
+
+async def build_slideshow_manifest(db: AsyncSession, period: str, tasks_since, version: str) -> schemas.SlideshowManifest:
+    """Assemble les diapositives : tableau de bord, statistiques, puis un héros par membre (du plus au moins de points)."""
+    dashboard = await build_dashboard(db, tasks_since)
+    points_by_user = await get_points_by_user_per_period(db, period=period)
+    most_used_rewards = await get_most_used_rewards(db)
+    pending_tasks = await get_member_tasks_by_status(db, "pending")
+    completed_tasks = await get_member_tasks_by_status(db, "completed", per_member=SLIDESHOW_RECENT_ITEMS)
+    daily_points = await get_daily_points_by_member(db, period)
+    claimed_rewards = await get_claimed_rewards_by_member(db, per_member=SLIDESHOW_RECENT_ITEMS)
+
+    slides = [
+        schemas.DashboardSlide(url="/slideshow/dashboard", dashboard=dashboard),
+        schemas.StatisticsSlide(
+            url="/slideshow/statistiques",
+            period=period,
+            points_by_user=points_by_user,
+            most_used_rewards=most_used_rewards,
+        ),
+    ]
+    for member in dashboard.leaderboard:
+        slides.append(schemas.HeroSlide(
+            url=f"/slideshow/hero/{member.id}",
+            member=schemas.MemberSummary(id=member.id, name=member.name, total_points=member.total_points),
+            pending_tasks=schemas.TaskList.validate_python(pending_tasks.get(member.id, [])),
+            completed_tasks=schemas.TaskList.validate_python(completed_tasks.get(member.id, [])),
+            daily_points=daily_points.get(member.id, []),
+            claimed_rewards=claimed_rewards.get(member.id, []),
+        ))
+    return schemas.SlideshowManifest(version=version, slides=slides)
@@ -1,13 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from src.data.database import get_db
-from src.data.statistics import get_points_by_user_per_period, get_most_used_rewards
+from fastapi import APIRouter, Depends, HTTPException, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.data.async_database import get_async_read_db
+from src.data.async_statistics import get_points_by_user_per_period, get_most_used_rewards
+from src.api.cache import cached_response
 from typing import List, Dict, Any
 
 router = APIRouter()
 
 @router.get("/statistiques", response_model=Dict[str, List[Dict[str, Any]]])
-def read_statistics(period: str = 'weekly', db: Session = Depends(get_db)):
+async def read_statistics(request: Request, period: str = 'weekly', db: AsyncSession = Depends(get_async_read_db)):
     """
     Endpoint pour récupérer les statistiques de points et de récompenses.
 
@@ -21,10 +22,13 @@ def read_statistics(period: str = 'weekly', db: Session = Depends(get_db)):
     if period not in ['weekly', 'monthly']:
         raise HTTPException(status_code=400, detail="La période doit être 'weekly' ou 'monthly'.")
     
-    points_stats = get_points_by_user_per_period(db, period=period)
-    rewards_stats = get_most_used_rewards(db)
-    
-    return {
-        "points_by_user": points_stats,
-        "most_used_rewards": rewards_stats
-    }
+    async def build():
+        points_stats = await get_points_by_user_per_period(db, period=period)
+        rewards_stats = await get_most_used_rewards(db)
+
+        return {
+            "points_by_user": points_stats,
+            "most_used_rewards": rewards_stats
+        }
+
+    return await cached_response(request, ("members", "points_history", "rewards"), build)
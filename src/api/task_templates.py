@@ -0,0 +1,40 @@
+from datetime import datetime, timedelta, UTC
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.orm import Session
+from typing import List
+from src.core import schemas
+from src.core.config import settings
+from src.core.models import FamilyMember
+from src.data.database import get_db, get_read_db
+from src.data.recurring import create_task_template, get_task_templates, delete_task_template, generate_recurring_tasks
+
+router = APIRouter()
+
+TEMPLATE_NOT_FOUND = "Modèle de tâche non trouvé"
+
+@router.post("/task-templates", response_model=schemas.TaskTemplateResponse, status_code=status.HTTP_201_CREATED)
+def add_task_template(template: schemas.TaskTemplateCreate, db: Session = Depends(get_db)):
+    if template.assigned_to_id is not None and db.get(FamilyMember, template.assigned_to_id) is None:
+        raise HTTPException(status_code=400, detail="Membre assigné inconnu")
+    return create_task_template(db, **template.model_dump())
+
+@router.get("/task-templates", response_model=List[schemas.TaskTemplateResponse])
+def read_task_templates(db: Session = Depends(get_read_db)):
+    return get_task_templates(db)
+
+@router.delete("/task-templates/{template_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_task_template_api(template_id: int, db: Session = Depends(get_db)):
+    if not delete_task_template(db, template_id):
+        raise HTTPException(status_code=404, detail=TEMPLATE_NOT_FOUND)
+
+@router.post("/task-templates/generate", response_model=schemas.TaskGenerationResult)
+def generate_tasks_api(
+    horizon_days: int = Query(settings.recurring_tasks_horizon_days, ge=0, le=366, description="Horizon de génération, en jours"),
+    db: Session = Depends(get_db)
+):
+    """
+    Génère immédiatement les occurrences des modèles actifs sur l'horizon demandé.
+
+    Sans effet sur les occurrences déjà créées : l'opération peut être relancée sans risque.
+    """
+    return generate_recurring_tasks(db, datetime.now(UTC) + timedelta(days=horizon_days))
@@ -0,0 +1,83 @@
+from datetime import datetime
+from fastapi import APIRouter, Depends, Query, Request
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+from src.data.database import get_db, create_tasks_bulk, complete_tasks_bulk, update_tasks_bulk
+from src.data.async_database import get_async_read_db, get_tasks_page
+from src.api.cache import cached_response
+from src.api.pagination import as_utc_naive, decode_cursor, page
+from src.core import schemas
+from src.core.config import settings
+
+router = APIRouter()
+
+@router.get("/tasks", response_model=schemas.TaskPage)
+async def list_tasks(
+    request: Request,
+    status: Optional[str] = Query(None, description="Statut des tâches ('pending', 'completed', ...)"),
+    assigned_to_id: Optional[int] = Query(None, description="Membre assigné"),
+    created_after: Optional[datetime] = Query(None, description="Créées à partir de cette date (ISO 8601)"),
+    created_before: Optional[datetime] = Query(None, description="Créées avant cette date (ISO 8601)"),
+    completed_after: Optional[datetime] = Query(None, description="Terminées à partir de cette date (ISO 8601)"),
+    completed_before: Optional[datetime] = Query(None, description="Terminées avant cette date (ISO 8601)"),
+    cursor: Optional[str] = Query(None, description="Curseur `next_cursor` de la page précédente"),
+    limit: int = Query(settings.page_size_default, ge=1, le=settings.page_size_max),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """
+    Liste les tâches, des plus récentes aux plus anciennes, page par page.
+
+    La pagination se fait par clé sur (created_at, id) : le coût d'une page ne dépend pas
+    de sa position dans l'historique.
+    """
+    after = decode_cursor(cursor)
+
+    async def build():
+        tasks = await get_tasks_page(
+            db,
+            limit,
+            after=after,
+            status=status,
+            assigned_to_id=assigned_to_id,
+            created_after=as_utc_naive(created_after),
+            created_before=as_utc_naive(created_before),
+            completed_after=as_utc_naive(completed_after),
+            completed_before=as_utc_naive(completed_before),
+        )
+        items, next_cursor = page(tasks, limit, lambda task: (task["created_at"], task["id"]))
+        return schemas.TaskPage(items=schemas.TaskList.validate_python(items), next_cursor=next_cursor)
+
+    # Seules les premières pages sont gardées en cache ; les suivantes ont tout de même un ETag
+    return await cached_response(request, ("tasks",), build, store=cursor is None)
+
+@router.post("/tasks/bulk", response_model=schemas.BulkResult)
+def create_tasks_bulk_api(payload: schemas.TaskBulkCreate, db: Session = Depends(get_db)):
+    """
+    Crée plusieurs tâches en une seule transaction.
+
+    Les éléments invalides (membre inconnu, durée incomplète) sont signalés dans les
+    résultats sans empêcher la création des autres.
+    """
+    return create_tasks_bulk(db, payload.tasks)
+
+@router.post("/tasks/update-bulk", response_model=schemas.BulkResult)
+def update_tasks_bulk_api(payload: schemas.TaskBulkUpdate, db: Session = Depends(get_db)):
+    """
+    Modifie plusieurs tâches en une seule transaction.
+
+    Seuls les champs fournis sont modifiés ; le statut ne change que par `/tasks/complete-bulk`.
+    Les éléments invalides (tâche introuvable, membre inconnu, durée incomplète) sont
+    signalés dans les résultats sans empêcher la modification des autres.
+    """
+    return update_tasks_bulk(db, payload.items)
+
+@router.post("/tasks/complete-bulk", response_model=schemas.BulkResult)
+def complete_tasks_bulk_api(payload: schemas.TaskBulkComplete, db: Session = Depends(get_db)):
+    """
+    Valide plusieurs tâches en une seule transaction.
+
+    Chaque élément est rapporté comme 'completed' ou 'error' (tâche introuvable ou déjà
+    terminée, pourcentages dont la somme n'est pas 100, membre inconnu).
+    """
+    return complete_tasks_bulk(db, payload.items)
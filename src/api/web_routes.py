@@ -1,16 +1,19 @@
 
 from fastapi import APIRouter, Request, Depends, HTTPException, status, Query
-from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
+from fastapi.responses import HTMLResponse, Response
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 from src.data.database import (
-    get_db, get_family_members, get_all_tasks, get_rewards, create_task, create_family_member, create_reward, complete_task, claim_reward, get_family_member_by_id, update_family_member, delete_family_member, get_task_by_id, update_task, delete_task, get_reward_by_id, update_reward, delete_reward
+    get_db, create_task, create_family_member, create_reward, complete_task, claim_reward, update_family_member, delete_family_member, update_task, delete_task, update_reward, delete_reward
 )
+from src.data import async_database
+from src.data.async_database import get_async_read_db
+from src.api.cache import cached_response, etag_matches
 from src.core import schemas
+from src.web.pages import show_menu, static_pages, templates
 
 router = APIRouter()
-templates = Jinja2Templates(directory="src/web/templates")
 
 MEMBER_NOT_FOUND = "Member not found"
 TASK_NOT_FOUND = "Task not found"
@@ -20,66 +23,92 @@ ALREADY_COMPLETED = "Task not found or already completed"
 
 
 
+# Pages sans données, rendues une fois (voir `src.web.pages`)
+STATIC_PAGE_TEMPLATES = (
+    "dashboard.html",
+    "members.html",
+    "quests_rewards.html",
+    "statistiques.html",
+    "slideshow.html",
+    "caster.html",
+    "_dashboard_content.html",
+    "_statistiques_content.html",
+)
+
+def prerender_pages():
+    """Rend toutes les pages sans données ; appelé au démarrage de l'application."""
+    static_pages.render_all(STATIC_PAGE_TEMPLATES)
+
+def static_page_response(request: Request, template: str) -> Response:
+    """Sert une page pré-rendue, avec un ETag dérivé de son contenu (304 si le client l'a déjà)."""
+    page = static_pages.get(template, show_menu(request))
+    headers = {"ETag": page.etag, "Cache-Control": "no-cache"}
+    if etag_matches(request, page.etag):
+        return Response(status_code=304, headers=headers)
+    return HTMLResponse(page.body, headers=headers)
+
 @router.get("/", response_class=HTMLResponse)
 async def read_root(request: Request):
-    return templates.TemplateResponse("dashboard.html", {"request": request})
+    return static_page_response(request, "dashboard.html")
 
 @router.get("/members", response_class=HTMLResponse)
 async def manage_members(request: Request):
-    return templates.TemplateResponse("members.html", {"request": request})
+    return static_page_response(request, "members.html")
 
 @router.get("/quests-rewards", response_class=HTMLResponse)
 async def manage_quests_rewards(request: Request):
-    return templates.TemplateResponse("quests_rewards.html", {"request": request})
+    return static_page_response(request, "quests_rewards.html")
 
 @router.get("/statistiques", response_class=HTMLResponse)
 async def view_statistics(request: Request):
-    return templates.TemplateResponse("statistiques.html", {"request": request})
+    return static_page_response(request, "statistiques.html")
 
 @router.get("/slideshow", response_class=HTMLResponse)
 async def view_slideshow(request: Request):
-    return templates.TemplateResponse("slideshow.html", {"request": request})
+    return static_page_response(request, "slideshow.html")
 
 @router.get("/caster", response_class=HTMLResponse)
 async def view_caster(request: Request):
-    return templates.TemplateResponse("caster.html", {"request": request})
+    return static_page_response(request, "caster.html")
 
 @router.get("/members/{member_id}", response_class=HTMLResponse)
-async def view_member_details(request: Request, member_id: int, db: Session = Depends(get_db)):
-    member = get_family_member_by_id(db, member_id)
+async def view_member_details(request: Request, member_id: int, db: AsyncSession = Depends(get_async_read_db)):
+    member = await async_database.get_family_member_by_id(db, member_id)
     if not member:
         raise HTTPException(status_code=404, detail="Héros non trouvé")
-    return templates.TemplateResponse("hero_details.html", {"request": request, "member": member})
+    return templates.TemplateResponse(request, "hero_details.html", {"member": member})
 
 
 # Slideshow partials
 
 @router.get("/slideshow/dashboard", response_class=HTMLResponse)
 async def slideshow_dashboard(request: Request):
-    return templates.TemplateResponse("_dashboard_content.html", {"request": request})
+    return static_page_response(request, "_dashboard_content.html")
 
 @router.get("/slideshow/statistiques", response_class=HTMLResponse)
 async def slideshow_statistiques(request: Request):
-    return templates.TemplateResponse("_statistiques_content.html", {"request": request})
+    return static_page_response(request, "_statistiques_content.html")
 
 @router.get("/slideshow/hero/{member_id}", response_class=HTMLResponse)
-async def slideshow_hero(request: Request, member_id: int, db: Session = Depends(get_db)):
-    member = get_family_member_by_id(db, member_id)
+async def slideshow_hero(request: Request, member_id: int, db: AsyncSession = Depends(get_async_read_db)):
+    member = await async_database.get_family_member_by_id(db, member_id)
     if not member:
         raise HTTPException(status_code=404, detail="Héros non trouvé")
-    return templates.TemplateResponse("_hero_details_content.html", {"request": request, "member": member})
+    return templates.TemplateResponse(request, "_hero_details_content.html", {"member": member})
 
 
 # API Endpoints - Members
 
 @router.get("/api/members", response_model=List[schemas.FamilyMemberResponse])
-def read_members(db: Session = Depends(get_db)):
-    members = get_family_members(db)
-    return members
+async def read_members(request: Request, db: AsyncSession = Depends(get_async_read_db)):
+    async def build():
+        members = await async_database.get_family_members(db)
+        return schemas.FamilyMemberList.validate_python(members, from_attributes=True)
+    return await cached_response(request, ("members",), build)
 
 @router.get("/api/members/{member_id}", response_model=schemas.FamilyMemberResponse)
-def read_member(member_id: int, db: Session = Depends(get_db)):
-    member = get_family_member_by_id(db, member_id)
+async def read_member(member_id: int, db: AsyncSession = Depends(get_async_read_db)):
+    member = await async_database.get_family_member_by_id(db, member_id)
     if member is None:
         raise HTTPException(status_code=404, detail=MEMBER_NOT_FOUND)
     return member
@@ -105,25 +134,31 @@ def delete_member(member_id: int, db: Session = Depends(get_db)):
 # API Endpoints - Tasks
 
 @router.get("/api/tasks", response_model=List[schemas.TaskResponse])
-def read_tasks(
-    db: Session = Depends(get_db),
+async def read_tasks(
+    request: Request,
+    db: AsyncSession = Depends(get_async_read_db),
     created_after: str = Query(None, description="Filter tasks created after this ISO date string")
 ):
+    dt = None
     if created_after:
         from datetime import datetime
         try:
             dt = datetime.fromisoformat(created_after)
         except Exception:
             raise HTTPException(status_code=400, detail="Invalid date format for created_after. Use ISO 8601.")
-        from src.data.database import get_tasks_created_after
-        tasks = get_tasks_created_after(db, dt)
-    else:
-        tasks = get_all_tasks(db)
-    return tasks
+
+    async def build():
+        if dt is not None:
+            tasks = await async_database.get_task_rows_created_after(db, dt)
+        else:
+            tasks = await async_database.get_all_task_rows(db)
+        return schemas.TaskList.validate_python(tasks, from_attributes=True)
+    # Chaque client envoie sa propre date : inutile de remplir le cache avec ces variantes
+    return await cached_response(request, ("tasks",), build, store=dt is None)
 
 @router.get("/api/tasks/{task_id}", response_model=schemas.TaskResponse)
-def read_task(task_id: int, db: Session = Depends(get_db)):
-    task = get_task_by_id(db, task_id)
+async def read_task(task_id: int, db: AsyncSession = Depends(get_async_read_db)):
+    task = await async_database.get_task_by_id(db, task_id)
     if task is None:
         raise HTTPException(status_code=404, detail=TASK_NOT_FOUND)
     return task
@@ -159,13 +194,15 @@ def complete_task_api(task_id: int, completion_data: schemas.TaskComplete, db: S
 # API Endpoints - Rewards
 
 @router.get("/api/rewards", response_model=List[schemas.RewardResponse])
-def read_rewards(db: Session = Depends(get_db)):
-    rewards = get_rewards(db)
-    return rewards
+async def read_rewards(request: Request, db: AsyncSession = Depends(get_async_read_db)):
+    async def build():
+        rewards = await async_database.get_reward_rows(db)
+        return schemas.RewardList.validate_python(rewards, from_attributes=True)
+    return await cached_response(request, ("rewards",), build)
 
 @router.get("/api/rewards/{reward_id}", response_model=schemas.RewardResponse)
-def read_reward(reward_id: int, db: Session = Depends(get_db)):
-    reward = get_reward_by_id(db, reward_id)
+async def read_reward(reward_id: int, db: AsyncSession = Depends(get_async_read_db)):
+    reward = await async_database.get_reward_by_id(db, reward_id)
     if reward is None:
         raise HTTPException(status_code=404, detail=REWARD_NOT_FOUND)
     return reward
@@ -199,6 +236,8 @@ def claim_reward_api(reward_claim: schemas.RewardClaim, db: Session = Depends(ge
 
 
 @router.get("/api/leaderboard", response_model=List[schemas.FamilyMemberResponse])
-def get_leaderboard(db: Session = Depends(get_db)):
-    leaderboard = get_family_members(db)
-    return leaderboard
+async def get_leaderboard(request: Request, db: AsyncSession = Depends(get_async_read_db)):
+    async def build():
+        leaderboard = await async_database.get_family_members(db)
+        return schemas.FamilyMemberList.validate_python(leaderboard, from_attributes=True)
+    return await cached_response(request, ("members",), build)
@@ -0,0 +1,97 @@
+import threading
+from collections import OrderedDict, defaultdict
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+class ResponseCache:
+    """
+    Cache LRU en mémoire de réponses sérialisées, invalidé par étiquettes.
+
+    Chaque entrée est associée aux étiquettes (tables) dont elle dépend. Un compteur de
+    génération par étiquette empêche d'enregistrer une réponse calculée pendant qu'une
+    écriture invalidait ces mêmes étiquettes.
+    """
+
+    def __init__(self, max_entries: int = 256, max_bytes: int = 8 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, Tuple[bytes, Tuple[str, ...]]]" = OrderedDict()
+        self._keys_by_tag: Dict[str, Set[str]] = defaultdict(set)
+        self._generations: Dict[str, int] = defaultdict(int)
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def generation(self, tags: Iterable[str]) -> Tuple[int, ...]:
+        """Capture l'état des étiquettes avant de calculer une réponse."""
+        with self._lock:
+            return tuple(self._generations[tag] for tag in tags)
+
+    def set(self, key: str, value: bytes, tags: Iterable[str], generation: Optional[Tuple[int, ...]] = None):
+        tags = tuple(tags)
+        if len(value) > self.max_bytes:
+            return
+        with self._lock:
+            if generation is not None and generation != tuple(self._generations[tag] for tag in tags):
+                return
+            self._remove(key)
+            self._entries[key] = (value, tags)
+            self._size += len(value)
+            for tag in tags:
+                self._keys_by_tag[tag].add(key)
+            while self._entries and (len(self._entries) > self.max_entries or self._size > self.max_bytes):
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def invalidate(self, tags: Iterable[str]):
+        with self._lock:
+            for tag in tags:
+                self._generations[tag] += 1
+                for key in list(self._keys_by_tag.pop(tag, ())):
+                    self._remove(key)
+                    self.invalidations += 1
+
+    def clear(self):
+        with self._lock:
+            for tag in list(self._keys_by_tag):
+                self._generations[tag] += 1
+            self._entries.clear()
+            self._keys_by_tag.clear()
+            self._size = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "bytes": self._size,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+    def _remove(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        value, tags = entry
+        self._size -= len(value)
+        for tag in tags:
+            keys = self._keys_by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_tag[tag]
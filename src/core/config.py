@@ -1,5 +1,85 @@
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+
+SQLITE_JOURNAL_MODES = {"DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"}
+SQLITE_SYNCHRONOUS_LEVELS = {"OFF", "NORMAL", "FULL", "EXTRA"}
+
+def _get_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    if value is None or value == "":
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"{name} doit être un entier (reçu : {value!r})")
+
+def _get_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None or value == "":
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+def _get_choice(name: str, default: str, choices: set) -> str:
+    value = os.getenv(name, default).upper()
+    if value not in choices:
+        raise ValueError(f"{name} doit valoir l'une de {sorted(choices)} (reçu : {value!r})")
+    return value
+
 class Settings:
+    """Configuration de l'application, lue depuis l'environnement (ou un fichier .env)."""
+
     def __init__(self):
-        pass
+        self.database_url = os.getenv("DATABASE_URL", "sqlite:///./db/heros_du_foyer.db")
+
+        # Multi-foyer : une base par famille dans ce dossier (vide = un seul foyer, DATABASE_URL)
+        self.households_dir = os.getenv("HOUSEHOLDS_DIR", "")
+        self.household_default = os.getenv("HOUSEHOLD_DEFAULT", "default")
+        self.households_max_open = _get_int("HOUSEHOLDS_MAX_OPEN", 32)
+        self.households_idle_timeout = _get_int("HOUSEHOLDS_IDLE_TIMEOUT", 600)  # secondes
+
+        # Pragmas SQLite appliqués à chaque nouvelle connexion
+        self.sqlite_journal_mode = _get_choice("SQLITE_JOURNAL_MODE", "WAL", SQLITE_JOURNAL_MODES)
+        self.sqlite_synchronous = _get_choice("SQLITE_SYNCHRONOUS", "NORMAL", SQLITE_SYNCHRONOUS_LEVELS)
+        self.sqlite_mmap_size = _get_int("SQLITE_MMAP_SIZE", 64 * 1024 * 1024)  # octets
+        self.sqlite_cache_size = _get_int("SQLITE_CACHE_SIZE", -16000)  # négatif = en Kio
+        self.sqlite_busy_timeout = _get_int("SQLITE_BUSY_TIMEOUT", 5000)  # millisecondes
+        # Routes GET servies par des connexions en lecture seule (`mode=ro`), distinctes de celles qui écrivent
+        self.read_only_sessions = _get_bool("READ_ONLY_SESSIONS", True)
+
+        # Pool de connexions
+        self.db_pool_size = _get_int("DB_POOL_SIZE", 5)
+        self.db_max_overflow = _get_int("DB_MAX_OVERFLOW", 10)
+        self.db_pool_timeout = _get_int("DB_POOL_TIMEOUT", 30)  # secondes
+
+        # Fichiers statiques versionnés et précompressés (`python -m src.web.assets`)
+        self.static_build_dir = os.getenv("STATIC_BUILD_DIR", "./build/static")
+
+        # Cache des réponses des endpoints de lecture
+        self.response_cache_max_entries = _get_int("RESPONSE_CACHE_MAX_ENTRIES", 256)
+        self.response_cache_max_bytes = _get_int("RESPONSE_CACHE_MAX_BYTES", 8 * 1024 * 1024)  # octets
+
+        # Classement en mémoire construit au démarrage (sinon à sa première lecture)
+        self.leaderboard_warm_up = _get_bool("LEADERBOARD_WARM_UP", True)
+
+        # Découverte des Chromecasts
+        self.cast_discovery_enabled = _get_bool("CAST_DISCOVERY_ENABLED", True)
+        self.cast_known_hosts_path = os.getenv("CAST_KNOWN_HOSTS_PATH", "./db/chromecasts.json")
+        self.cast_lookup_timeout = _get_int("CAST_LOOKUP_TIMEOUT", 10)  # secondes
+
+        # Flux d'événements (SSE)
+        self.events_queue_size = _get_int("EVENTS_QUEUE_SIZE", 100)
+        self.events_keepalive = _get_int("EVENTS_KEEPALIVE", 15)  # secondes
+        self.events_retry_ms = _get_int("EVENTS_RETRY_MS", 3000)
+
+        # Tâches de fond (0 = désactivée)
+        self.task_expiry_sweep_interval = _get_int("TASK_EXPIRY_SWEEP_INTERVAL", 60)  # secondes
+        self.recurring_tasks_interval = _get_int("RECURRING_TASKS_INTERVAL", 3600)  # secondes
+        self.recurring_tasks_horizon_days = _get_int("RECURRING_TASKS_HORIZON_DAYS", 14)
+
+        # Pagination des endpoints de liste
+        self.page_size_default = _get_int("PAGE_SIZE_DEFAULT", 50)
+        self.page_size_max = _get_int("PAGE_SIZE_MAX", 200)
 
-settings = Settings()
\ No newline at end of file
+settings = Settings()
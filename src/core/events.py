@@ -0,0 +1,71 @@
+import asyncio
+import itertools
+import threading
+from typing import Any, Dict, List, Optional
+
+RESYNC_EVENT_TYPE = "resync"
+
+class Subscription:
+    """File d'événements bornée d'un abonné, rattachée à sa boucle asyncio."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, max_queue: int, topic: Optional[str] = None):
+        self.loop = loop
+        self.topic = topic
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max(max_queue, 1))
+        self.overflows = 0
+
+    async def get(self) -> Dict[str, Any]:
+        return await self.queue.get()
+
+    def _deliver(self, event: Dict[str, Any]):
+        # Exécuté sur la boucle de l'abonné
+        if self.queue.full():
+            # Abonné trop lent : on abandonne son retard et on lui demande de tout recharger
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.overflows += 1
+            self.queue.put_nowait({"id": event["id"], "type": RESYNC_EVENT_TYPE})
+            return
+        self.queue.put_nowait(event)
+
+class EventBroker:
+    """
+    Diffuse les événements de changement à des abonnés asynchrones.
+
+    `publish` peut être appelé depuis n'importe quel thread (routes synchrones du threadpool
+    comme boucle asyncio) ; chaque abonné reçoit les événements sur sa propre boucle.
+    """
+
+    def __init__(self, max_queue: int = 100):
+        self.max_queue = max_queue
+        self._subscribers: List[Subscription] = []
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+
+    def subscribe(self, topic: Optional[str] = None) -> Subscription:
+        """Abonne l'appelant aux événements publiés sur `topic` (tous si None)."""
+        subscription = Subscription(asyncio.get_running_loop(), self.max_queue, topic)
+        with self._lock:
+            self._subscribers.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        with self._lock:
+            if subscription in self._subscribers:
+                self._subscribers.remove(subscription)
+
+    @property
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return len(self._subscribers)
+
+    def publish(self, event: Dict[str, Any], topic: Optional[str] = None):
+        with self._lock:
+            event = {"id": next(self._ids), **event}
+            subscribers = [s for s in self._subscribers if s.topic is None or s.topic == topic]
+        for subscription in subscribers:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription._deliver, event)
+            except RuntimeError:
+                # La boucle de l'abonné est fermée
+                self.unsubscribe(subscription)
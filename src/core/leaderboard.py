@@ -0,0 +1,269 @@
+import random
+import threading
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# (-points, nom, id) : l'ordre du classement (points décroissants, puis nom), comme en SQL
+RankKey = Tuple[int, str, int]
+
+# Niveaux de la liste à enjambements : 2^32 clés avant de dégrader la recherche
+SKIP_LIST_MAX_LEVEL = 32
+
+class _Node:
+    __slots__ = ("key", "next", "width")
+
+    def __init__(self, key: Optional[RankKey], level: int):
+        self.key = key
+        self.next: List[Optional["_Node"]] = [None] * level
+        # Nombre de clés franchies en suivant next[niveau] (sans objet quand next[niveau] est None)
+        self.width = [1] * level
+
+class IndexableSkipList:
+    """
+    Liste à enjambements indexable : clés triées, insertion, suppression, position d'une
+    clé et accès par position en O(log n) en moyenne.
+    """
+
+    def __init__(self, keys: Iterable[RankKey] = ()):
+        self._head = _Node(None, SKIP_LIST_MAX_LEVEL)
+        self._size = 0
+        # Construction en O(n) : les clés triées sont chaînées à la suite
+        last = [self._head] * SKIP_LIST_MAX_LEVEL
+        last_position = [0] * SKIP_LIST_MAX_LEVEL
+        for position, key in enumerate(sorted(keys), start=1):
+            node = _Node(key, self._random_level())
+            for level in range(len(node.next)):
+                last[level].next[level] = node
+                last[level].width[level] = position - last_position[level]
+                last[level] = node
+                last_position[level] = position
+            self._size = position
+
+    def __len__(self) -> int:
+        return self._size
+
+    @staticmethod
+    def _random_level() -> int:
+        level = 1
+        while level < SKIP_LIST_MAX_LEVEL and random.random() < 0.5:
+            level += 1
+        return level
+
+    def _predecessors(self, key: RankKey) -> Tuple[List[_Node], List[int]]:
+        """Dernier nœud avant `key` à chaque niveau, et sa position (la tête est en 0)."""
+        chain = [self._head] * SKIP_LIST_MAX_LEVEL
+        positions = [0] * SKIP_LIST_MAX_LEVEL
+        node, position = self._head, 0
+        for level in reversed(range(SKIP_LIST_MAX_LEVEL)):
+            following = node.next[level]
+            while following is not None and following.key < key:
+                position += node.width[level]
+                node, following = following, following.next[level]
+            chain[level] = node
+            positions[level] = position
+        return chain, positions
+
+    def index(self, key: RankKey) -> int:
+        """Nombre de clés strictement inférieures à `key` (comme `bisect_left`)."""
+        return self._predecessors(key)[1][0]
+
+    def add(self, key: RankKey):
+        chain, positions = self._predecessors(key)
+        position = positions[0] + 1
+        node = _Node(key, self._random_level())
+        for level in range(SKIP_LIST_MAX_LEVEL):
+            previous = chain[level]
+            if level < len(node.next):
+                node.next[level] = previous.next[level]
+                node.width[level] = positions[level] + previous.width[level] - positions[0]
+                previous.next[level] = node
+                previous.width[level] = position - positions[level]
+            else:
+                previous.width[level] += 1
+        self._size += 1
+
+    def remove(self, key: RankKey):
+        chain, _ = self._predecessors(key)
+        node = chain[0].next[0]
+        if node is None or node.key != key:
+            raise KeyError(key)
+        for level in range(SKIP_LIST_MAX_LEVEL):
+            previous = chain[level]
+            if level < len(node.next):
+                previous.next[level] = node.next[level]
+                previous.width[level] += node.width[level] - 1
+            else:
+                previous.width[level] -= 1
+        self._size -= 1
+
+    def iter_from(self, start: int) -> Iterator[RankKey]:
+        """Les clés à partir de la position `start` (0 pour la première)."""
+        node, position = self._head, 0
+        for level in reversed(range(SKIP_LIST_MAX_LEVEL)):
+            following = node.next[level]
+            while following is not None and position + node.width[level] <= start:
+                position += node.width[level]
+                node, following = following, following.next[level]
+        node = node.next[0]
+        while node is not None:
+            yield node.key  # type: ignore
+            node = node.next[0]
+
+class RankedLeaderboard:
+    """
+    Classement trié en mémoire des membres d'un foyer.
+
+    Les clés sont gardées dans une liste à enjambements indexable : un rang, le haut du
+    classement ou le voisinage d'un membre se trouvent en O(log n) (plus la taille de la
+    réponse), et une mise à jour coûte aussi O(log n).
+
+    Chaque membre garde la version de ses points (`points_version`) : les événements
+    publiés après commit peuvent arriver dans le désordre, une version plus ancienne que
+    celle connue est ignorée.
+
+    Les ex aequo partagent le même rang (1, 2, 2, 4), départagés à l'affichage par le nom.
+    """
+
+    def __init__(self, members: Iterable[Tuple[int, str, int, int]] = ()):
+        self._lock = threading.Lock()
+        self._members: Dict[int, RankKey] = {}
+        self._versions: Dict[int, int] = {}
+        for member_id, name, total_points, version in members:
+            self._members[member_id] = (-(total_points or 0), name, member_id)
+            self._versions[member_id] = version
+        self._keys = IndexableSkipList(self._members.values())
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, member_id: int) -> bool:
+        return member_id in self._members
+
+    def upsert(self, member_id: int, name: str, total_points: int, version: int = 0):
+        with self._lock:
+            self._versions[member_id] = version
+            self._replace(member_id, (-(total_points or 0), name, member_id))
+
+    def set_points(self, member_id: int, total_points: int, version: int) -> bool:
+        """Met à jour les points d'un membre ; False s'il est inconnu (classement à reconstruire)."""
+        with self._lock:
+            key = self._members.get(member_id)
+            if key is None:
+                return False
+            # Événement en retard sur une écriture déjà appliquée
+            if version <= self._versions[member_id]:
+                return True
+            self._versions[member_id] = version
+            self._replace(member_id, (-(total_points or 0), key[1], member_id))
+            return True
+
+    def rename(self, member_id: int, name: str) -> bool:
+        with self._lock:
+            key = self._members.get(member_id)
+            if key is None:
+                return False
+            self._replace(member_id, (key[0], name, member_id))
+            return True
+
+    def remove(self, member_id: int):
+        with self._lock:
+            key = self._members.pop(member_id, None)
+            self._versions.pop(member_id, None)
+            if key is not None:
+                self._keys.remove(key)
+
+    def top(self, count: int) -> List[dict]:
+        """Les `count` premiers du classement."""
+        with self._lock:
+            return self._entries(0, count)
+
+    def around(self, member_id: int, radius: int) -> Optional[List[dict]]:
+        """Le membre et ses `radius` voisins de part et d'autre ; None s'il est inconnu."""
+        with self._lock:
+            key = self._members.get(member_id)
+            if key is None:
+                return None
+            position = self._keys.index(key)
+            start = max(position - radius, 0)
+            return self._entries(start, position + radius + 1 - start)
+
+    def rank_of(self, total_points: int) -> int:
+        """Rang correspondant à un total : 1 + le nombre de membres qui ont strictement plus de points."""
+        with self._lock:
+            return self._rank(-total_points)
+
+    def _rank(self, negated_points: int) -> int:
+        # (-points,) précède toutes les clés de même total : on compte ceux qui ont plus de points
+        return self._keys.index((negated_points,)) + 1  # type: ignore
+
+    def _entries(self, start: int, count: int) -> List[dict]:
+        entries: List[dict] = []
+        rank = 0
+        for position, (negated_points, name, member_id) in enumerate(self._keys.iter_from(start), start=start):
+            if len(entries) == count:
+                break
+            if not entries:
+                rank = self._rank(negated_points)
+            elif negated_points != -entries[-1]["total_points"]:
+                rank = position + 1
+            entries.append({"rank": rank, "id": member_id, "name": name, "total_points": -negated_points})
+        return entries
+
+    def _replace(self, member_id: int, key: RankKey):
+        previous = self._members.get(member_id)
+        if previous == key:
+            return
+        if previous is not None:
+            self._keys.remove(previous)
+        self._members[member_id] = key
+        self._keys.add(key)
+
+class Leaderboards:
+    """
+    Classements des foyers, construits depuis la base puis tenus à jour par les événements.
+
+    Un compteur de génération par foyer est incrémenté à chaque événement : un classement
+    lu en base pendant qu'une écriture était validée n'est pas installé (il serait déjà
+    périmé), comme les réponses de `ResponseCache`.
+    """
+
+    def __init__(self):
+        self._boards: Dict[str, RankedLeaderboard] = {}
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, household: str) -> Optional[RankedLeaderboard]:
+        with self._lock:
+            return self._boards.get(household)
+
+    def generation(self, household: str) -> int:
+        """Capture l'état d'un foyer avant de lire ses membres en base."""
+        with self._lock:
+            return self._generations.get(household, 0)
+
+    def install(self, household: str, members: Iterable[Tuple[int, str, int, int]], generation: int) -> Optional[RankedLeaderboard]:
+        """Installe le classement lu en base ; None si un événement est survenu depuis `generation`."""
+        board = RankedLeaderboard(members)
+        with self._lock:
+            if self._generations.get(household, 0) != generation:
+                return None
+            return self._boards.setdefault(household, board)
+
+    def apply(self, household: str, change: Callable[[RankedLeaderboard], Optional[bool]]):
+        """Applique un changement au classement du foyer s'il est construit ; l'écarte si `change` retourne False."""
+        with self._lock:
+            self._generations[household] = self._generations.get(household, 0) + 1
+            board = self._boards.get(household)
+        if board is not None and change(board) is False:
+            self.discard(household, board)
+
+    def discard(self, household: str, board: Optional[RankedLeaderboard] = None):
+        """Écarte le classement d'un foyer : il sera reconstruit depuis la base à la prochaine lecture."""
+        with self._lock:
+            if board is None or self._boards.get(household) is board:
+                self._boards.pop(household, None)
+
+    def clear(self):
+        with self._lock:
+            for household in self._generations:
+                self._generations[household] += 1
+            self._boards.clear()
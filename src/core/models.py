@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime
+from sqlalchemy import Boolean, Column, Integer, String, ForeignKey, DateTime, Date, Index
 from sqlalchemy.orm import relationship, declarative_base
 from datetime import datetime, UTC
 
@@ -9,6 +9,8 @@ class FamilyMember(Base): # type: ignore
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, unique=True, index=True, nullable=False)
     total_points = Column(Integer, default=0)
+    # Incrémenté à chaque écriture de total_points : ordonne les événements member.points
+    points_version = Column(Integer, nullable=False, default=0, server_default='0')
 
     tasks = relationship("Task", back_populates="assigned_to")
     points_history = relationship("PointsHistory", back_populates="member")
@@ -20,15 +22,40 @@ class Task(Base): # type: ignore
     description = Column(String, nullable=False)
     points = Column(Integer, nullable=False)
     assigned_to_id = Column(Integer, ForeignKey('family_members.id'), nullable=True) # Allow tasks to be unassigned
-    status = Column(String, default='pending') # e.g., 'pending', 'completed'
-    created_at = Column(DateTime, default=lambda: datetime.now(UTC))
+    status = Column(String, default='pending') # e.g., 'pending', 'completed', 'expired', 'scheduled' (occurrence à venir)
+    created_at = Column(DateTime, default=lambda: datetime.now(UTC), index=True)
     completed_at = Column(DateTime, nullable=True)
     duration_value = Column(Integer, nullable=True)
     duration_unit = Column(String, nullable=True)
+    expires_at = Column(DateTime, nullable=True) # created_at + durée, calculé à l'écriture
+    template_id = Column(Integer, ForeignKey('task_templates.id'), nullable=True) # Occurrence d'une tâche récurrente
+    occurrence_at = Column(DateTime, nullable=True)
 
     assigned_to = relationship("FamilyMember", back_populates="tasks")
     completions = relationship("TaskCompletion", back_populates="task")
 
+    __table_args__ = (
+        Index('ix_tasks_assigned_to_id_status', 'assigned_to_id', 'status'),
+        # Recherche des tâches en attente arrivées à échéance (balayage des expirations)
+        Index('ix_tasks_status_expires_at', 'status', 'expires_at'),
+        # Une seule tâche par occurrence d'un modèle : la génération peut être relancée sans doublon
+        Index('ix_tasks_template_id_occurrence_at', 'template_id', 'occurrence_at', unique=True),
+    )
+
+class TaskTemplate(Base): # type: ignore
+    """Modèle de tâche récurrente : une occurrence tous les `duration_value` `duration_unit` à partir de `starts_at`."""
+    __tablename__ = 'task_templates'
+    id = Column(Integer, primary_key=True, index=True)
+    description = Column(String, nullable=False)
+    points = Column(Integer, nullable=False)
+    assigned_to_id = Column(Integer, ForeignKey('family_members.id'), nullable=True)
+    duration_value = Column(Integer, nullable=False, default=1)
+    duration_unit = Column(String, nullable=False) # 'days', 'weeks' ou 'months'
+    starts_at = Column(DateTime, nullable=False)
+    active = Column(Boolean, nullable=False, default=True)
+    generated_until = Column(DateTime, nullable=True) # Occurrences matérialisées jusqu'à cette date
+    created_at = Column(DateTime, default=lambda: datetime.now(UTC))
+
 class Reward(Base): # type: ignore
     __tablename__ = 'rewards'
     id = Column(Integer, primary_key=True, index=True)
@@ -52,7 +79,7 @@ class PointsHistory(Base): # type: ignore
     id = Column(Integer, primary_key=True, index=True)
     member_id = Column(Integer, ForeignKey('family_members.id'), nullable=False)
     task_completion_id = Column(Integer, ForeignKey('task_completions.id'), nullable=True)
-    reward_id = Column(Integer, ForeignKey('rewards.id'), nullable=True)
+    reward_id = Column(Integer, ForeignKey('rewards.id'), nullable=True, index=True)
     points_change = Column(Integer, nullable=False)
     reason = Column(String, nullable=False)
     timestamp = Column(DateTime, default=lambda: datetime.now(UTC))
@@ -60,3 +87,16 @@ class PointsHistory(Base): # type: ignore
     member = relationship("FamilyMember", back_populates="points_history")
     completion = relationship("TaskCompletion", back_populates="points_history")
     reward = relationship("Reward")
+
+    __table_args__ = (
+        # Couvre les agrégats journaliers par membre (filtre + somme sans lecture de la table)
+        Index('ix_points_history_member_id_timestamp', 'member_id', 'timestamp', 'points_change'),
+    )
+
+class MemberDailyPoints(Base): # type: ignore
+    """Agrégat journalier de `points_history`, maintenu à chaque écriture dans l'historique."""
+    __tablename__ = 'member_daily_points'
+    member_id = Column(Integer, ForeignKey('family_members.id'), primary_key=True)
+    day = Column(Date, primary_key=True)
+    points_earned = Column(Integer, nullable=False, default=0)
+    points_spent = Column(Integer, nullable=False, default=0)
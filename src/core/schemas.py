@@ -1,6 +1,6 @@
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 from datetime import datetime
-from typing import Optional, List
+from typing import Any, Dict, Literal, Optional, List, Union
 
 class TaskCompletionBase(BaseModel):
     member_id: int
@@ -54,10 +54,42 @@ class TaskResponse(TaskBase):
     status: str
     created_at: datetime
     completed_at: Optional[datetime]
+    expires_at: Optional[datetime] = None
+    template_id: Optional[int] = None
     completions: List[TaskCompletionResponse] = []
 
     model_config = ConfigDict(from_attributes=True)
 
+class TaskTemplateCreate(BaseModel):
+    description: str
+    points: int
+    assigned_to_id: Optional[int] = None
+    duration_value: int = Field(1, ge=1)
+    duration_unit: Literal["days", "weeks", "months"]
+    starts_at: Optional[datetime] = None
+
+class TaskTemplateResponse(BaseModel):
+    id: int
+    description: str
+    points: int
+    assigned_to_id: Optional[int]
+    duration_value: int
+    duration_unit: str
+    starts_at: datetime
+    active: bool
+    generated_until: Optional[datetime]
+
+    model_config = ConfigDict(from_attributes=True)
+
+class TaskGenerationResult(BaseModel):
+    templates: int
+    created: int
+    until: datetime
+
+class TaskPage(BaseModel):
+    items: List[TaskResponse]
+    next_cursor: Optional[str] = None
+
 class RewardBase(BaseModel):
     name: str
     cost: int
@@ -88,6 +120,67 @@ class PointsHistoryResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class MemberSummary(BaseModel):
+    id: int
+    name: str
+    total_points: int
+
+    model_config = ConfigDict(from_attributes=True)
+
+class LeaderboardEntry(MemberSummary):
+    rank: int
+
+class LeaderboardSlice(BaseModel):
+    """Extrait du classement : le haut, ou le voisinage d'un membre."""
+    total: int
+    entries: List[LeaderboardEntry]
+
+class DashboardSnapshot(BaseModel):
+    leaderboard: List[LeaderboardEntry]
+    members: List[MemberSummary]
+    tasks: List[TaskResponse]
+    rewards: List[RewardResponse]
+    tasks_since: datetime
+
+
+class DailyPoints(BaseModel):
+    date: str
+    points: int
+
+class ClaimedReward(BaseModel):
+    name: str
+    claimed_at: datetime
+
+class DashboardSlide(BaseModel):
+    type: Literal["dashboard"] = "dashboard"
+    url: str
+    dashboard: DashboardSnapshot
+
+class StatisticsSlide(BaseModel):
+    type: Literal["statistics"] = "statistics"
+    url: str
+    period: str
+    points_by_user: List[Dict[str, Any]]
+    most_used_rewards: List[Dict[str, Any]]
+
+class HeroSlide(BaseModel):
+    type: Literal["hero"] = "hero"
+    url: str
+    member: MemberSummary
+    pending_tasks: List[TaskResponse]
+    completed_tasks: List[TaskResponse]
+    daily_points: List[DailyPoints]
+    claimed_rewards: List[ClaimedReward]
+
+class SlideshowManifest(BaseModel):
+    version: str
+    slides: List[Union[DashboardSlide, StatisticsSlide, HeroSlide]]
+
+class PointsHistoryPage(BaseModel):
+    items: List[PointsHistoryResponse]
+    next_cursor: Optional[str] = None
+
+
 class TaskCompletionData(BaseModel):
     member_id: int
     percentage: int
@@ -96,6 +189,38 @@ class TaskCompletionData(BaseModel):
 class TaskComplete(BaseModel):
     completions: List[TaskCompletionData]
 
+class TaskBulkCreate(BaseModel):
+    tasks: List[TaskCreate] = Field(..., max_length=5000)
+
+class TaskBulkCompletionItem(BaseModel):
+    task_id: int
+    completions: List[TaskCompletionData]
+
+class TaskBulkComplete(BaseModel):
+    items: List[TaskBulkCompletionItem] = Field(..., max_length=5000)
+
+class TaskBulkUpdateItem(BaseModel):
+    task_id: int
+    description: Optional[str] = None
+    points: Optional[int] = None
+    assigned_to_id: Optional[int] = None
+    duration_value: Optional[int] = None
+    duration_unit: Optional[str] = None
+
+class TaskBulkUpdate(BaseModel):
+    items: List[TaskBulkUpdateItem] = Field(..., max_length=5000)
+
+class BulkItemResult(BaseModel):
+    index: int
+    task_id: Optional[int] = None
+    status: str # 'created', 'updated', 'completed' ou 'error'
+    error: Optional[str] = None
+
+class BulkResult(BaseModel):
+    succeeded: int
+    failed: int
+    results: List[BulkItemResult]
+
 class RewardClaim(BaseModel):
     member_id: int
     reward_id: int
@@ -103,4 +228,11 @@ class RewardClaim(BaseModel):
 class CastRequest(BaseModel):
     device_uuid: str
     url: str
-    is_webpage: bool = False
\ No newline at end of file
+    is_webpage: bool = False
+
+# Validateurs des listes renvoyées par les routes de lecture, construits une seule fois :
+# `validate_python(lignes, from_attributes=True)` accepte objets ORM, lignes et dictionnaires
+FamilyMemberList = TypeAdapter(List[FamilyMemberResponse])
+TaskList = TypeAdapter(List[TaskResponse])
+RewardList = TypeAdapter(List[RewardResponse])
+PointsHistoryList = TypeAdapter(List[PointsHistoryResponse])
@@ -0,0 +1,413 @@
+from collections import defaultdict
+from sqlalchemy import event, func, select, tuple_
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import selectinload
+from src.core import schemas
+from src.core.config import settings
+from src.core.models import FamilyMember, Task, TaskCompletion, Reward, PointsHistory, MemberDailyPoints
+from src.data import database
+from src.data.database import (
+    apply_sqlite_pragmas, apply_sqlite_read_only_pragmas, get_period_start_date, instrument_engine,
+    read_only_sessions_enabled, read_only_url,
+)
+from src.data.households import HouseholdRegistry, current_household, households_enabled
+from datetime import datetime
+from typing import Dict, Optional, List, Tuple
+
+def to_async_url(url: str) -> str:
+    """Convertit une URL SQLite synchrone en URL pour le pilote aiosqlite."""
+    return make_url(url).set(drivername="sqlite+aiosqlite").render_as_string(hide_password=False)
+
+def create_async_sqlite_engine(url: str, read_only: bool = False, **engine_options):
+    """
+    Crée un moteur SQLite asynchrone (aiosqlite) avec les mêmes pragmas et le même pool que le moteur synchrone.
+
+    Avec `read_only`, les connexions sont ouvertes en `mode=ro` (base fichier uniquement).
+    """
+    if read_only:
+        url = read_only_url(url)
+    if database.is_file_database(url) and "poolclass" not in engine_options:
+        engine_options.setdefault("pool_size", settings.db_pool_size)
+        engine_options.setdefault("max_overflow", settings.db_max_overflow)
+        engine_options.setdefault("pool_timeout", settings.db_pool_timeout)
+    async_engine = create_async_engine(
+        to_async_url(url),
+        connect_args={"check_same_thread": False, "timeout": settings.sqlite_busy_timeout / 1000},
+        **engine_options,
+    )
+    event.listen(async_engine.sync_engine, "connect", apply_sqlite_read_only_pragmas if read_only else apply_sqlite_pragmas)
+    instrument_engine(async_engine.sync_engine)
+    return async_engine
+
+async_engine = create_async_sqlite_engine(database.SQLALCHEMY_DATABASE_URL)
+async_read_engine = (
+    create_async_sqlite_engine(database.SQLALCHEMY_DATABASE_URL, read_only=True)
+    if read_only_sessions_enabled(database.SQLALCHEMY_DATABASE_URL) else async_engine
+)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+household_async_engines = HouseholdRegistry(create_async_sqlite_engine, max_open=settings.households_max_open)
+household_async_read_engines = (
+    HouseholdRegistry(lambda url: create_async_sqlite_engine(url, read_only=True), max_open=settings.households_max_open)
+    if settings.read_only_sessions else household_async_engines
+)
+
+def async_engine_for(household: str, read_only: bool = False):
+    """Moteur asynchrone de la base d'un foyer ; la base unique si le multi-foyer est désactivé."""
+    if households_enabled():
+        return (household_async_read_engines if read_only else household_async_engines).get(household)
+    return async_read_engine if read_only else async_engine
+
+async def get_async_db():
+    async with AsyncSessionLocal(bind=async_engine_for(current_household.get())) as db:
+        yield db
+
+async def get_async_read_db():
+    """Session asynchrone en lecture seule, pour les routes qui n'écrivent pas."""
+    async with AsyncSessionLocal(bind=async_engine_for(current_household.get(), read_only=True)) as db:
+        yield db
+
+# Lectures
+
+# Projections des listes : les routes de lecture valident des lignes, sans construire d'objets ORM
+TASK_COLUMNS = (
+    Task.id, Task.description, Task.points, Task.duration_value, Task.duration_unit, Task.assigned_to_id,
+    Task.status, Task.created_at, Task.completed_at, Task.expires_at, Task.template_id,
+)
+REWARD_COLUMNS = (Reward.id, Reward.name, Reward.cost, Reward.description)
+POINTS_HISTORY_COLUMNS = (
+    PointsHistory.id, PointsHistory.member_id, PointsHistory.task_completion_id, PointsHistory.reward_id,
+    PointsHistory.points_change, PointsHistory.reason, PointsHistory.timestamp,
+)
+
+async def _task_projections(db: AsyncSession, query) -> List[dict]:
+    """
+    Exécute une sélection de `TASK_COLUMNS` et y joint les participations de chaque tâche.
+
+    Comme `selectinload`, une requête pour les tâches puis une par tranche de tâches pour les
+    participations ; le résultat est une liste de dictionnaires (colonnes et `completions`).
+    """
+    tasks = [dict(row._mapping, completions=[]) for row in (await db.execute(query)).all()]
+    tasks_by_id = {task["id"]: task for task in tasks}
+    task_ids = list(tasks_by_id)
+    for start in range(0, len(task_ids), database.BULK_CHUNK_SIZE):
+        result = await db.execute(
+            select(TaskCompletion.task_id, TaskCompletion.id, TaskCompletion.member_id, TaskCompletion.completed_at)
+            .filter(TaskCompletion.task_id.in_(task_ids[start:start + database.BULK_CHUNK_SIZE]))
+        )
+        for task_id, completion_id, member_id, completed_at in result.all():
+            tasks_by_id[task_id]["completions"].append({"id": completion_id, "member_id": member_id, "completed_at": completed_at})
+    return tasks
+
+async def get_family_members(db: AsyncSession):
+    result = await db.execute(
+        select(FamilyMember)
+        .options(selectinload(FamilyMember.completions))
+        .order_by(FamilyMember.total_points.desc())
+    )
+    return result.scalars().all()
+
+async def get_family_member_by_id(db: AsyncSession, member_id: int):
+    result = await db.execute(
+        select(FamilyMember)
+        .options(selectinload(FamilyMember.completions))
+        .filter(FamilyMember.id == member_id)
+    )
+    return result.scalars().first()
+
+async def get_member_summaries(db: AsyncSession):
+    """Récupère id, nom, points et version des points de chaque membre, du plus au moins de points, sans charger les relations."""
+    result = await db.execute(
+        select(FamilyMember.id, FamilyMember.name, FamilyMember.total_points, FamilyMember.points_version)
+        .order_by(FamilyMember.total_points.desc(), FamilyMember.name)
+    )
+    return result.all()
+
+async def get_tasks_for_member(db: AsyncSession, member_id: int):
+    result = await db.execute(
+        select(Task).options(selectinload(Task.completions)).filter(Task.assigned_to_id == member_id)
+    )
+    return result.scalars().all()
+
+async def get_task_by_id(db: AsyncSession, task_id: int):
+    result = await db.execute(
+        select(Task).options(selectinload(Task.completions)).filter(Task.id == task_id)
+    )
+    return result.scalars().first()
+
+async def get_all_task_rows(db: AsyncSession):
+    """Toutes les tâches, en projections de `_task_projections` (et non en objets `Task`)."""
+    return await _task_projections(db, select(*TASK_COLUMNS))
+
+async def get_task_rows_created_after(db: AsyncSession, created_after):
+    """Tâches créées depuis `created_after`, en projections de `_task_projections`."""
+    return await _task_projections(db, select(*TASK_COLUMNS).filter(Task.created_at >= created_after))
+
+async def get_tasks_page(
+    db: AsyncSession,
+    limit: int,
+    after: Optional[Tuple[datetime, int]] = None,
+    status: Optional[str] = None,
+    assigned_to_id: Optional[int] = None,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    completed_after: Optional[datetime] = None,
+    completed_before: Optional[datetime] = None,
+):
+    """
+    Récupère une page de tâches, des plus récentes aux plus anciennes (pagination par clé).
+
+    Args:
+        limit: Nombre maximal de tâches retournées.
+        after: Position (created_at, id) de la dernière tâche de la page précédente.
+
+    Returns:
+        Jusqu'à `limit + 1` tâches (projections de `_task_projections`) : la ligne supplémentaire
+        indique qu'une page suivante existe.
+    """
+    query = select(*TASK_COLUMNS)
+    if after is not None:
+        query = query.filter(tuple_(Task.created_at, Task.id) < tuple_(*after, types=[Task.created_at.type, Task.id.type]))
+    if status is not None:
+        query = query.filter(Task.status == status)
+    if assigned_to_id is not None:
+        query = query.filter(Task.assigned_to_id == assigned_to_id)
+    if created_after is not None:
+        query = query.filter(Task.created_at >= created_after)
+    if created_before is not None:
+        query = query.filter(Task.created_at < created_before)
+    if completed_after is not None:
+        query = query.filter(Task.completed_at >= completed_after)
+    if completed_before is not None:
+        query = query.filter(Task.completed_at < completed_before)
+    return await _task_projections(db, query.order_by(Task.created_at.desc(), Task.id.desc()).limit(limit + 1))
+
+async def get_task_rows_for_member_by_status(db: AsyncSession, member_id: int, status: str):
+    """Récupère les tâches d'un membre avec un statut spécifique (projections de `_task_projections`)."""
+    return await _task_projections(
+        db, select(*TASK_COLUMNS).filter(Task.assigned_to_id == member_id, Task.status == status)
+    )
+
+async def get_reward_rows(db: AsyncSession):
+    """Colonnes `REWARD_COLUMNS` de chaque récompense (et non des objets `Reward`)."""
+    result = await db.execute(select(*REWARD_COLUMNS))
+    return result.all()
+
+async def get_reward_by_id(db: AsyncSession, reward_id: int):
+    result = await db.execute(select(Reward).filter(Reward.id == reward_id))
+    return result.scalars().first()
+
+async def get_points_history_for_member(db: AsyncSession, member_id: int):
+    result = await db.execute(
+        select(PointsHistory)
+        .filter(PointsHistory.member_id == member_id)
+        .order_by(PointsHistory.timestamp.desc())
+    )
+    return result.scalars().all()
+
+async def get_points_history_page(db: AsyncSession, member_id: int, limit: int, after: Optional[Tuple[datetime, int]] = None):
+    """
+    Récupère une page de l'historique de points d'un membre, du plus récent au plus ancien.
+
+    Returns:
+        Jusqu'à `limit + 1` lignes : la ligne supplémentaire indique qu'une page suivante existe.
+    """
+    query = select(*POINTS_HISTORY_COLUMNS).filter(PointsHistory.member_id == member_id)
+    if after is not None:
+        query = query.filter(
+            tuple_(PointsHistory.timestamp, PointsHistory.id)
+            < tuple_(*after, types=[PointsHistory.timestamp.type, PointsHistory.id.type])
+        )
+    result = await db.execute(
+        query.order_by(PointsHistory.timestamp.desc(), PointsHistory.id.desc()).limit(limit + 1)
+    )
+    return result.all()
+
+POINTS_HISTORY_EXPORT_COLUMNS = (
+    "id", "member_id", "member_name", "points_change", "reason", "timestamp", "task_completion_id", "reward_id",
+)
+
+async def stream_points_history(db: AsyncSession, member_id: Optional[int] = None, batch_size: int = 1000):
+    """
+    Parcourt l'historique de points par lots, sans le charger entièrement en mémoire.
+
+    Args:
+        member_id: Limite l'export à un membre ; tout le foyer si None.
+        batch_size: Nombre de lignes lues à la fois depuis le curseur.
+
+    Yields:
+        Des listes d'au plus `batch_size` lignes, colonnes `POINTS_HISTORY_EXPORT_COLUMNS`.
+    """
+    query = (
+        select(
+            PointsHistory.id,
+            PointsHistory.member_id,
+            FamilyMember.name.label("member_name"),
+            PointsHistory.points_change,
+            PointsHistory.reason,
+            PointsHistory.timestamp,
+            PointsHistory.task_completion_id,
+            PointsHistory.reward_id,
+        )
+        .join(FamilyMember, FamilyMember.id == PointsHistory.member_id)
+    )
+    if member_id is not None:
+        # Parcours de l'index (member_id, timestamp) : pas de tri
+        query = query.filter(PointsHistory.member_id == member_id).order_by(PointsHistory.timestamp, PointsHistory.id)
+    else:
+        # Ordre d'insertion : pas de tri de toute la table
+        query = query.order_by(PointsHistory.id)
+    result = await db.stream(query.execution_options(yield_per=batch_size))
+    async for partition in result.partitions():
+        yield partition
+
+async def get_daily_points_for_member(db: AsyncSession, member_id: int, period: str):
+    """Calcule les points journaliers gagnés par un membre sur une période."""
+    start_date = get_period_start_date(period)
+    if start_date is None:
+        return []
+
+    result = await db.execute(
+        select(MemberDailyPoints.day, MemberDailyPoints.points_earned)
+        .filter(
+            MemberDailyPoints.member_id == member_id,
+            MemberDailyPoints.day >= start_date.date(),
+            MemberDailyPoints.points_earned > 0
+        )
+        .order_by(MemberDailyPoints.day)
+    )
+    return [{"date": str(day), "points": points_earned} for day, points_earned in result.all()]
+
+async def get_claimed_rewards_for_member(db: AsyncSession, member_id: int):
+    """Récupère l'historique des récompenses réclamées par un membre."""
+    result = await db.execute(
+        select(Reward.name, PointsHistory.timestamp)
+        .join(PointsHistory, Reward.id == PointsHistory.reward_id)
+        .filter(PointsHistory.member_id == member_id)
+        .order_by(PointsHistory.timestamp.desc())
+    )
+    return result.all()
+
+# Slideshow : les données de tous les héros en quelques requêtes, quel que soit leur nombre
+
+async def get_member_tasks_by_status(db: AsyncSession, status: str, per_member: Optional[int] = None) -> Dict[int, List[dict]]:
+    """
+    Tâches assignées ayant le statut `status`, groupées par membre.
+
+    Args:
+        per_member: Ne garde que les `per_member` tâches les plus récemment terminées de chaque membre.
+
+    Returns:
+        id du membre -> projections de `_task_projections`.
+    """
+    query = select(*TASK_COLUMNS).filter(Task.status == status, Task.assigned_to_id.isnot(None))
+    if per_member is None:
+        query = query.order_by(Task.assigned_to_id, Task.id)
+    else:
+        ranked = (
+            select(
+                Task.id,
+                func.row_number().over(
+                    partition_by=Task.assigned_to_id, order_by=(Task.completed_at.desc(), Task.id.desc())
+                ).label("position"),
+            )
+            .filter(Task.status == status, Task.assigned_to_id.isnot(None))
+            .subquery()
+        )
+        query = (
+            query.join(ranked, ranked.c.id == Task.id)
+            .filter(ranked.c.position <= per_member)
+            .order_by(Task.assigned_to_id, ranked.c.position)
+        )
+    tasks_by_member = defaultdict(list)
+    for task in await _task_projections(db, query):
+        tasks_by_member[task["assigned_to_id"]].append(task)
+    return tasks_by_member
+
+async def get_daily_points_by_member(db: AsyncSession, period: str) -> Dict[int, List[dict]]:
+    """Version groupée par membre de `get_daily_points_for_member`."""
+    start_date = get_period_start_date(period)
+    daily_points = defaultdict(list)
+    if start_date is None:
+        return daily_points
+
+    result = await db.execute(
+        select(MemberDailyPoints.member_id, MemberDailyPoints.day, MemberDailyPoints.points_earned)
+        .filter(MemberDailyPoints.day >= start_date.date(), MemberDailyPoints.points_earned > 0)
+        .order_by(MemberDailyPoints.member_id, MemberDailyPoints.day)
+    )
+    for member_id, day, points_earned in result.all():
+        daily_points[member_id].append({"date": str(day), "points": points_earned})
+    return daily_points
+
+async def get_claimed_rewards_by_member(db: AsyncSession, per_member: int) -> Dict[int, List[dict]]:
+    """Les `per_member` dernières récompenses réclamées par chaque membre, des plus récentes aux plus anciennes."""
+    ranked = (
+        select(
+            PointsHistory.member_id,
+            PointsHistory.reward_id,
+            PointsHistory.timestamp,
+            func.row_number().over(
+                partition_by=PointsHistory.member_id, order_by=(PointsHistory.timestamp.desc(), PointsHistory.id.desc())
+            ).label("position"),
+        )
+        .filter(PointsHistory.reward_id.isnot(None))
+        .subquery()
+    )
+    result = await db.execute(
+        select(ranked.c.member_id, Reward.name, ranked.c.timestamp)
+        .join(Reward, Reward.id == ranked.c.reward_id)
+        .filter(ranked.c.position <= per_member)
+        .order_by(ranked.c.member_id, ranked.c.position)
+    )
+    claimed_rewards = defaultdict(list)
+    for member_id, name, timestamp in result.all():
+        claimed_rewards[member_id].append({"name": name, "claimed_at": timestamp})
+    return claimed_rewards
+
+# Écritures : la logique métier reste dans `database`, exécutée via la session synchrone sous-jacente.
+
+async def _load_completions(db: AsyncSession, instance):
+    """Charge la relation `completions` pour que l'objet soit sérialisable hors de la session."""
+    if instance is not None:
+        await db.refresh(instance, attribute_names=["completions"])
+    return instance
+
+async def create_family_member(db: AsyncSession, name: str):
+    db_member = await db.run_sync(database.create_family_member, name)
+    return await _load_completions(db, db_member)
+
+async def update_family_member(db: AsyncSession, member_id: int, name: Optional[str] = None, total_points: Optional[int] = None):
+    db_member = await db.run_sync(database.update_family_member, member_id, name=name, total_points=total_points)
+    return await _load_completions(db, db_member)
+
+async def delete_family_member(db: AsyncSession, member_id: int):
+    return await db.run_sync(database.delete_family_member, member_id)
+
+async def create_task(db: AsyncSession, description: str, points: int, assigned_to_id: Optional[int] = None, duration_value: Optional[int] = None, duration_unit: Optional[str] = None):
+    db_task = await db.run_sync(database.create_task, description, points, assigned_to_id=assigned_to_id, duration_value=duration_value, duration_unit=duration_unit)
+    return await _load_completions(db, db_task)
+
+async def update_task(db: AsyncSession, task_id: int, description: Optional[str] = None, points: Optional[int] = None, assigned_to_id: Optional[int] = None, status: Optional[str] = None, duration_value: Optional[int] = None, duration_unit: Optional[str] = None):
+    db_task = await db.run_sync(database.update_task, task_id, description=description, points=points, assigned_to_id=assigned_to_id, status=status, duration_value=duration_value, duration_unit=duration_unit)
+    return await _load_completions(db, db_task)
+
+async def delete_task(db: AsyncSession, task_id: int):
+    return await db.run_sync(database.delete_task, task_id)
+
+async def complete_task(db: AsyncSession, task_id: int, completions: List[schemas.TaskCompletionData]):
+    db_task = await db.run_sync(database.complete_task, task_id, completions)
+    return await _load_completions(db, db_task)
+
+async def create_reward(db: AsyncSession, name: str, cost: int, description: Optional[str] = None):
+    return await db.run_sync(database.create_reward, name, cost, description=description)
+
+async def update_reward(db: AsyncSession, reward_id: int, name: Optional[str] = None, cost: Optional[int] = None, description: Optional[str] = None):
+    return await db.run_sync(database.update_reward, reward_id, name=name, cost=cost, description=description)
+
+async def delete_reward(db: AsyncSession, reward_id: int):
+    return await db.run_sync(database.delete_reward, reward_id)
+
+async def claim_reward(db: AsyncSession, member_id: int, reward_id: int):
+    db_member = await db.run_sync(database.claim_reward, member_id, reward_id)
+    return await _load_completions(db, db_member)
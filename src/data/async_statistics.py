@@ -0,0 +1,57 @@
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.core.models import PointsHistory, FamilyMember, Reward, MemberDailyPoints
+from src.data.database import get_period_start_date
+
+async def get_points_by_user_per_period(db: AsyncSession, period: str):
+    """
+    Version asynchrone de `statistics.get_points_by_user_per_period`.
+
+    Args:
+        db: La session de base de données asynchrone.
+        period: La période pour laquelle calculer les statistiques ('weekly' ou 'monthly').
+
+    Returns:
+        Une liste de dictionnaires contenant le nom du membre et le total des points gagnés.
+    """
+    start_date = get_period_start_date(period)
+    if start_date is None:
+        return []
+
+    result = await db.execute(
+        select(
+            FamilyMember.name,
+            func.sum(MemberDailyPoints.points_earned).label('total_points')
+        )
+        .join(MemberDailyPoints, FamilyMember.id == MemberDailyPoints.member_id)
+        .filter(
+            MemberDailyPoints.day >= start_date.date(),
+            MemberDailyPoints.points_earned > 0  # On ne compte que les points gagnés
+        )
+        .group_by(FamilyMember.name)
+        .order_by(func.sum(MemberDailyPoints.points_earned).desc())
+    )
+
+    return [{"name": name, "points": total_points} for name, total_points in result.all()]
+
+async def get_most_used_rewards(db: AsyncSession):
+    """
+    Version asynchrone de `statistics.get_most_used_rewards`.
+
+    Args:
+        db: La session de base de données asynchrone.
+
+    Returns:
+        Une liste de dictionnaires contenant le nom de la récompense et le nombre de fois où elle a été réclamée.
+    """
+    result = await db.execute(
+        select(
+            Reward.name,
+            func.count(PointsHistory.id).label('times_claimed')
+        )
+        .join(PointsHistory, Reward.id == PointsHistory.reward_id)
+        .group_by(Reward.name)
+        .order_by(func.count(PointsHistory.id).desc())
+    )
+
+    return [{"name": name, "count": times_claimed} for name, times_claimed in result.all()]
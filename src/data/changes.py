@@ -0,0 +1,75 @@
+import threading
+from collections import defaultdict
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from typing import Any, Callable, Dict, Iterable, List, Set, Tuple
+
+# Étiquettes invalidées lorsqu'une table est modifiée
+TABLE_TAGS = {
+    "family_members": ("members",),
+    "tasks": ("tasks",),
+    "task_completions": ("tasks", "members"),
+    "rewards": ("rewards",),
+    "points_history": ("points_history",),
+    "member_daily_points": ("points_history",),
+}
+
+_commit_listeners: List[Callable[[Set[str]], None]] = []
+_event_listeners: List[Callable[[Dict[str, Any]], None]] = []
+_versions: Dict[str, int] = defaultdict(int)
+_versions_lock = threading.Lock()
+
+def on_commit(listener: Callable[[Set[str]], None]):
+    """Enregistre une fonction appelée avec les étiquettes modifiées après chaque commit."""
+    _commit_listeners.append(listener)
+    return listener
+
+def on_event(listener: Callable[[Dict[str, Any]], None]):
+    """Enregistre une fonction appelée pour chaque événement métier, une fois la transaction validée."""
+    _event_listeners.append(listener)
+    return listener
+
+def mark_changed(db: Session, *tags: str):
+    """Signale des étiquettes modifiées par une requête hors ORM (UPDATE/DELETE en masse)."""
+    db.info.setdefault("changed_tags", set()).update(tags)
+
+def queue_event(db: Session, event_type: str, **data: Any):
+    """Prépare un événement métier, publié seulement si la transaction en cours est validée."""
+    db.info.setdefault("pending_events", []).append({"type": event_type, **data})
+
+def versions(tags: Iterable[str]) -> Tuple[int, ...]:
+    """Compteurs de version des étiquettes, incrémentés après chaque commit qui les modifie."""
+    with _versions_lock:
+        return tuple(_versions[tag] for tag in tags)
+
+def _tags_for(objects: Iterable) -> Set[str]:
+    tags: Set[str] = set()
+    for obj in objects:
+        table = getattr(obj, "__tablename__", None)
+        tags.update(TABLE_TAGS.get(table, ()))
+    return tags
+
+@event.listens_for(Session, "after_flush")
+def _collect_changed_tags(session, flush_context):
+    tags = _tags_for(session.new) | _tags_for(session.dirty) | _tags_for(session.deleted)
+    if tags:
+        mark_changed(session, *tags)
+
+@event.listens_for(Session, "after_commit")
+def _notify_commit(session):
+    tags = session.info.pop("changed_tags", None)
+    if tags:
+        for listener in _commit_listeners:
+            listener(tags)
+        # Incrémentées après l'invalidation du cache : une version lue ne désigne jamais un contenu périmé
+        with _versions_lock:
+            for tag in tags:
+                _versions[tag] += 1
+    for pending_event in session.info.pop("pending_events", ()):
+        for event_listener in _event_listeners:
+            event_listener(pending_event)
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changes(session):
+    session.info.pop("changed_tags", None)
+    session.info.pop("pending_events", None)
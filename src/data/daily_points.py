@@ -0,0 +1,84 @@
+from collections import defaultdict
+from sqlalchemy import case, delete, event, func, insert, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+from src.core.models import MemberDailyPoints, PointsHistory
+from datetime import datetime, UTC
+
+def _day_of(timestamp: datetime):
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(UTC)
+    return timestamp.date()
+
+def record_points_changes(db: Session, changes):
+    """
+    Reporte des mouvements de points dans l'agrégat `member_daily_points`.
+
+    Args:
+        db: La session de base de données (l'écriture a lieu dans sa transaction courante).
+        changes: Des tuples (member_id, timestamp, points_change).
+    """
+    totals: dict = defaultdict(lambda: [0, 0])
+    for member_id, timestamp, points_change in changes:
+        entry = totals[(member_id, _day_of(timestamp))]
+        if points_change > 0:
+            entry[0] += points_change
+        else:
+            entry[1] -= points_change
+
+    for (member_id, day), (earned, spent) in totals.items():
+        statement = sqlite_insert(MemberDailyPoints).values(
+            member_id=member_id, day=day, points_earned=earned, points_spent=spent
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=[MemberDailyPoints.member_id, MemberDailyPoints.day],
+            set_={
+                "points_earned": MemberDailyPoints.points_earned + statement.excluded.points_earned,
+                "points_spent": MemberDailyPoints.points_spent + statement.excluded.points_spent,
+            },
+        )
+        db.execute(statement)
+
+@event.listens_for(Session, "after_flush")
+def _update_daily_points_after_flush(session, flush_context):
+    """Maintient l'agrégat pour chaque ligne de `points_history` insérée, dans la même transaction."""
+    changes = [
+        (obj.member_id, obj.timestamp, obj.points_change)
+        for obj in session.new
+        if isinstance(obj, PointsHistory)
+    ]
+    if changes:
+        record_points_changes(session, changes)
+
+def rebuild_member_daily_points(db: Session) -> int:
+    """
+    Reconstruit entièrement `member_daily_points` à partir de `points_history`.
+
+    Returns:
+        Le nombre de lignes (membre, jour) de l'agrégat.
+    """
+    day = func.date(PointsHistory.timestamp)
+    aggregated = (
+        select(
+            PointsHistory.member_id,
+            day,
+            func.sum(case((PointsHistory.points_change > 0, PointsHistory.points_change), else_=0)),
+            func.sum(case((PointsHistory.points_change < 0, -PointsHistory.points_change), else_=0)),
+        )
+        .group_by(PointsHistory.member_id, day)
+    )
+    db.execute(delete(MemberDailyPoints))
+    db.execute(
+        insert(MemberDailyPoints).from_select(
+            ["member_id", "day", "points_earned", "points_spent"], aggregated
+        )
+    )
+    db.commit()
+    return db.query(func.count()).select_from(MemberDailyPoints).scalar()
+
+if __name__ == "__main__":
+    from src.data.jobs import for_each_household
+
+    # Base unique, ou chacune des bases des foyers
+    rows = for_each_household(rebuild_member_daily_points)
+    print(f"member_daily_points reconstruit : {rows} lignes")
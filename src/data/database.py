@@ -1,36 +1,169 @@
-from sqlalchemy import create_engine, func
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy import bindparam, create_engine, event, insert, select, update
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import sessionmaker, Session, selectinload
 from src.core import schemas
-from src.core.models import FamilyMember, Task, Reward, PointsHistory, TaskCompletion
+from src.core.config import settings
+from src.core.metrics import current_request_stats, registry
+from src.core.models import FamilyMember, Task, Reward, PointsHistory, TaskCompletion, MemberDailyPoints
+from src.data import daily_points  # maintient aussi member_daily_points à chaque flush
+from src.data.changes import mark_changed, queue_event
+from src.data.households import HouseholdRegistry, current_household, households_enabled
 from datetime import datetime, UTC, timedelta
-from typing import Optional, List
+from typing import Iterable, Optional, List
+import time
 
 def get_tasks_created_after(db: Session, created_after):
-    return db.query(Task).filter(Task.created_at >= created_after).all()
+    return (
+        db.query(Task)
+        .options(selectinload(Task.completions))
+        .filter(Task.created_at >= created_after)
+        .all()
+    )
 
-SQLALCHEMY_DATABASE_URL = "sqlite:///./db/heros_du_foyer.db"
+SQLALCHEMY_DATABASE_URL = settings.database_url
 
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
-)
+def apply_sqlite_pragmas(dbapi_connection, connection_record):
+    """Applique les pragmas configurés à chaque nouvelle connexion SQLite."""
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute(f"PRAGMA journal_mode={settings.sqlite_journal_mode}")
+        cursor.execute(f"PRAGMA synchronous={settings.sqlite_synchronous}")
+        cursor.execute(f"PRAGMA mmap_size={settings.sqlite_mmap_size:d}")
+        cursor.execute(f"PRAGMA cache_size={settings.sqlite_cache_size:d}")
+        cursor.execute(f"PRAGMA busy_timeout={settings.sqlite_busy_timeout:d}")
+    finally:
+        cursor.close()
+
+def apply_sqlite_read_only_pragmas(dbapi_connection, connection_record):
+    """
+    Pragmas des connexions en lecture seule : pas de journal_mode ni de synchronous (propres
+    aux écritures), et query_only en garde-fou.
+    """
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute("PRAGMA query_only=ON")
+        cursor.execute(f"PRAGMA mmap_size={settings.sqlite_mmap_size:d}")
+        cursor.execute(f"PRAGMA cache_size={settings.sqlite_cache_size:d}")
+        cursor.execute(f"PRAGMA busy_timeout={settings.sqlite_busy_timeout:d}")
+    finally:
+        cursor.close()
+
+def is_file_database(url: str) -> bool:
+    return make_url(url).database not in (None, "", ":memory:")
+
+def read_only_url(url: str) -> str:
+    """URI SQLite `mode=ro` d'une base fichier : la connexion ne peut ni écrire ni prendre le verrou d'écriture."""
+    parsed = make_url(url)
+    database = parsed.database if parsed.database.startswith("file:") else f"file:{parsed.database}"
+    return parsed.set(database=database, query={**parsed.query, "mode": "ro", "uri": "true"}).render_as_string(hide_password=False)
+
+sql_queries_total = registry.counter("db_queries_total", "SQL statements executed, HTTP requests and background jobs alike.")
+sql_query_duration = registry.histogram("db_query_duration_seconds", "Execution time of SQL statements.")
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_started_at"].pop()
+    sql_queries_total.inc()
+    sql_query_duration.observe(elapsed)
+    stats = current_request_stats.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.sql_seconds += elapsed
+
+def _discard_failed_query(exception_context):
+    # Requête en erreur : after_cursor_execute ne sera pas appelé
+    connection = exception_context.connection
+    if connection is not None and connection.info.get("query_started_at"):
+        connection.info["query_started_at"].pop()
+
+def instrument_engine(target):
+    """Mesure le nombre et la durée des requêtes SQL d'un moteur, globalement et par requête HTTP."""
+    event.listen(target, "before_cursor_execute", _before_cursor_execute)
+    event.listen(target, "after_cursor_execute", _after_cursor_execute)
+    event.listen(target, "handle_error", _discard_failed_query)
+
+def create_sqlite_engine(url: str, read_only: bool = False):
+    """
+    Crée un moteur SQLite configuré selon `settings` (pool et pragmas).
+
+    Avec `read_only`, les connexions sont ouvertes en `mode=ro` (base fichier uniquement).
+    """
+    if read_only:
+        url = read_only_url(url)
+    pool_options = {}
+    if is_file_database(url):
+        pool_options = {
+            "pool_size": settings.db_pool_size,
+            "max_overflow": settings.db_max_overflow,
+            "pool_timeout": settings.db_pool_timeout,
+        }
+    sqlite_engine = create_engine(
+        url,
+        connect_args={"check_same_thread": False, "timeout": settings.sqlite_busy_timeout / 1000},
+        **pool_options,
+    )
+    event.listen(sqlite_engine, "connect", apply_sqlite_read_only_pragmas if read_only else apply_sqlite_pragmas)
+    instrument_engine(sqlite_engine)
+    return sqlite_engine
+
+def read_only_sessions_enabled(url: str) -> bool:
+    # Une base en mémoire n'existe que dans sa connexion : pas de lecteur séparé possible
+    return settings.read_only_sessions and is_file_database(url)
+
+engine = create_sqlite_engine(SQLALCHEMY_DATABASE_URL)
+# Lectures (routes GET) : connexions `mode=ro` distinctes, qui ne passent jamais derrière
+# une transaction d'écriture (en WAL, un lecteur voit le dernier état validé)
+read_engine = create_sqlite_engine(SQLALCHEMY_DATABASE_URL, read_only=True) if read_only_sessions_enabled(SQLALCHEMY_DATABASE_URL) else engine
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+household_engines = HouseholdRegistry(create_sqlite_engine, max_open=settings.households_max_open)
+household_read_engines = (
+    HouseholdRegistry(lambda url: create_sqlite_engine(url, read_only=True), max_open=settings.households_max_open)
+    if settings.read_only_sessions else household_engines
+)
+
+def engine_for(household: str, read_only: bool = False):
+    """Moteur de la base d'un foyer ; la base unique si le multi-foyer est désactivé."""
+    if households_enabled():
+        return (household_read_engines if read_only else household_engines).get(household)
+    return read_engine if read_only else engine
 
 def get_db():
-    db = SessionLocal()
+    db = SessionLocal(bind=engine_for(current_household.get()))
+    try:
+        yield db
+    finally:
+        db.close()
+
+def get_read_db():
+    """Session en lecture seule, pour les routes qui n'écrivent pas."""
+    db = SessionLocal(bind=engine_for(current_household.get(), read_only=True))
     try:
         yield db
     finally:
         db.close()
 
 def get_family_members(db: Session):
-    return db.query(FamilyMember).order_by(FamilyMember.total_points.desc()).all()
+    return (
+        db.query(FamilyMember)
+        .options(selectinload(FamilyMember.completions))
+        .order_by(FamilyMember.total_points.desc())
+        .all()
+    )
+
+def get_member_summaries(db: Session):
+    """Récupère id, nom, points et version des points de chaque membre, sans charger les relations."""
+    return db.query(FamilyMember.id, FamilyMember.name, FamilyMember.total_points, FamilyMember.points_version).all()
 
 def get_family_member_by_id(db: Session, member_id: int):
     return db.query(FamilyMember).filter(FamilyMember.id == member_id).first()
 
 def create_family_member(db: Session, name: str):
-    db_member = FamilyMember(name=name)
+    db_member = FamilyMember(name=name, total_points=0)
     db.add(db_member)
+    db.flush()
+    queue_event(db, "member.created", member_id=db_member.id, name=name, total_points=0)
     db.commit()
     db.refresh(db_member)
     return db_member
@@ -38,10 +171,14 @@ def create_family_member(db: Session, name: str):
 def update_family_member(db: Session, member_id: int, name: Optional[str] = None, total_points: Optional[int] = None):
     db_member = db.query(FamilyMember).filter(FamilyMember.id == member_id).first()
     if db_member:
-        if name is not None:
+        if name is not None and name != db_member.name:
             db_member.name = name
+            queue_event(db, "member.renamed", member_id=member_id, name=name)
         if total_points is not None:
             db_member.total_points = total_points # type: ignore
+            db_member.points_version = FamilyMember.points_version + 1 # type: ignore
+            db.flush()
+            queue_event(db, "member.points", member_id=member_id, total_points=total_points, version=db_member.points_version)
         db.commit()
         db.refresh(db_member)
     return db_member
@@ -50,6 +187,7 @@ def delete_family_member(db: Session, member_id: int):
     db_member = db.query(FamilyMember).filter(FamilyMember.id == member_id).first()
     if db_member:
         db.delete(db_member)
+        queue_event(db, "member.deleted", member_id=member_id)
         db.commit()
         return True
     return False
@@ -70,12 +208,25 @@ def calculate_expiration_time(created_at: datetime, duration_value: int, duratio
     else:
         raise ValueError("Invalid duration unit")
 
+DURATION_UNITS = ("days", "weeks", "months")
+
+def as_utc(value: datetime) -> datetime:
+    # SQLite restitue des dates naïves, enregistrées en UTC
+    return value.replace(tzinfo=UTC) if value.tzinfo is None else value
+
+def task_expires_at(created_at: datetime, duration_value: Optional[int], duration_unit: Optional[str]) -> Optional[datetime]:
+    """Échéance d'une tâche (colonne `expires_at`), ou None si elle n'a pas de durée."""
+    if duration_value is None or duration_unit is None:
+        return None
+    return calculate_expiration_time(as_utc(created_at), duration_value, duration_unit)
+
 def is_task_expired(task: Task) -> bool:
-    if task.duration_value is None or task.duration_unit is None:
+    expires_at = task.expires_at
+    if expires_at is None:
+        expires_at = task_expires_at(task.created_at, task.duration_value, task.duration_unit)
+    if expires_at is None:
         return False
-    
-    expiration_time = calculate_expiration_time(task.created_at, task.duration_value, task.duration_unit)
-    return datetime.now(UTC) > expiration_time
+    return datetime.now(UTC) > as_utc(expires_at)
 
 def update_task(db: Session, task_id: int, description: Optional[str] = None, points: Optional[int] = None, assigned_to_id: Optional[int] = None, status: Optional[str] = None, duration_value: Optional[int] = None, duration_unit: Optional[str] = None):
     db_task = db.query(Task).filter(Task.id == task_id).first()
@@ -92,6 +243,9 @@ def update_task(db: Session, task_id: int, description: Optional[str] = None, po
             db_task.duration_value = duration_value # type: ignore
         if duration_unit is not None:
             db_task.duration_unit = duration_unit # type: ignore
+        if duration_value is not None or duration_unit is not None:
+            db_task.expires_at = task_expires_at(db_task.created_at, db_task.duration_value, db_task.duration_unit) # type: ignore
+        queue_event(db, "task.updated", task=task_event_payload(db_task))
         db.commit()
         db.refresh(db_task)
     return db_task
@@ -101,13 +255,15 @@ def delete_task(db: Session, task_id: int):
     if db_task:
         # Delete associated TaskCompletion records first
         db.query(TaskCompletion).filter(TaskCompletion.task_id == task_id).delete(synchronize_session=False)
+        mark_changed(db, "tasks", "members")
         db.delete(db_task)
+        queue_event(db, "task.deleted", task_id=task_id)
         db.commit()
         return True
     return False
 
 def get_all_tasks(db: Session):
-    return db.query(Task).all()
+    return db.query(Task).options(selectinload(Task.completions)).all()
 
 def get_rewards(db: Session):
     return db.query(Reward).all()
@@ -124,6 +280,7 @@ def update_reward(db: Session, reward_id: int, name: Optional[str] = None, cost:
             db_reward.cost = cost # type: ignore
         if description is not None:
             db_reward.description = description
+        queue_event(db, "reward.updated", reward=reward_event_payload(db_reward))
         db.commit()
         db.refresh(db_reward)
     return db_reward
@@ -132,121 +289,492 @@ def delete_reward(db: Session, reward_id: int):
     db_reward = db.query(Reward).filter(Reward.id == reward_id).first()
     if db_reward:
         db.delete(db_reward)
+        queue_event(db, "reward.deleted", reward_id=reward_id)
         db.commit()
         return True
     return False
 
 def create_task(db: Session, description: str, points: int, assigned_to_id: Optional[int] = None, duration_value: Optional[int] = None, duration_unit: Optional[str] = None):
-    db_task = Task(description=description, points=points, assigned_to_id=assigned_to_id, duration_value=duration_value, duration_unit=duration_unit)
+    created_at = datetime.now(UTC)
+    db_task = Task(
+        description=description,
+        points=points,
+        assigned_to_id=assigned_to_id,
+        duration_value=duration_value,
+        duration_unit=duration_unit,
+        created_at=created_at,
+        expires_at=task_expires_at(created_at, duration_value, duration_unit),
+    )
     db.add(db_task)
+    db.flush()
+    queue_event(db, "task.created", task=task_event_payload(db_task))
     db.commit()
     db.refresh(db_task)
     return db_task
 
+def task_event_payload(task: Task) -> dict:
+    """Représentation compacte d'une tâche pour les événements de changement."""
+    return {
+        "id": task.id,
+        "description": task.description,
+        "points": task.points,
+        "assigned_to_id": task.assigned_to_id,
+        "status": task.status,
+        "created_at": task.created_at,
+        "completed_at": task.completed_at,
+        "duration_value": task.duration_value,
+        "duration_unit": task.duration_unit,
+        "expires_at": task.expires_at,
+    }
+
+def reward_event_payload(reward: Reward) -> dict:
+    """Représentation d'une récompense pour les événements de changement."""
+    return {"id": reward.id, "name": reward.name, "cost": reward.cost, "description": reward.description}
+
 def create_reward(db: Session, name: str, cost: int, description: Optional[str] = None):
     db_reward = Reward(name=name, cost=cost, description=description)
     db.add(db_reward)
+    db.flush()
+    queue_event(db, "reward.created", reward=reward_event_payload(db_reward))
     db.commit()
     db.refresh(db_reward)
     return db_reward
 
+def begin_immediate(db: Session):
+    """
+    Ouvre la transaction de la session en mode IMMEDIATE (SQLite).
+
+    Le verrou d'écriture est pris dès le début : les lectures qui précèdent l'écriture ne
+    peuvent plus être invalidées par un autre écrivain, et les écrivains concurrents
+    attendent (busy_timeout) au lieu d'échouer en milieu de transaction.
+    Sans effet hors SQLite ou si une transaction d'écriture est déjà ouverte.
+    """
+    connection = db.connection()
+    if connection.dialect.name != "sqlite":
+        return
+    # Connexion du pilote (sqlite3, ou aiosqlite sous l'adaptateur asynchrone de SQLAlchemy)
+    driver_connection = connection.connection.driver_connection
+    if getattr(driver_connection, "in_transaction", True):
+        return
+    connection.exec_driver_sql("BEGIN IMMEDIATE")
+
+def apply_points_deltas(db: Session, deltas: dict) -> dict:
+    """
+    Ajoute des variations de points aux membres par UPDATE incrémental (`total_points + :delta`).
+
+    Args:
+        db: La session de base de données (l'écriture a lieu dans sa transaction courante).
+        deltas: Variation de points par id de membre.
+
+    Returns:
+        Le nouveau total de points et sa version (`points_version`) par id de membre.
+    """
+    if not deltas:
+        return {}
+    members_table = FamilyMember.__table__
+    db.execute(
+        update(members_table)
+        .where(members_table.c.id == bindparam("member_id"))
+        .values(
+            total_points=members_table.c.total_points + bindparam("delta"),
+            points_version=members_table.c.points_version + 1,
+        ),
+        [{"member_id": member_id, "delta": delta} for member_id, delta in deltas.items()],
+    )
+    totals = {}
+    for chunk in _chunked(list(deltas)):
+        totals.update(
+            (member_id, (total_points, version))
+            for member_id, total_points, version in db.execute(
+                select(FamilyMember.id, FamilyMember.total_points, FamilyMember.points_version).where(FamilyMember.id.in_(chunk))
+            )
+        )
+    mark_changed(db, "members")
+    return totals
+
 def complete_task(db: Session, task_id: int, completions: List[schemas.TaskCompletionData]):
+    begin_immediate(db)
     task = db.query(Task).filter(Task.id == task_id).first()
-    if not task or task.status != 'pending':
-        return None
-
-    if is_task_expired(task):
+    if not task or task.status != 'pending' or is_task_expired(task):
+        db.rollback()
         return None
 
     total_percentage = sum(c.percentage for c in completions)
     if total_percentage != 100:
+        db.rollback()
         raise ValueError("Total percentage must be 100")
 
-    members_to_update = []
-    for completion_data in completions:
-        member = db.query(FamilyMember).filter(FamilyMember.id == completion_data.member_id).first()
-        if member:
-            points_to_add = int(task.points * (completion_data.percentage / 100))
-            
-            completion = TaskCompletion(task_id=task.id, member_id=member.id)
-            db.add(completion)
-            
-            member.total_points += points_to_add
-            
-            points_history = PointsHistory(
-                member_id=member.id,
-                points_change=points_to_add,
-                reason=f"Task '{task.description}' completed"
-            )
-            points_history.completion = completion
-            db.add(points_history)
-            members_to_update.append(member)
+    known_members = _existing_member_ids(db, (c.member_id for c in completions))
+    shares = [
+        (c.member_id, int(task.points * (c.percentage / 100)))
+        for c in completions
+        if c.member_id in known_members
+    ]
+    if not shares:
+        db.rollback()
+        return None
 
-    if not members_to_update:
+    # Passage conditionnel à 'completed' : une même tâche ne peut pas être validée deux fois
+    now = datetime.now(UTC)
+    claimed = db.execute(
+        update(Task)
+        .where(Task.id == task.id, Task.status == 'pending')
+        .values(status='completed', completed_at=now)
+        .execution_options(synchronize_session=False)
+    )
+    if claimed.rowcount != 1:
+        db.rollback()
         return None
+    mark_changed(db, "tasks")
+
+    deltas: dict = {}
+    for member_id, points in shares:
+        completion = TaskCompletion(task_id=task.id, member_id=member_id, completed_at=now)
+        points_history = PointsHistory(
+            member_id=member_id,
+            points_change=points,
+            reason=f"Task '{task.description}' completed",
+            timestamp=now
+        )
+        points_history.completion = completion
+        db.add_all([completion, points_history])
+        deltas[member_id] = deltas.get(member_id, 0) + points
+    db.flush()
+    totals = apply_points_deltas(db, deltas)
 
-    task.status = 'completed'
-    task.completed_at = datetime.now(UTC)
+    queue_event(db, "task.completed", task_id=task.id, completed_at=now,
+                completions=[{"member_id": member_id, "points": points} for member_id, points in shares])
+    for member_id, (total_points, version) in totals.items():
+        queue_event(db, "member.points", member_id=member_id, total_points=total_points, version=version)
 
     db.commit()
-
     db.refresh(task)
-    for member in members_to_update:
-        db.refresh(member)
-
     return task
 
 def claim_reward(db: Session, member_id: int, reward_id: int):
-    member = db.query(FamilyMember).filter(FamilyMember.id == member_id).first()
+    begin_immediate(db)
     reward = db.query(Reward).filter(Reward.id == reward_id).first()
-    if member and reward and member.total_points >= reward.cost:
-        member.total_points -= reward.cost # type: ignore
-        points_history = PointsHistory(
-            member_id=member.id,
-            reward_id=reward.id,
-            points_change=-reward.cost,
-            reason=f"Reward '{reward.name}' claimed"
+    if reward is None:
+        db.rollback()
+        return None
+
+    # Débit conditionnel : des réclamations concurrentes ne peuvent pas dépasser le solde
+    debited = db.execute(
+        update(FamilyMember)
+        .where(FamilyMember.id == member_id, FamilyMember.total_points >= reward.cost)
+        .values(total_points=FamilyMember.total_points - reward.cost, points_version=FamilyMember.points_version + 1)
+        .returning(FamilyMember.total_points, FamilyMember.points_version)
+        .execution_options(synchronize_session=False)
+    ).first()
+    if debited is None:
+        db.rollback()
+        return None
+    mark_changed(db, "members")
+
+    points_history = PointsHistory(
+        member_id=member_id,
+        reward_id=reward.id,
+        points_change=-reward.cost,
+        reason=f"Reward '{reward.name}' claimed"
+    )
+    db.add(points_history)
+    queue_event(db, "reward.claimed", member_id=member_id, reward_id=reward.id, cost=reward.cost)
+    queue_event(db, "member.points", member_id=member_id, total_points=debited.total_points, version=debited.points_version)
+    db.commit()
+    return db.get(FamilyMember, member_id, populate_existing=True)
+
+# Écritures en masse
+
+BULK_CHUNK_SIZE = 500
+# Erreur des éléments qui répètent le task_id d'un élément précédent (seul le premier est appliqué)
+DUPLICATE_TASK_ID = "Duplicate task_id in request"
+
+def _chunked(values: list, size: int = BULK_CHUNK_SIZE):
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+def _existing_member_ids(db: Session, member_ids: Iterable[int]) -> set:
+    member_ids = list(set(member_ids))
+    existing = set()
+    for chunk in _chunked(member_ids):
+        existing.update(db.execute(select(FamilyMember.id).where(FamilyMember.id.in_(chunk))).scalars())
+    return existing
+
+def _insert_returning_ids(db: Session, model, rows: List[dict], key_columns: List[str]) -> List[int]:
+    """
+    INSERT multi-lignes retournant les ids dans l'ordre de `rows`.
+
+    SQLite ne garantit pas l'ordre de RETURNING (et SQLAlchemy repasse à une requête par
+    ligne si on l'exige) : les ids sont réassociés aux lignes par leur contenu. Deux lignes
+    de même contenu sont interchangeables.
+    """
+    columns = [getattr(model, name) for name in key_columns]
+    ids_by_key: dict = {}
+    for row in db.execute(insert(model).returning(model.id, *columns), rows):
+        ids_by_key.setdefault(tuple(row[1:]), []).append(row[0])
+    return [ids_by_key[tuple(row[name] for name in key_columns)].pop() for row in rows]
+
+def _bulk_result(results: List[dict]) -> dict:
+    failed = sum(1 for result in results if result["status"] == "error")
+    return {"succeeded": len(results) - failed, "failed": failed, "results": results}
+
+def create_tasks_bulk(db: Session, tasks: List[schemas.TaskCreate]) -> dict:
+    """
+    Crée plusieurs tâches en une seule transaction.
+
+    Tous les éléments sont validés avant la moindre écriture ; les éléments valides sont
+    insérés par un INSERT multi-lignes, les autres sont rapportés en erreur.
+
+    Returns:
+        Un dictionnaire {succeeded, failed, results} avec un résultat par élément, dans l'ordre.
+    """
+    known_members = _existing_member_ids(db, (t.assigned_to_id for t in tasks if t.assigned_to_id is not None))
+
+    now = datetime.now(UTC)
+    results: List[dict] = []
+    rows = []
+    for index, task in enumerate(tasks):
+        error = None
+        if task.assigned_to_id is not None and task.assigned_to_id not in known_members:
+            error = "Member not found"
+        elif (task.duration_value is None) != (task.duration_unit is None):
+            error = "duration_value and duration_unit must be provided together"
+        elif task.duration_unit is not None and task.duration_unit not in DURATION_UNITS:
+            error = "Invalid duration unit"
+        results.append({"index": index, "task_id": None, "status": "error" if error else "created", "error": error})
+        if error is None:
+            rows.append({
+                "description": task.description,
+                "points": task.points,
+                "assigned_to_id": task.assigned_to_id,
+                "duration_value": task.duration_value,
+                "duration_unit": task.duration_unit,
+                "status": "pending",
+                "created_at": now,
+                "expires_at": task_expires_at(now, task.duration_value, task.duration_unit),
+            })
+
+    if rows:
+        created = _insert_returning_ids(db, Task, rows, ["description", "points", "assigned_to_id", "duration_value", "duration_unit"])
+        created_results = (result for result in results if result["status"] == "created")
+        for task_id, row, result in zip(created, rows, created_results):
+            result["task_id"] = task_id
+            queue_event(db, "task.created", task={"id": task_id, "completed_at": None, **row})
+        mark_changed(db, "tasks")
+        db.commit()
+    return _bulk_result(results)
+
+# Champs modifiables par update_tasks_bulk ; le statut ne change que par complete_tasks_bulk
+BULK_UPDATE_FIELDS = ("description", "points", "assigned_to_id", "duration_value", "duration_unit")
+
+def update_tasks_bulk(db: Session, items: List[schemas.TaskBulkUpdateItem]) -> dict:
+    """
+    Modifie plusieurs tâches en une seule transaction.
+
+    Tous les éléments sont validés avant la moindre écriture, contre les tâches et les
+    membres chargés en quelques requêtes groupées ; les tâches valides sont écrites par un
+    seul UPDATE exécuté sur toutes les lignes (executemany).
+
+    Returns:
+        Un dictionnaire {succeeded, failed, results} avec un résultat par élément, dans l'ordre.
+    """
+    task_ids = list({item.task_id for item in items})
+    tasks = {}
+    for chunk in _chunked(task_ids):
+        tasks.update((task.id, task) for task in db.execute(select(Task).where(Task.id.in_(chunk))).scalars())
+    known_members = _existing_member_ids(db, (item.assigned_to_id for item in items if item.assigned_to_id is not None))
+
+    results: List[dict] = []
+    rows = []
+    seen_tasks = set()
+    for index, item in enumerate(items):
+        task = tasks.get(item.task_id)
+        changes = item.model_dump(include=set(BULK_UPDATE_FIELDS), exclude_none=True)
+        values = {field: changes.get(field, getattr(task, field, None)) for field in BULK_UPDATE_FIELDS}
+        error = None
+        if item.task_id in seen_tasks:
+            error = DUPLICATE_TASK_ID
+        elif task is None:
+            error = "Task not found"
+        elif item.assigned_to_id is not None and item.assigned_to_id not in known_members:
+            error = "Member not found"
+        elif (values["duration_value"] is None) != (values["duration_unit"] is None):
+            error = "duration_value and duration_unit must be provided together"
+        elif values["duration_unit"] is not None and values["duration_unit"] not in DURATION_UNITS:
+            error = "Invalid duration unit"
+        seen_tasks.add(item.task_id)
+        results.append({"index": index, "task_id": item.task_id, "status": "error" if error else "updated", "error": error})
+        if error is None:
+            values["expires_at"] = task_expires_at(task.created_at, values["duration_value"], values["duration_unit"])
+            rows.append((task, values))
+
+    if rows:
+        statement = (
+            update(Task.__table__)
+            .where(Task.__table__.c.id == bindparam("task_id"))
+            .values({field: bindparam(field) for field in (*BULK_UPDATE_FIELDS, "expires_at")})
         )
-        db.add(points_history)
+        for chunk in _chunked([{"task_id": task.id, **values} for task, values in rows]):
+            db.execute(statement, chunk)
+        for task, values in rows:
+            queue_event(db, "task.updated", task={**task_event_payload(task), **values})
+        mark_changed(db, "tasks")
         db.commit()
-        db.refresh(member)
-        return member
-    return None
+    return _bulk_result(results)
+
+def complete_tasks_bulk(db: Session, items: List[schemas.TaskBulkCompletionItem]) -> dict:
+    """
+    Valide plusieurs tâches en une seule transaction.
+
+    Les tâches et les membres sont chargés en quelques requêtes groupées, puis les
+    complétions, l'historique de points et les totaux des membres sont écrits de façon
+    ensembliste (un INSERT multi-lignes par table, un UPDATE incrémental par membre).
+
+    Returns:
+        Un dictionnaire {succeeded, failed, results} avec un résultat par élément, dans l'ordre.
+    """
+    begin_immediate(db)
+    task_ids = list({item.task_id for item in items})
+    tasks = {}
+    for chunk in _chunked(task_ids):
+        rows = db.execute(
+            select(Task.id, Task.description, Task.points, Task.status, Task.created_at, Task.duration_value, Task.duration_unit, Task.expires_at)
+            .where(Task.id.in_(chunk))
+        )
+        tasks.update((row.id, row) for row in rows)
+    known_members = _existing_member_ids(db, (c.member_id for item in items for c in item.completions))
+
+    results: List[dict] = []
+    valid = []
+    seen_tasks = set()
+    for index, item in enumerate(items):
+        task = tasks.get(item.task_id)
+        error = None
+        if item.task_id in seen_tasks:
+            error = DUPLICATE_TASK_ID
+        elif task is None or task.status != 'pending' or is_task_expired(task):
+            error = "Task not found or already completed"
+        elif sum(c.percentage for c in item.completions) != 100:
+            error = "Total percentage must be 100"
+        elif any(c.member_id not in known_members for c in item.completions):
+            error = "Member not found"
+        seen_tasks.add(item.task_id)
+        results.append({"index": index, "task_id": item.task_id, "status": "error" if error else "completed", "error": error})
+        if error is None:
+            valid.append((item, task))
+
+    if not valid:
+        db.rollback()
+        return _bulk_result(results)
+
+    now = datetime.now(UTC)
+    for chunk in _chunked([task.id for _, task in valid]):
+        db.execute(update(Task).where(Task.id.in_(chunk)).values(status='completed', completed_at=now))
+
+    shares = [
+        (task, completion.member_id, int(task.points * (completion.percentage / 100)))
+        for item, task in valid
+        for completion in item.completions
+    ]
+    completion_ids = _insert_returning_ids(
+        db,
+        TaskCompletion,
+        [{"task_id": task.id, "member_id": member_id, "completed_at": now} for task, member_id, _ in shares],
+        ["task_id", "member_id"],
+    )
+    db.execute(insert(PointsHistory), [
+        {
+            "member_id": member_id,
+            "task_completion_id": completion_id,
+            "points_change": points,
+            "reason": f"Task '{task.description}' completed",
+            "timestamp": now,
+        }
+        for (task, member_id, points), completion_id in zip(shares, completion_ids)
+    ])
+
+    deltas: dict = {}
+    for _, member_id, points in shares:
+        deltas[member_id] = deltas.get(member_id, 0) + points
+    totals = apply_points_deltas(db, deltas)
+    # Les INSERT ensemblistes ne passent pas par le flush : l'agrégat journalier est mis à jour ici
+    daily_points.record_points_changes(db, [(member_id, now, points) for _, member_id, points in shares])
+
+    shares_by_task: dict = {}
+    for task, member_id, points in shares:
+        shares_by_task.setdefault(task.id, []).append({"member_id": member_id, "points": points})
+    for task_id, task_shares in shares_by_task.items():
+        queue_event(db, "task.completed", task_id=task_id, completed_at=now, completions=task_shares)
+    for member_id, (total_points, version) in totals.items():
+        queue_event(db, "member.points", member_id=member_id, total_points=total_points, version=version)
+    mark_changed(db, "tasks", "members", "points_history")
+    db.commit()
+    return _bulk_result(results)
+
+def expire_overdue_tasks(db: Session, now: Optional[datetime] = None) -> List[int]:
+    """
+    Passe au statut 'expired' toutes les tâches en attente dont l'échéance est dépassée.
+
+    Une seule requête UPDATE ensembliste, servie par l'index (status, expires_at).
+
+    Returns:
+        Les ids des tâches expirées.
+    """
+    now = now or datetime.now(UTC)
+    expired_ids = db.execute(
+        update(Task)
+        .where(Task.status == 'pending', Task.expires_at <= now)
+        .values(status='expired')
+        .returning(Task.id)
+        .execution_options(synchronize_session=False)
+    ).scalars().all()
+    if expired_ids:
+        mark_changed(db, "tasks")
+        queue_event(db, "tasks.expired", task_ids=expired_ids)
+    db.commit()
+    return expired_ids
 
 def get_points_history_for_member(db: Session, member_id: int):
     return db.query(PointsHistory).filter(PointsHistory.member_id == member_id).order_by(PointsHistory.timestamp.desc()).all()
 
 def get_tasks_for_member_by_status(db: Session, member_id: int, status: str):
     """Récupère les tâches d'un membre avec un statut spécifique."""
-    return db.query(Task).filter(Task.assigned_to_id == member_id, Task.status == status).all()
+    return (
+        db.query(Task)
+        .options(selectinload(Task.completions))
+        .filter(Task.assigned_to_id == member_id, Task.status == status)
+        .all()
+    )
 
-def get_daily_points_for_member(db: Session, member_id: int, period: str):
-    """Calcule les points journaliers gagnés par un membre sur une période."""
+def get_period_start_date(period: str) -> Optional[datetime]:
+    """Retourne le début de la période ('weekly' ou 'monthly') en cours, ou None si la période est inconnue."""
     today = datetime.now(UTC)
     if period == 'weekly':
         start_date = today - timedelta(days=today.weekday())
     elif period == 'monthly':
         start_date = today.replace(day=1)
     else:
-        return []
+        return None
+
+    return start_date.replace(hour=0, minute=0, second=0, microsecond=0)
 
-    start_date = start_date.replace(hour=0, minute=0, second=0, microsecond=0)
+def get_daily_points_for_member(db: Session, member_id: int, period: str):
+    """Calcule les points journaliers gagnés par un membre sur une période."""
+    start_date = get_period_start_date(period)
+    if start_date is None:
+        return []
 
     results = (
-        db.query(
-            func.date(PointsHistory.timestamp).label('date'),
-            func.sum(PointsHistory.points_change).label('total_points')
-        )
+        db.query(MemberDailyPoints.day, MemberDailyPoints.points_earned)
         .filter(
-            PointsHistory.member_id == member_id,
-            PointsHistory.timestamp >= start_date,
-            PointsHistory.points_change > 0
+            MemberDailyPoints.member_id == member_id,
+            MemberDailyPoints.day >= start_date.date(),
+            MemberDailyPoints.points_earned > 0
         )
-        .group_by(func.date(PointsHistory.timestamp))
-        .order_by(func.date(PointsHistory.timestamp))
+        .order_by(MemberDailyPoints.day)
         .all()
     )
-    return [{"date": str(date), "points": total_points} for date, total_points in results]
+    return [{"date": str(day), "points": points_earned} for day, points_earned in results]
 
 def get_claimed_rewards_for_member(db: Session, member_id: int):
     """Récupère l'historique des récompenses réclamées par un membre."""
@@ -0,0 +1,150 @@
+"""
+Foyers hébergés par le processus : une base SQLite par famille.
+
+Lorsque `HOUSEHOLDS_DIR` est défini, chaque foyer a son fichier `<HOUSEHOLDS_DIR>/<foyer>.db`
+(créé par `python -m src.data.households create <foyer>`). Sinon l'application sert un
+seul foyer, depuis `DATABASE_URL`.
+
+Des fichiers distincts évitent que les écritures d'une famille bloquent celles des autres
+(SQLite n'a qu'un verrou d'écriture par base) et permettent de répartir les foyers entre
+plusieurs machines en déplaçant leurs fichiers.
+"""
+import argparse
+import inspect
+import os
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict
+from contextvars import ContextVar
+from typing import Any, Callable, List, Tuple
+from src.core.config import settings
+
+HOUSEHOLD_ID_PATTERN = re.compile(r"[a-z0-9][a-z0-9_-]{0,63}")
+HOUSEHOLD_FILE_SUFFIX = ".db"
+
+# Foyer de la requête (ou de la tâche de fond) en cours
+current_household: ContextVar[str] = ContextVar("current_household", default=settings.household_default)
+
+class UnknownHousehold(LookupError):
+    """Aucune base n'existe pour ce foyer."""
+
+def households_enabled() -> bool:
+    return bool(settings.households_dir)
+
+def is_valid_household_id(household: str) -> bool:
+    return HOUSEHOLD_ID_PATTERN.fullmatch(household) is not None
+
+def household_path(household: str) -> str:
+    if not is_valid_household_id(household):
+        raise ValueError(f"Identifiant de foyer invalide : {household!r}")
+    return os.path.join(settings.households_dir, household + HOUSEHOLD_FILE_SUFFIX)
+
+def household_database_url(household: str) -> str:
+    """URL de la base d'un foyer ; `DATABASE_URL` si le multi-foyer est désactivé."""
+    if not households_enabled():
+        return settings.database_url
+    return f"sqlite:///{household_path(household)}"
+
+def household_ids() -> List[str]:
+    """Foyers existants (fichiers présents dans `HOUSEHOLDS_DIR`), triés."""
+    if not households_enabled():
+        return [settings.household_default]
+    try:
+        names = os.listdir(settings.households_dir)
+    except FileNotFoundError:
+        return []
+    households = (name.removesuffix(HOUSEHOLD_FILE_SUFFIX) for name in names if name.endswith(HOUSEHOLD_FILE_SUFFIX))
+    return sorted(household for household in households if is_valid_household_id(household))
+
+class HouseholdRegistry:
+    """
+    Moteurs ouverts à la demande, un par foyer, fermés au-delà de `max_open` (LRU) ou après
+    `idle_timeout` secondes sans utilisation.
+
+    Un moteur écarté n'est plus distribué mais n'est fermé que par `close_retired`, appelé
+    depuis la boucle asyncio : les moteurs aiosqlite ne peuvent être fermés qu'en asynchrone,
+    et les sessions encore ouvertes terminent normalement.
+    """
+
+    def __init__(self, factory: Callable[[str], Any], max_open: int = 32):
+        self._factory = factory
+        self.max_open = max_open
+        self._engines: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self._retired: List[Any] = []
+        self._lock = threading.Lock()
+        self.opened = 0
+
+    def get(self, household: str):
+        """Moteur du foyer, ouvert s'il ne l'est pas encore."""
+        with self._lock:
+            entry = self._engines.get(household)
+            if entry is None:
+                if not os.path.exists(household_path(household)):
+                    raise UnknownHousehold(household)
+                engine = self._factory(household_database_url(household))
+                self.opened += 1
+            else:
+                engine = entry[0]
+                self._engines.move_to_end(household)
+            self._engines[household] = (engine, time.monotonic())
+            while len(self._engines) > self.max_open:
+                _, (oldest, _) = self._engines.popitem(last=False)
+                self._retired.append(oldest)
+        return engine
+
+    def open_households(self) -> List[str]:
+        with self._lock:
+            return list(self._engines)
+
+    def retire_idle(self, idle_timeout: float) -> int:
+        """Écarte les moteurs inutilisés depuis plus de `idle_timeout` secondes."""
+        deadline = time.monotonic() - idle_timeout
+        with self._lock:
+            idle = [household for household, (_, last_used) in self._engines.items() if last_used < deadline]
+            for household in idle:
+                self._retired.append(self._engines.pop(household)[0])
+        return len(idle)
+
+    async def close_retired(self) -> int:
+        with self._lock:
+            retired, self._retired = self._retired, []
+        for engine in retired:
+            result = engine.dispose()
+            if inspect.isawaitable(result):
+                await result
+        return len(retired)
+
+    async def close_all(self):
+        with self._lock:
+            self._retired.extend(engine for engine, _ in self._engines.values())
+            self._engines.clear()
+        await self.close_retired()
+
+def _upgrade(household: str):
+    from alembic import command
+    from alembic.config import Config
+    config = Config("alembic.ini")
+    config.cmd_opts = argparse.Namespace(x=[f"household={household}"])
+    command.upgrade(config, "head")
+
+def create_household(household: str):
+    """Crée la base d'un foyer et y applique toutes les migrations."""
+    path = household_path(household)
+    if os.path.exists(path):
+        raise ValueError(f"Le foyer {household!r} existe déjà")
+    os.makedirs(settings.households_dir, exist_ok=True)
+    _upgrade(household)
+
+if __name__ == "__main__":
+    usage = "Usage: python -m src.data.households [list | create <household>]"
+    if not households_enabled():
+        sys.exit("HOUSEHOLDS_DIR is not set: the application serves a single household from DATABASE_URL")
+    if sys.argv[1:] == ["list"]:
+        print("\n".join(household_ids()))
+    elif len(sys.argv) == 3 and sys.argv[1] == "create":
+        create_household(sys.argv[2])
+        print(f"Household {sys.argv[2]} created")
+    else:
+        sys.exit(usage)
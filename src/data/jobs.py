@@ -0,0 +1,95 @@
+import asyncio
+import inspect
+import logging
+from datetime import datetime, timedelta, UTC
+from typing import Callable
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+from src.core.config import settings
+from src.data.async_database import household_async_engines, household_async_read_engines
+from src.data.database import SessionLocal, engine_for, expire_overdue_tasks, household_engines, household_read_engines
+from src.data.households import current_household, household_ids
+from src.data.recurring import generate_recurring_tasks, release_due_tasks
+
+logger = logging.getLogger(__name__)
+
+def for_each_household(job: Callable[[Session], int]) -> int:
+    """
+    Exécute `job` dans une session dédiée sur la base de chaque foyer ; retourne la somme des résultats.
+
+    `current_household` est fixé pendant chaque exécution : les événements publiés ne
+    parviennent qu'aux abonnés du foyer. L'échec d'un foyer n'empêche pas les suivants.
+    """
+    total = 0
+    for household in household_ids():
+        token = current_household.set(household)
+        try:
+            with SessionLocal(bind=engine_for(household)) as db:
+                total += job(db)
+        except Exception:
+            logger.exception(f"Job {job.__name__} failed for household {household}")
+        finally:
+            current_household.reset(token)
+    return total
+
+def _expire(db: Session) -> int:
+    # Les occurrences arrivées à leur date d'abord : elles peuvent être déjà échues
+    release_due_tasks(db)
+    return len(expire_overdue_tasks(db))
+
+def _generate(db: Session) -> int:
+    release_due_tasks(db)
+    until = datetime.now(UTC) + timedelta(days=settings.recurring_tasks_horizon_days)
+    return generate_recurring_tasks(db, until)["created"]
+
+def sweep_expired_tasks() -> int:
+    """Rend réalisables les occurrences arrivées à leur date et expire les tâches échues, dans chaque foyer."""
+    expired = for_each_household(_expire)
+    if expired:
+        logger.info(f"Expired {expired} overdue task(s)")
+    return expired
+
+def generate_upcoming_tasks() -> int:
+    """Matérialise les occurrences des tâches récurrentes sur l'horizon configuré, dans chaque foyer."""
+    created = for_each_household(_generate)
+    if created:
+        logger.info(f"Generated {created} recurring task occurrence(s)")
+    return created
+
+# Fréquence de fermeture des bases écartées (LRU ou inactivité)
+HOUSEHOLDS_CLOSE_INTERVAL = 60  # secondes
+
+def _household_registries():
+    # Les registres de lecture sont ceux d'écriture si READ_ONLY_SESSIONS est désactivé
+    registries = (household_engines, household_read_engines, household_async_engines, household_async_read_engines)
+    return list({id(registry): registry for registry in registries}.values())
+
+async def close_idle_households() -> int:
+    """Ferme les bases écartées par le LRU et celles inutilisées depuis `HOUSEHOLDS_IDLE_TIMEOUT` secondes."""
+    closed = 0
+    for registry in _household_registries():
+        if settings.households_idle_timeout > 0:
+            registry.retire_idle(settings.households_idle_timeout)
+        closed += await registry.close_retired()
+    return closed
+
+async def close_household_engines():
+    for registry in _household_registries():
+        await registry.close_all()
+
+async def run_periodically(job: Callable[[], object], interval: float):
+    """
+    Exécute une tâche toutes les `interval` secondes : dans le threadpool si elle est
+    bloquante, sur la boucle si c'est une coroutine.
+
+    Les erreurs sont journalisées sans interrompre la boucle ; s'arrête à l'annulation.
+    """
+    while True:
+        try:
+            if inspect.iscoroutinefunction(job):
+                await job()
+            else:
+                await run_in_threadpool(job)
+        except Exception:
+            logger.exception(f"Periodic job {job.__name__} failed")
+        await asyncio.sleep(interval)
@@ -0,0 +1,178 @@
+from sqlalchemy import DateTime, Integer, bindparam, case, column, func, literal, or_, select, true, update, values
+from sqlalchemy.sql.expression import ColumnElement
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+from src.core.models import Task, TaskTemplate
+from src.data.changes import mark_changed, queue_event
+from src.data.database import _chunked, calculate_expiration_time, as_utc
+from datetime import datetime, UTC
+from typing import List, Optional, Tuple
+
+def create_task_template(db: Session, description: str, points: int, duration_unit: str, duration_value: int = 1, assigned_to_id: Optional[int] = None, starts_at: Optional[datetime] = None):
+    db_template = TaskTemplate(
+        description=description,
+        points=points,
+        assigned_to_id=assigned_to_id,
+        duration_value=duration_value,
+        duration_unit=duration_unit,
+        starts_at=as_utc(starts_at) if starts_at else datetime.now(UTC),
+        active=True,
+    )
+    db.add(db_template)
+    db.commit()
+    db.refresh(db_template)
+    return db_template
+
+def get_task_templates(db: Session):
+    return db.query(TaskTemplate).filter(TaskTemplate.active.is_(True)).all()
+
+def delete_task_template(db: Session, template_id: int):
+    """Désactive un modèle : les occurrences déjà créées sont conservées."""
+    db_template = db.query(TaskTemplate).filter(TaskTemplate.id == template_id).first()
+    if db_template and db_template.active:
+        db_template.active = False # type: ignore
+        db.commit()
+        return True
+    return False
+
+def _occurrence_bounds(template, until: datetime) -> Optional[Tuple[int, int, int]]:
+    """
+    Occurrences d'un modèle à matérialiser : (premier rang, dernier rang, période en jours).
+
+    Les occurrences postérieures à `generated_until`, jusqu'à `until` inclus ; None s'il n'y en a aucune.
+    """
+    starts_at = as_utc(template.starts_at)
+    # Toutes les unités sont des nombres entiers de jours (un mois compte 30 jours)
+    period = calculate_expiration_time(starts_at, template.duration_value, template.duration_unit) - starts_at
+    first = 0
+    if template.generated_until is not None:
+        first = (as_utc(template.generated_until) - starts_at) // period + 1
+    last = (until - starts_at) // period
+    if first > last:
+        return None
+    return first, last, period.days
+
+def _shifted(stored: ColumnElement, days: ColumnElement) -> ColumnElement:
+    """
+    Date stockée décalée de `days` jours, au format d'enregistrement des DateTime
+    (`AAAA-MM-JJ HH:MM:SS.ffffff`) : la comparaison avec l'index unique reste exacte.
+    """
+    shifted = func.datetime(func.substr(stored, 1, 19), func.printf("+%d days", days))
+    return shifted.op("||")(func.substr(stored, 20))
+
+def generate_recurring_tasks(db: Session, until: datetime) -> dict:
+    """
+    Matérialise les occurrences des modèles actifs jusqu'à `until`.
+
+    Chaque occurrence devient une tâche créée à la date prévue, qui expire à l'occurrence
+    suivante. Les occurrences à venir ont le statut 'scheduled' : elles ne peuvent pas être
+    validées avant leur date, à laquelle `release_due_tasks` les passe en 'pending'.
+
+    Seuls les rangs de début et de fin de chaque modèle sont calculés ici : les
+    occurrences sont produites par SQLite (CTE récursive) et insérées par une seule requête
+    INSERT ... SELECT avec ON CONFLICT DO NOTHING sur (template_id, occurrence_at) : relancer
+    la génération, même après une interruption, ne crée jamais de doublon.
+
+    Returns:
+        Un dictionnaire {templates, created, until}.
+    """
+    until = as_utc(until)
+    now = datetime.now(UTC)
+    templates = db.execute(
+        select(
+            TaskTemplate.id,
+            TaskTemplate.duration_value,
+            TaskTemplate.duration_unit,
+            TaskTemplate.starts_at,
+            TaskTemplate.generated_until,
+        )
+        .where(
+            TaskTemplate.active.is_(True),
+            TaskTemplate.starts_at <= until,
+            or_(TaskTemplate.generated_until.is_(None), TaskTemplate.generated_until < until),
+        )
+    ).all()
+
+    bounds = []
+    for template in templates:
+        template_bounds = _occurrence_bounds(template, until)
+        if template_bounds is not None:
+            bounds.append((template.id, *template_bounds))
+
+    created = 0
+    tasks_table = Task.__table__
+    templates_table = TaskTemplate.__table__
+    for chunk in _chunked(bounds):
+        ranges = values(
+            column("template_id", Integer), column("first_index", Integer),
+            column("last_index", Integer), column("period_days", Integer),
+            name="ranges",
+        ).data(chunk).cte("ranges")
+        # Un rang par occurrence : (modèle, rang) de first_index à last_index
+        occurrences = select(
+            ranges.c.template_id, ranges.c.first_index.label("occurrence_index"), ranges.c.last_index, ranges.c.period_days
+        ).cte("occurrences", recursive=True)
+        occurrences = occurrences.union_all(
+            select(
+                occurrences.c.template_id, occurrences.c.occurrence_index + 1, occurrences.c.last_index, occurrences.c.period_days
+            ).where(occurrences.c.occurrence_index < occurrences.c.last_index)
+        )
+        occurrence_at = _shifted(templates_table.c.starts_at, occurrences.c.occurrence_index * occurrences.c.period_days)
+        rows = (
+            select(
+                templates_table.c.description,
+                templates_table.c.points,
+                templates_table.c.assigned_to_id,
+                case((occurrence_at <= literal(now, DateTime), "pending"), else_="scheduled"),
+                occurrence_at,
+                templates_table.c.duration_value,
+                templates_table.c.duration_unit,
+                _shifted(templates_table.c.starts_at, (occurrences.c.occurrence_index + 1) * occurrences.c.period_days),
+                templates_table.c.id,
+                occurrence_at,
+            )
+            .join_from(occurrences, templates_table, templates_table.c.id == occurrences.c.template_id)
+            # Lève l'ambiguïté de SQLite entre ON CONFLICT et une jointure sans WHERE
+            .where(true())
+        )
+        statement = sqlite_insert(tasks_table).from_select(
+            ["description", "points", "assigned_to_id", "status", "created_at", "duration_value", "duration_unit", "expires_at", "template_id", "occurrence_at"],
+            rows,
+        ).on_conflict_do_nothing(index_elements=[tasks_table.c.template_id, tasks_table.c.occurrence_at])
+        db.execute(statement)
+        # rowcount vaut -1 pour une requête qui commence par WITH : SQLite compte lui-même les lignes insérées
+        created += db.execute(select(func.changes())).scalar()
+
+    if templates:
+        db.execute(
+            update(templates_table)
+            .where(templates_table.c.id == bindparam("template_id"))
+            .values(generated_until=until),
+            [{"template_id": template.id} for template in templates],
+        )
+    if created:
+        mark_changed(db, "tasks")
+        queue_event(db, "tasks.generated", count=created)
+    db.commit()
+    return {"templates": len(templates), "created": created, "until": until}
+
+def release_due_tasks(db: Session, now: Optional[datetime] = None) -> List[int]:
+    """
+    Passe au statut 'pending' les occurrences planifiées ('scheduled') dont la date est arrivée.
+
+    Returns:
+        Les ids des tâches devenues réalisables.
+    """
+    now = now or datetime.now(UTC)
+    released_ids = db.execute(
+        update(Task)
+        .where(Task.status == 'scheduled', Task.created_at <= now)
+        .values(status='pending')
+        .returning(Task.id)
+        .execution_options(synchronize_session=False)
+    ).scalars().all()
+    if released_ids:
+        mark_changed(db, "tasks")
+        queue_event(db, "tasks.released", task_ids=released_ids)
+    db.commit()
+    return released_ids
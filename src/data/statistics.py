@@ -1,7 +1,7 @@
-from sqlalchemy import func, extract
+from sqlalchemy import func
 from sqlalchemy.orm import Session
-from src.core.models import PointsHistory, FamilyMember, Reward
-from datetime import datetime, timedelta, UTC
+from src.core.models import PointsHistory, FamilyMember, Reward, MemberDailyPoints
+from src.data.database import get_period_start_date
 
 def get_points_by_user_per_period(db: Session, period: str):
     """
@@ -14,28 +14,22 @@ def get_points_by_user_per_period(db: Session, period: str):
     Returns:
         Une liste de dictionnaires contenant le nom du membre et le total des points gagnés.
     """
-    today = datetime.now(UTC)
-    if period == 'weekly':
-        start_date = today - timedelta(days=today.weekday())
-    elif period == 'monthly':
-        start_date = today.replace(day=1)
-    else:
+    start_date = get_period_start_date(period)
+    if start_date is None:
         return []
 
-    start_date = start_date.replace(hour=0, minute=0, second=0, microsecond=0)
-
     results = (
         db.query(
             FamilyMember.name,
-            func.sum(PointsHistory.points_change).label('total_points')
+            func.sum(MemberDailyPoints.points_earned).label('total_points')
         )
-        .join(PointsHistory, FamilyMember.id == PointsHistory.member_id)
+        .join(MemberDailyPoints, FamilyMember.id == MemberDailyPoints.member_id)
         .filter(
-            PointsHistory.timestamp >= start_date,
-            PointsHistory.points_change > 0  # On ne compte que les points gagnés
+            MemberDailyPoints.day >= start_date.date(),
+            MemberDailyPoints.points_earned > 0  # On ne compte que les points gagnés
         )
         .group_by(FamilyMember.name)
-        .order_by(func.sum(PointsHistory.points_change).desc())
+        .order_by(func.sum(MemberDailyPoints.points_earned).desc())
         .all()
     )
     
@@ -1,26 +1,66 @@
 
+import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
-from fastapi.staticfiles import StaticFiles
-from src.api import web_routes, statistics, member_details, caster
+from starlette.concurrency import run_in_threadpool
+from src.api import web_routes, statistics, member_details, caster, cache, events, dashboard, tasks, history, task_templates, metrics, slideshow, leaderboard
+from src.api.cast_discovery import cast_registry
+from src.api.households import HouseholdMiddleware, unknown_household_handler
+from src.core.config import settings
+from src.data.households import UnknownHousehold, households_enabled
+from src.data.jobs import (
+    HOUSEHOLDS_CLOSE_INTERVAL,
+    close_household_engines,
+    close_idle_households,
+    generate_upcoming_tasks,
+    run_periodically,
+    sweep_expired_tasks,
+)
+from src.web.assets import AssetFiles, asset_manifest
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    web_routes.prerender_pages()
+    if settings.leaderboard_warm_up:
+        await run_in_threadpool(leaderboard.warm_up_leaderboards)
+    if settings.cast_discovery_enabled:
+        await run_in_threadpool(cast_registry.start)
+    jobs = []
+    if settings.task_expiry_sweep_interval > 0:
+        jobs.append(asyncio.create_task(run_periodically(sweep_expired_tasks, settings.task_expiry_sweep_interval)))
+    if settings.recurring_tasks_interval > 0:
+        jobs.append(asyncio.create_task(run_periodically(generate_upcoming_tasks, settings.recurring_tasks_interval)))
+    if households_enabled():
+        jobs.append(asyncio.create_task(run_periodically(close_idle_households, HOUSEHOLDS_CLOSE_INTERVAL)))
+    yield
+    for job in jobs:
+        job.cancel()
+    await asyncio.gather(*jobs, return_exceptions=True)
+    await close_household_engines()
+    await run_in_threadpool(cast_registry.stop)
 
+app = FastAPI(lifespan=lifespan)
+# Le dernier ajouté est le plus externe : les métriques couvrent aussi la résolution du foyer
+app.add_middleware(HouseholdMiddleware)
+app.add_middleware(metrics.MetricsMiddleware)
+app.add_exception_handler(UnknownHousehold, unknown_household_handler)
 
-app.mount("/static", StaticFiles(directory="src/web/static"), name="static")
+
+app.mount("/static", AssetFiles(asset_manifest), name="static")
 app.include_router(web_routes.router)
+app.include_router(metrics.router)
 app.include_router(statistics.router, prefix="/api/v1")
 app.include_router(member_details.router, prefix="/api/v1")
 app.include_router(caster.router, prefix="/api/v1")
+app.include_router(cache.router, prefix="/api/v1")
+app.include_router(events.router, prefix="/api/v1")
+app.include_router(dashboard.router, prefix="/api/v1")
+app.include_router(tasks.router, prefix="/api/v1")
+app.include_router(history.router, prefix="/api/v1")
+app.include_router(task_templates.router, prefix="/api/v1")
+app.include_router(slideshow.router, prefix="/api/v1")
+app.include_router(leaderboard.router, prefix="/api/v1")
 
 @app.get("/api/hello")
 def read_root():
     return {"Hello": "World"}
-
-# TEMPORARY DEBUG ENDPOINT
-@app.get("/debug/routes")
-def debug_routes():
-    routes_list = []
-    for route in app.routes:
-        routes_list.append({"path": route.path, "name": route.name, "methods": route.methods if hasattr(route, 'methods') else []})
-    return routes_list
-# END TEMPORARY DEBUG ENDPOINT
\ No newline at end of file
@@ -0,0 +1,169 @@
+"""
+Fichiers statiques versionnés et précompressés.
+
+`python -m src.web.assets` copie chaque fichier de `src/web/static` sous un nom qui contient
+l'empreinte de son contenu (`js/chart.3f1c9a0b27de.js`), en écrit les variantes brotli et
+gzip, puis la table de correspondance `manifest.json` dans `STATIC_BUILD_DIR`.
+
+Les gabarits obtiennent les URL par `asset_url('js/chart.js')`. Un fichier versionné ne
+change jamais : il est servi avec `Cache-Control: immutable`, dans l'encodage accepté par
+le client. Sans build (développement), les fichiers sources sont servis tels quels.
+"""
+import gzip
+import hashlib
+import json
+import logging
+import mimetypes
+import os
+import sys
+from typing import Callable, Dict, List, Optional, Tuple
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Scope
+from src.core.config import settings
+
+try:
+    import brotli
+except ImportError:  # environnement non synchronisé : seules les variantes gzip sont produites (voir build_assets)
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+STATIC_DIRECTORY = "src/web/static"
+STATIC_URL_PREFIX = "/static/"
+MANIFEST_NAME = "manifest.json"
+# Les fichiers déjà compressés (images, polices) ne gagnent rien à l'être à nouveau
+COMPRESSIBLE_EXTENSIONS = {".css", ".js", ".json", ".svg", ".html", ".txt", ".map"}
+# Par ordre de préférence
+ENCODING_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+def _compressors() -> List[Tuple[str, Callable[[bytes], bytes]]]:
+    compressors = []
+    if brotli is not None:
+        compressors.append(("br", lambda content: brotli.compress(content, quality=11)))
+    # mtime=0 : deux builds du même fichier produisent les mêmes octets
+    compressors.append(("gzip", lambda content: gzip.compress(content, compresslevel=9, mtime=0)))
+    return compressors
+
+def _write(path: str, content: bytes):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as output:
+        output.write(content)
+
+def build_assets(source: str = STATIC_DIRECTORY, target: Optional[str] = None) -> Dict[str, dict]:
+    """
+    Construit les fichiers versionnés de `source` dans `target` et y écrit le manifeste.
+
+    Returns:
+        Le manifeste : chemin source -> {"path": chemin versionné, "encodings": variantes précompressées}.
+    """
+    target = target or settings.static_build_dir
+    if brotli is None:
+        logger.warning("brotli is not installed: building gzip variants only, no .br files (run `uv sync`)")
+    manifest = {}
+    for root, _, files in os.walk(source):
+        for name in sorted(files):
+            relative = os.path.relpath(os.path.join(root, name), source).replace(os.sep, "/")
+            with open(os.path.join(root, name), "rb") as source_file:
+                content = source_file.read()
+            stem, extension = os.path.splitext(relative)
+            hashed = f"{stem}.{hashlib.blake2b(content, digest_size=6).hexdigest()}{extension}"
+            _write(os.path.join(target, hashed), content)
+            encodings = []
+            if extension in COMPRESSIBLE_EXTENSIONS:
+                for encoding, compress in _compressors():
+                    compressed = compress(content)
+                    if len(compressed) < len(content):
+                        _write(os.path.join(target, hashed + ENCODING_SUFFIXES[encoding]), compressed)
+                        encodings.append(encoding)
+            manifest[relative] = {"path": hashed, "encodings": encodings}
+
+    # Écrit en dernier et remplacé d'un coup : un serveur qui le relit ne voit jamais de fichier manquant
+    manifest_path = os.path.join(target, MANIFEST_NAME)
+    _write(manifest_path + ".tmp", json.dumps(manifest, indent=2, sort_keys=True).encode())
+    os.replace(manifest_path + ".tmp", manifest_path)
+    return manifest
+
+class AssetManifest:
+    """Correspondance entre les fichiers sources et leurs versions construites."""
+
+    def __init__(self, build_directory: str):
+        self.build_directory = build_directory
+        self.reload()
+
+    def reload(self):
+        try:
+            with open(os.path.join(self.build_directory, MANIFEST_NAME), encoding="utf-8") as manifest_file:
+                entries = json.load(manifest_file)
+        except FileNotFoundError:
+            entries = {}
+        self._entries: Dict[str, dict] = entries
+        self._built = {entry["path"]: entry for entry in entries.values()}
+
+    def url(self, path: str) -> str:
+        """URL d'un fichier statique : la version construite si elle existe, le fichier source sinon."""
+        entry = self._entries.get(path)
+        return STATIC_URL_PREFIX + (entry["path"] if entry else path)
+
+    def lookup(self, built_path: str) -> Optional[dict]:
+        return self._built.get(built_path)
+
+def preferred_encoding(accept_encoding: str, available: List[str]) -> Optional[str]:
+    """Meilleur encodage disponible accepté par l'en-tête Accept-Encoding (None : sans compression)."""
+    accepted = {}
+    for part in accept_encoding.split(","):
+        name, _, parameters = part.partition(";")
+        quality = 1.0
+        parameter, _, value = parameters.strip().partition("=")
+        if parameter.strip() == "q":
+            try:
+                quality = float(value)
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip().lower()] = quality
+    for encoding in ENCODING_SUFFIXES:
+        if encoding in available and accepted.get(encoding, accepted.get("*", 0.0)) > 0:
+            return encoding
+    return None
+
+class AssetFiles(StaticFiles):
+    """
+    `StaticFiles` servant d'abord les fichiers versionnés du manifeste, précompressés et immuables.
+
+    Les autres chemins (fichiers sources, build absent) sont servis par `StaticFiles`.
+    """
+
+    def __init__(self, manifest: AssetManifest, directory: str = STATIC_DIRECTORY):
+        super().__init__(directory=directory)
+        self.manifest = manifest
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        entry = self.manifest.lookup(path.replace(os.sep, "/"))
+        if entry is None or scope["method"] not in ("GET", "HEAD"):
+            return await super().get_response(path, scope)
+
+        request_headers = Headers(scope=scope)
+        encoding = preferred_encoding(request_headers.get("accept-encoding", ""), entry["encodings"])
+        full_path = os.path.join(self.manifest.build_directory, entry["path"] + ENCODING_SUFFIXES.get(encoding, ""))
+        headers = {"Cache-Control": IMMUTABLE_CACHE_CONTROL, "Vary": "Accept-Encoding"}
+        if encoding is not None:
+            headers["Content-Encoding"] = encoding
+        response = FileResponse(
+            full_path,
+            stat_result=os.stat(full_path),
+            media_type=mimetypes.guess_type(entry["path"])[0] or "application/octet-stream",
+            headers=headers,
+        )
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
+
+asset_manifest = AssetManifest(settings.static_build_dir)
+
+if __name__ == "__main__":
+    target = sys.argv[1] if len(sys.argv) > 1 else settings.static_build_dir
+    built = build_assets(STATIC_DIRECTORY, target)
+    encodings = ", ".join(encoding for encoding, _ in _compressors())
+    print(f"{len(built)} assets built into {target} ({encodings})")
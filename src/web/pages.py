@@ -0,0 +1,62 @@
+"""
+Rendu des pages HTML.
+
+Les pages sans données (tableau de bord, gestion, statistiques, slideshow...) ne dépendent
+que du paramètre `showMenu` : elles sont rendues une fois par variante puis servies telles
+quelles. Seules les pages d'un héros sont rendues à chaque requête.
+"""
+import hashlib
+from typing import Dict, Iterable, Tuple
+import jinja2
+from fastapi import Request
+from fastapi.templating import Jinja2Templates
+from src.web.assets import asset_manifest
+
+TEMPLATES_DIRECTORY = "src/web/templates"
+
+def show_menu(request: Request) -> bool:
+    """`?showMenu=false` masque l'en-tête et le pied de page (affichage sur Chromecast)."""
+    return request.query_params.get("showMenu") != "false"
+
+# Le bytecode compilé des gabarits est conservé entre deux démarrages (dossier temporaire de l'utilisateur)
+environment = jinja2.Environment(
+    loader=jinja2.FileSystemLoader(TEMPLATES_DIRECTORY),
+    autoescape=jinja2.select_autoescape(),
+    bytecode_cache=jinja2.FileSystemBytecodeCache(),
+)
+# URL des fichiers statiques d'après le manifeste du build
+environment.globals["asset_url"] = asset_manifest.url
+templates = Jinja2Templates(env=environment, context_processors=[lambda request: {"show_menu": show_menu(request)}])
+
+class RenderedPage:
+    """Page rendue, encodée, et son ETag (empreinte du contenu)."""
+
+    __slots__ = ("body", "etag")
+
+    def __init__(self, body: bytes):
+        self.body = body
+        self.etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+class StaticPages:
+    """Pages sans données, rendues à la première demande (ou par `render_all` au démarrage)."""
+
+    def __init__(self, templates: Jinja2Templates):
+        self._templates = templates
+        self._pages: Dict[Tuple[str, bool], RenderedPage] = {}
+
+    def get(self, template: str, show_menu: bool = True) -> RenderedPage:
+        page = self._pages.get((template, show_menu))
+        if page is None:
+            body = self._templates.get_template(template).render(show_menu=show_menu).encode()
+            page = self._pages[(template, show_menu)] = RenderedPage(body)
+        return page
+
+    def render_all(self, template_names: Iterable[str]):
+        for template in template_names:
+            for variant in (True, False):
+                self.get(template, variant)
+
+    def clear(self):
+        self._pages.clear()
+
+static_pages = StaticPages(templates)
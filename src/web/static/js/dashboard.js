@@ -53,59 +53,71 @@ document.addEventListener('DOMContentLoaded', () => {
         }
     }
 
-    // Fetch and display family members (leaderboard)
-    async function loadLeaderboard() {
+    // Local state, patched by live updates
+    let leaderboardMembers = [];
+    let dashboardMembers = [];
+    let recentTasks = [];
+    let dashboardRewards = [];
+    let memberNames = new Map();
+
+    // Fetch everything the dashboard displays in a single request
+    async function loadDashboard() {
         showLoading(leaderboardLoading);
-        const members = await fetchData('/api/leaderboard');
+        showLoading(tasksLoading);
+        showLoading(rewardsLoading);
+        const snapshot = await fetchData('/api/v1/dashboard');
+        if (snapshot) {
+            leaderboardMembers = snapshot.leaderboard;
+            dashboardMembers = snapshot.members;
+            recentTasks = snapshot.tasks;
+            dashboardRewards = snapshot.rewards;
+            memberNames = new Map();
+            dashboardMembers.forEach(member => {
+                memberNames.set(member.id, member.name);
+            });
+            renderLeaderboard();
+            renderTasks();
+            renderRewards();
+            populateAssigneeDropdown();
+        }
+        hideLoading(leaderboardLoading);
+        hideLoading(tasksLoading);
+        hideLoading(rewardsLoading);
+    }
+
+    function renderLeaderboard() {
         const leaderboardList = document.getElementById('leaderboard-list');
-        if (leaderboardList && members) {
+        if (leaderboardList) {
+            leaderboardMembers.sort((a, b) => b.total_points - a.total_points);
             leaderboardList.innerHTML = '';
-            members.forEach(member => {
+            leaderboardMembers.forEach(member => {
                 const li = document.createElement('li');
                 li.className = 'collection-item';
                 li.innerHTML = `<div><a href="/members/${member.id}">${member.name}</a><span class="secondary-content">${member.total_points} points ✨</span></div>`;
                 leaderboardList.appendChild(li);
             });
         }
-        hideLoading(leaderboardLoading);
     }
 
-    // Fetch and display tasks
-    async function loadTasks() {
-        showLoading(tasksLoading);
-        // Calculer la date d'il y a 7 jours au format ISO (UTC)
-        const now = new Date();
-        const oneWeekAgo = new Date(now.getTime() - 7 * 24 * 60 * 60 * 1000);
-        const isoOneWeekAgo = oneWeekAgo.toISOString();
-
-        // Appel API avec filtre created_after
-        const tasks = await fetchData(`/api/tasks?created_after=${encodeURIComponent(isoOneWeekAgo)}`);
-        const members = await fetchData('/api/members');
+    // Display tasks of the last 7 days
+    function renderTasks() {
         const questsByPersonContainer = document.getElementById('quests-by-person-container');
-
-        const memberMap = new Map();
-        if (members) {
-            members.forEach(member => {
-                memberMap.set(member.id, member.name);
-            });
-        }
+        const memberMap = memberNames;
 
         const groupedTasks = {
             unassigned: []
         };
 
-        if (tasks) {
-            tasks.forEach(task => {
-                if (task.assigned_to_id) {
-                    if (!groupedTasks[task.assigned_to_id]) {
-                        groupedTasks[task.assigned_to_id] = [];
-                    }
-                    groupedTasks[task.assigned_to_id].push(task);
-                } else {
-                    groupedTasks.unassigned.push(task);
+        recentTasks.forEach(task => {
+            if (task.assigned_to_id) {
+                if (!groupedTasks[task.assigned_to_id]) {
+                    groupedTasks[task.assigned_to_id] = [];
                 }
-            });
-        }
+                groupedTasks[task.assigned_to_id].push(task);
+            } else {
+                groupedTasks.unassigned.push(task);
+            }
+        });
 
         if (questsByPersonContainer) {
             questsByPersonContainer.innerHTML = '';
@@ -119,16 +131,8 @@ document.addEventListener('DOMContentLoaded', () => {
 
             // Helper to compute remaining time
             function getRemainingTime(task) {
-                if (!task.duration_value || !task.duration_unit || !task.created_at) return '';
-                const created = new Date(task.created_at);
-                let msToAdd = 0;
-                switch (task.duration_unit) {
-                    case 'days': msToAdd = task.duration_value * 24 * 60 * 60 * 1000; break;
-                    case 'weeks': msToAdd = task.duration_value * 7 * 24 * 60 * 60 * 1000; break;
-                    case 'months': msToAdd = task.duration_value * 30 * 24 * 60 * 60 * 1000; break;
-                    default: return '';
-                }
-                const expiration = new Date(created.getTime() + msToAdd);
+                if (!task.expires_at) return '';
+                const expiration = new Date(task.expires_at);
                 const now = new Date();
                 const diff = expiration - now;
                 if (diff <= 0) return '<span class="red-text">Temps écoulé ⏰</span>';
@@ -143,6 +147,13 @@ document.addEventListener('DOMContentLoaded', () => {
                 return txt.trim();
             }
 
+            function statusLabel(task) {
+                if (task.status === 'completed') return 'Terminée ✅';
+                if (task.status === 'expired') return 'Expirée ⌛';
+                if (task.status === 'scheduled') return 'Planifiée 📅';
+                return 'En cours ⏳';
+            }
+
             // Render unassigned tasks first
             if (groupedTasks.unassigned.length > 0) {
                 const unassignedSection = document.createElement('div');
@@ -160,8 +171,8 @@ document.addEventListener('DOMContentLoaded', () => {
                                             ${task.status === 'completed' ? `<span class='grey-text'>Réalisée le : ${formatDateFr(task.completed_at)}</span>` : getRemainingTime(task)}
                                         </span>
                                         <span class="quest-actions">
-                                            <span class="quest-status-text">Statut: ${task.status === 'completed' ? 'Terminée ✅' : 'En cours ⏳'}</span>
-                                            ${task.status !== 'completed' ? `<a href="#" class="btn-small waves-effect waves-light green complete-task-btn" data-task-id="${task.id}" data-assigned-to="${task.assigned_to_id}" title="Valider la quête"><i class="material-icons">check</i></a>` : ''}
+                                            <span class="quest-status-text">Statut: ${statusLabel(task)}</span>
+                                            ${task.status === 'pending' ? `<a href="#" class="btn-small waves-effect waves-light green complete-task-btn" data-task-id="${task.id}" data-assigned-to="${task.assigned_to_id}" title="Valider la quête"><i class="material-icons">check</i></a>` : ''}
                                         </span>
                                     </div>
                                 </li>
@@ -191,8 +202,8 @@ document.addEventListener('DOMContentLoaded', () => {
                                                 ${task.status === 'completed' ? `<span class='grey-text'>Réalisée le : ${formatDateFr(task.completed_at)}</span>` : getRemainingTime(task)}
                                             </span>
                                             <span class="quest-actions">
-                                                <span class="quest-status-text">Statut: ${task.status === 'completed' ? 'Terminée ✅' : 'En cours ⏳'}</span>
-                                                ${task.status !== 'completed' ? `<a href="#" class="btn-small waves-effect waves-light green complete-task-btn" data-task-id="${task.id}" data-assigned-to="${task.assigned_to_id}" title="Valider la quête"><i class="material-icons">check</i></a>` : ''}
+                                                <span class="quest-status-text">Statut: ${statusLabel(task)}</span>
+                                                ${task.status === 'pending' ? `<a href="#" class="btn-small waves-effect waves-light green complete-task-btn" data-task-id="${task.id}" data-assigned-to="${task.assigned_to_id}" title="Valider la quête"><i class="material-icons">check</i></a>` : ''}
                                             </span>
                                         </div>
                                     </li>
@@ -218,8 +229,9 @@ document.addEventListener('DOMContentLoaded', () => {
                         });
                         if (result) {
                             M.toast({html: 'Tâche marquée comme terminée! ✅', classes: 'green darken-1'});
-                            loadTasks();
-                            loadLeaderboard();
+                            if (!liveUpdates) {
+                                loadDashboard();
+                            }
                         }
                     } else {
                         // Task is not assigned, open modal to select user
@@ -228,12 +240,11 @@ document.addEventListener('DOMContentLoaded', () => {
                 });
             });
         }
-        hideLoading(tasksLoading);
     }
 
     // Open modal to assign user to a task
     async function openAssignUserModal(taskId) {
-        const members = await fetchData('/api/members');
+        const members = dashboardMembers;
         const userSelectionList = document.getElementById('user-selection-list');
         if (userSelectionList && members) {
             userSelectionList.innerHTML = '';
@@ -329,23 +340,22 @@ document.addEventListener('DOMContentLoaded', () => {
                 M.toast({html: 'Tâche marquée comme terminée! ✅', classes: 'green darken-1'});
                 const modal = M.Modal.getInstance(document.getElementById('assign-user-modal'));
                 modal.close();
-                loadTasks();
-                loadLeaderboard();
+                if (!liveUpdates) {
+                    loadDashboard();
+                }
             }
         } else {
             M.toast({html: 'Veuillez sélectionner au moins un membre. 👤', classes: 'red darken-1'});
         }
     });
 
-    // Fetch and display rewards
-    async function loadRewards() {
-        showLoading(rewardsLoading);
-        const rewards = await fetchData('/api/rewards');
+    // Display rewards
+    function renderRewards() {
         const rewardList = document.getElementById('reward-list');
 
-        if (rewardList && rewards) {
+        if (rewardList) {
             rewardList.innerHTML = '';
-            rewards.forEach(reward => {
+            dashboardRewards.forEach(reward => {
                 const li = document.createElement('li');
                 li.className = 'collection-item';
                 li.innerHTML = `
@@ -369,12 +379,11 @@ document.addEventListener('DOMContentLoaded', () => {
                 });
             });
         }
-        hideLoading(rewardsLoading);
     }
 
     // Open modal to claim a reward
     async function openClaimRewardModal(rewardId, rewardCost) {
-        const members = await fetchData('/api/members');
+        const members = dashboardMembers;
         const memberSelect = document.getElementById('member-select');
         if (memberSelect && members) {
             memberSelect.innerHTML = '<option value="" disabled selected>Sélectionnez un membre</option>';
@@ -412,16 +421,17 @@ document.addEventListener('DOMContentLoaded', () => {
             M.toast({html: 'Récompense réclamée! 🎁', classes: 'blue darken-1'});
             const modal = M.Modal.getInstance(document.getElementById('claim-reward-modal'));
             modal.close();
-            loadRewards();
-            loadLeaderboard();
+            if (!liveUpdates) {
+                loadDashboard();
+            }
         }
     });
 
     // Populate task assignee dropdown
-    async function populateAssigneeDropdown() {
+    function populateAssigneeDropdown() {
         const assigneeSelect = document.getElementById('task_assignee');
         if (assigneeSelect) {
-            const members = await fetchData('/api/members');
+            const members = dashboardMembers;
             if (members) {
                 assigneeSelect.innerHTML = '<option value="" disabled selected>Assigner à...</option>';
                 members.forEach(member => {
@@ -464,15 +474,120 @@ document.addEventListener('DOMContentLoaded', () => {
             if (result) {
                 M.toast({html: 'Nouvelle tâche ajoutée! ✨', classes: 'green darken-1'});
                 addTaskForm.reset();
-                loadTasks();
+                if (!liveUpdates) {
+                    loadDashboard();
+                }
                 M.FormSelect.init(document.querySelectorAll('select'));
             }
         });
     }
 
+    // Live updates (Server-Sent Events): patch local state instead of refetching every list
+    let liveUpdates = false;
+
+    function connectLiveUpdates() {
+        if (!window.EventSource) return;
+        const source = new EventSource('/api/v1/events');
+        let interrupted = false;
+
+        source.addEventListener('open', () => {
+            liveUpdates = true;
+            if (interrupted) {
+                // Some events may have been missed while disconnected
+                interrupted = false;
+                loadDashboard();
+            }
+        });
+        source.addEventListener('error', () => {
+            liveUpdates = false;
+            interrupted = true;
+        });
+        source.addEventListener('resync', loadDashboard);
+
+        source.addEventListener('member.points', (event) => {
+            const data = JSON.parse(event.data);
+            const member = leaderboardMembers.find(m => m.id === data.member_id);
+            const summary = dashboardMembers.find(m => m.id === data.member_id);
+            if (member && summary) {
+                member.total_points = data.total_points;
+                summary.total_points = data.total_points;
+                renderLeaderboard();
+            } else {
+                loadDashboard();
+            }
+        });
+        source.addEventListener('task.created', (event) => {
+            const data = JSON.parse(event.data);
+            if (!recentTasks.some(t => t.id === data.task.id)) {
+                recentTasks.push({ completions: [], ...data.task });
+                renderTasks();
+            }
+        });
+        source.addEventListener('tasks.expired', (event) => {
+            const data = JSON.parse(event.data);
+            const expired = new Set(data.task_ids);
+            recentTasks.forEach(task => {
+                if (expired.has(task.id)) task.status = 'expired';
+            });
+            renderTasks();
+        });
+        source.addEventListener('tasks.released', (event) => {
+            const data = JSON.parse(event.data);
+            const released = new Set(data.task_ids);
+            recentTasks.forEach(task => {
+                if (released.has(task.id)) task.status = 'pending';
+            });
+            renderTasks();
+        });
+        // Occurrences générées en lot : le détail n'est pas diffusé, on recharge
+        source.addEventListener('tasks.generated', loadDashboard);
+        source.addEventListener('task.completed', (event) => {
+            const data = JSON.parse(event.data);
+            const task = recentTasks.find(t => t.id === data.task_id);
+            if (task) {
+                task.status = 'completed';
+                task.completed_at = data.completed_at;
+                renderTasks();
+            }
+        });
+        source.addEventListener('task.updated', (event) => {
+            const data = JSON.parse(event.data);
+            const task = recentTasks.find(t => t.id === data.task.id);
+            if (task) {
+                Object.assign(task, data.task);
+                renderTasks();
+            }
+        });
+        source.addEventListener('task.deleted', (event) => {
+            const data = JSON.parse(event.data);
+            recentTasks = recentTasks.filter(t => t.id !== data.task_id);
+            renderTasks();
+        });
+        source.addEventListener('reward.created', (event) => {
+            const data = JSON.parse(event.data);
+            if (!dashboardRewards.some(r => r.id === data.reward.id)) {
+                dashboardRewards.push(data.reward);
+                renderRewards();
+            }
+        });
+        source.addEventListener('reward.updated', (event) => {
+            const data = JSON.parse(event.data);
+            const reward = dashboardRewards.find(r => r.id === data.reward.id);
+            if (reward) {
+                Object.assign(reward, data.reward);
+                renderRewards();
+            }
+        });
+        source.addEventListener('reward.deleted', (event) => {
+            const data = JSON.parse(event.data);
+            dashboardRewards = dashboardRewards.filter(r => r.id !== data.reward_id);
+            renderRewards();
+        });
+        // Membres ajoutés, renommés ou supprimés : classement et listes de sélection à refaire
+        ['member.created', 'member.renamed', 'member.deleted'].forEach(type => source.addEventListener(type, loadDashboard));
+    }
+
     // Initial data load
-    loadLeaderboard();
-    loadTasks();
-    loadRewards();
-    populateAssigneeDropdown();
+    loadDashboard();
+    connectLiveUpdates();
 });
\ No newline at end of file
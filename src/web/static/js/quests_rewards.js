@@ -103,15 +103,53 @@ document.addEventListener('DOMContentLoaded', () => {
         }
     }
 
-    // Load tasks into the list
+    // Local state, patched by live updates
+    let questTasks = [];
+    let questMembers = [];
+    let nextTasksCursor = null;
+    const loadMoreTasksButton = document.getElementById('load-more-tasks');
+
+    // Load the first page of tasks (most recent first)
     async function loadTasks() {
         showLoading(tasksLoading);
-        const tasks = await fetchData('/api/tasks');
+        const page = await fetchData('/api/v1/tasks');
         const members = await fetchData('/api/members');
 
-        if (tasksList && tasks && members) {
+        if (page && members) {
+            questTasks = page.items;
+            nextTasksCursor = page.next_cursor;
+            questMembers = members;
+            renderTasks();
+        }
+        hideLoading(tasksLoading);
+    }
+
+    // Append the next page of tasks
+    async function loadMoreTasks() {
+        if (!nextTasksCursor) return;
+        showLoading(tasksLoading);
+        const page = await fetchData(`/api/v1/tasks?cursor=${encodeURIComponent(nextTasksCursor)}`);
+        if (page) {
+            const known = new Set(questTasks.map(t => t.id));
+            questTasks = questTasks.concat(page.items.filter(t => !known.has(t.id)));
+            nextTasksCursor = page.next_cursor;
+            renderTasks();
+        }
+        hideLoading(tasksLoading);
+    }
+
+    if (loadMoreTasksButton) {
+        loadMoreTasksButton.addEventListener('click', (event) => {
+            event.preventDefault();
+            loadMoreTasks();
+        });
+    }
+
+    function renderTasks() {
+        const members = questMembers;
+        if (tasksList) {
             tasksList.innerHTML = '';
-            for (const task of tasks) {
+            for (const task of questTasks) {
                 const li = document.createElement('li');
                 li.className = 'collection-item';
 
@@ -130,14 +168,16 @@ document.addEventListener('DOMContentLoaded', () => {
                     completedBy = `Terminée par: ${completerNames.join(', ')} ✅`;
                 }
 
-                li.innerHTML = `<div style="display: flex; align-items: center; justify-content: space-between;"><span>${task.description} - ${task.points} points ✨</span><span class="quest-actions"><span class="quest-status-text">Assigné à: ${assignedToName} - Statut: ${task.status === 'completed' ? completedBy : 'En cours ⏳'}</span><a href="#!" class="btn-small waves-effect waves-light blue edit-task-btn" data-task-id="${task.id}"><i class="material-icons">edit</i></a><a href="#!" class="btn-small waves-effect waves-light red delete-task-btn" data-task-id="${task.id}"><i class="material-icons">delete</i></a>${task.status !== 'completed' ? `<a href="#!" class="btn-small waves-effect waves-light green complete-task-btn" data-task-id="${task.id}" data-assigned-to-id="${task.assigned_to_id || ''}"><i class="material-icons">check</i></a>` : ''}</span></div>`;
+                li.innerHTML = `<div style="display: flex; align-items: center; justify-content: space-between;"><span>${task.description} - ${task.points} points ✨</span><span class="quest-actions"><span class="quest-status-text">Assigné à: ${assignedToName} - Statut: ${task.status === 'completed' ? completedBy : task.status === 'expired' ? 'Expirée ⌛' : 'En cours ⏳'}</span><a href="#!" class="btn-small waves-effect waves-light blue edit-task-btn" data-task-id="${task.id}"><i class="material-icons">edit</i></a><a href="#!" class="btn-small waves-effect waves-light red delete-task-btn" data-task-id="${task.id}"><i class="material-icons">delete</i></a>${task.status === 'pending' ? `<a href="#!" class="btn-small waves-effect waves-light green complete-task-btn" data-task-id="${task.id}" data-assigned-to-id="${task.assigned_to_id || ''}"><i class="material-icons">check</i></a>` : ''}</span></div>`;
                 tasksList.appendChild(li);
             }
 
             // Attach event listeners for buttons
             attachTaskButtonListeners();
         }
-        hideLoading(tasksLoading);
+        if (loadMoreTasksButton) {
+            loadMoreTasksButton.style.display = nextTasksCursor ? '' : 'none';
+        }
     }
 
     function attachTaskButtonListeners() {
@@ -282,7 +322,9 @@ document.addEventListener('DOMContentLoaded', () => {
                 const instance = M.FormSelect.getInstance(selectElement);
                 if (instance) instance.destroy();
                 M.FormSelect.init(selectElement);
-                loadTasks();
+                if (!liveUpdates) {
+                    loadTasks();
+                }
             }
         });
     }
@@ -363,7 +405,9 @@ document.addEventListener('DOMContentLoaded', () => {
             if (result) {
                 M.toast({html: 'Quête validée! 🎉', classes: 'green darken-1'});
                 completeTaskModalInstance.close();
-                loadTasks();
+                if (!liveUpdates) {
+                    loadTasks();
+                }
             }
         });
     }
@@ -421,8 +465,64 @@ document.addEventListener('DOMContentLoaded', () => {
         });
     });
 
+    // Live updates (Server-Sent Events)
+    let liveUpdates = false;
+
+    function connectLiveUpdates() {
+        if (!window.EventSource) return;
+        const source = new EventSource('/api/v1/events');
+        let interrupted = false;
+
+        source.addEventListener('open', () => {
+            liveUpdates = true;
+            if (interrupted) {
+                // Some events may have been missed while disconnected
+                interrupted = false;
+                loadTasks();
+                loadRewards();
+            }
+        });
+        source.addEventListener('error', () => {
+            liveUpdates = false;
+            interrupted = true;
+        });
+        source.addEventListener('resync', () => {
+            loadTasks();
+            loadRewards();
+        });
+
+        source.addEventListener('task.created', (event) => {
+            const data = JSON.parse(event.data);
+            if (!questTasks.some(t => t.id === data.task.id)) {
+                questTasks.unshift({ completions: [], ...data.task });
+                renderTasks();
+            }
+        });
+        source.addEventListener('tasks.expired', (event) => {
+            const data = JSON.parse(event.data);
+            const expired = new Set(data.task_ids);
+            questTasks.forEach(task => {
+                if (expired.has(task.id)) task.status = 'expired';
+            });
+            renderTasks();
+        });
+        // Occurrences générées en lot : le détail n'est pas diffusé, on recharge
+        source.addEventListener('tasks.generated', () => loadTasks());
+        source.addEventListener('task.completed', (event) => {
+            const data = JSON.parse(event.data);
+            const task = questTasks.find(t => t.id === data.task_id);
+            if (task) {
+                task.status = 'completed';
+                task.completed_at = data.completed_at;
+                task.completions = data.completions;
+                renderTasks();
+            }
+        });
+    }
+
     // Initial loads
     populateMemberDropdowns();
     loadTasks();
     loadRewards();
+    connectLiveUpdates();
 });
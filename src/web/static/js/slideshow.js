@@ -0,0 +1,262 @@
+// src/web/static/js/slideshow.js
+//
+// Slideshow rendu sur place : toutes les diapositives et leurs données viennent de
+// /api/v1/slideshow/manifest (redemandé avec If-None-Match, 304 tant que rien n'a changé).
+// Deux emplacements alternent : pendant qu'une diapositive est affichée, la suivante est
+// rendue dans l'emplacement caché, puis les deux sont échangés sans recharger de document.
+// `?mode=iframe` conserve l'ancien affichage (une page par diapositive dans une iframe).
+document.addEventListener('DOMContentLoaded', () => {
+    const container = document.getElementById('slideshow');
+    const progressBar = document.querySelector('.determinate');
+    const params = new URLSearchParams(window.location.search);
+    const slideDuration = parseInt(params.get('duration'), 10) || 10000;
+    const iframeMode = params.get('mode') === 'iframe';
+
+    const chartColors = ['#FFC300', '#FF5733', '#C70039', '#900C3F', '#581845', '#2ECC71', '#3498DB', '#F39C12', '#D35400', '#8E44AD'];
+
+    let manifest = null;
+    let manifestEtag = null;
+    let currentIndex = -1;
+    let slots = Array.from(container.querySelectorAll('.slide'));
+    let preparedIndex = null;
+
+    function escapeHtml(value) {
+        return String(value ?? '').replace(/[&<>"']/g, character => ({
+            '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'
+        })[character]);
+    }
+
+    function formatDate(value, options) {
+        return value ? new Date(value).toLocaleDateString('fr-FR', options) : '';
+    }
+
+    function formatDuration(value, unit) {
+        if (!value || !unit) return '';
+        const units = { days: 'jour(s)', weeks: 'semaine(s)', months: 'mois' };
+        return `(${value} ${units[unit] || unit})`;
+    }
+
+    // Manifeste : 304 tant que la version n'a pas changé, le rendu en cours est conservé
+    async function refreshManifest() {
+        const headers = manifestEtag ? { 'If-None-Match': manifestEtag } : {};
+        try {
+            const response = await fetch('/api/v1/slideshow/manifest', { headers, cache: 'no-store' });
+            if (response.status === 304) return false;
+            if (!response.ok) throw new Error(`HTTP error! status: ${response.status}`);
+            const next = await response.json();
+            manifestEtag = response.headers.get('ETag');
+            const changed = !manifest || next.version !== manifest.version;
+            manifest = next;
+            return changed;
+        } catch (error) {
+            console.error('Failed to fetch the slideshow manifest:', error);
+            return false;
+        }
+    }
+
+    // Rendu des diapositives
+
+    function listItems(items, render, emptyText) {
+        if (items.length === 0) return `<li class="collection-item">${emptyText}</li>`;
+        return items.map(render).join('');
+    }
+
+    function renderDashboard(slot, slide) {
+        const snapshot = slide.dashboard;
+        const names = new Map(snapshot.members.map(member => [member.id, member.name]));
+        const groups = new Map();
+        snapshot.tasks.filter(task => task.status === 'pending').forEach(task => {
+            const key = task.assigned_to_id ?? 'family';
+            if (!groups.has(key)) groups.set(key, []);
+            groups.get(key).push(task);
+        });
+
+        slot.innerHTML = `
+            <div class="container">
+                <div class="row">
+                    <div class="col s12 m4">
+                        <h4 class="custom-title center-align">Classement 🏆</h4>
+                        <ul class="collection">
+                            ${listItems(snapshot.leaderboard, entry => `
+                                <li class="collection-item"><div>${entry.rank}. ${escapeHtml(entry.name)}<span class="secondary-content">${entry.total_points} points ✨</span></div></li>
+                            `, 'Aucun héros pour le moment.')}
+                        </ul>
+                    </div>
+                    <div class="col s12 m8">
+                        <h4 class="custom-title center-align">Tableau des Quêtes 📜</h4>
+                        <div class="row">
+                            ${Array.from(groups, ([key, tasks]) => `
+                                <div class="col s12 m6">
+                                    <div class="card-panel ${key === 'family' ? 'grey lighten-4' : 'light-blue lighten-5'} z-depth-1">
+                                        <h5 class="custom-title">${key === 'family' ? 'Famille 👨‍👩‍👧‍👦' : `Quêtes de ${escapeHtml(names.get(key))} 🧑‍🚀`}</h5>
+                                        <ul class="collection">
+                                            ${tasks.map(task => `<li class="collection-item">${escapeHtml(task.description)} 📝 - ${task.points} points ${formatDuration(task.duration_value, task.duration_unit)}</li>`).join('')}
+                                        </ul>
+                                    </div>
+                                </div>
+                            `).join('') || '<p class="center-align">Aucune quête en cours.</p>'}
+                        </div>
+                    </div>
+                </div>
+                <h4 class="custom-title center-align">Récompenses Disponibles 🎁</h4>
+                <ul class="collection">
+                    ${listItems(snapshot.rewards, reward => `
+                        <li class="collection-item"><div>${escapeHtml(reward.name)}<span class="secondary-content">${reward.cost} points</span></div></li>
+                    `, 'Aucune récompense disponible.')}
+                </ul>
+            </div>`;
+    }
+
+    function renderStatistics(slot, slide) {
+        slot.innerHTML = `
+            <div class="container">
+                <h4 class="custom-title center-align">Trésors de la Guilde 💎</h4>
+                <div class="row">
+                    <div class="col s12 m6">
+                        <div class="card-panel amber lighten-5 z-depth-2 chart-card">
+                            <h5 class="custom-title center-align">Collecte de Points 🌟</h5>
+                            <div class="chart-container"><canvas data-chart="points"></canvas></div>
+                        </div>
+                    </div>
+                    <div class="col s12 m6">
+                        <div class="card-panel amber lighten-5 z-depth-2 chart-card">
+                            <h5 class="custom-title center-align">Butins Préférés 🏆</h5>
+                            <div class="chart-container"><canvas data-chart="rewards"></canvas></div>
+                        </div>
+                    </div>
+                </div>
+            </div>`;
+        addChart(slot, slot.querySelector('[data-chart="points"]'), {
+            type: 'bar',
+            data: {
+                labels: slide.points_by_user.map(item => `⭐ ${item.name}`),
+                datasets: [{ data: slide.points_by_user.map(item => item.points), backgroundColor: chartColors, borderWidth: 2, borderRadius: 10 }]
+            },
+            options: { indexAxis: 'y', scales: { x: { beginAtZero: true } }, plugins: { legend: { display: false } } }
+        });
+        addChart(slot, slot.querySelector('[data-chart="rewards"]'), {
+            type: 'doughnut',
+            data: {
+                labels: slide.most_used_rewards.map(item => `🎁 ${item.name}`),
+                datasets: [{ data: slide.most_used_rewards.map(item => item.count), backgroundColor: chartColors.slice().reverse(), borderWidth: 2, borderColor: '#fff8e1' }]
+            },
+            options: { plugins: { legend: { position: 'bottom' } } }
+        });
+    }
+
+    function renderHero(slot, slide) {
+        slot.innerHTML = `
+            <div class="container">
+                <h4 class="custom-title center-align">Profil de ${escapeHtml(slide.member.name)} — ${slide.member.total_points} points ✨</h4>
+                <div class="row">
+                    <div class="col s12 m6">
+                        <h5 class="custom-title">Quêtes en Cours 📜</h5>
+                        <ul class="collection">
+                            ${listItems(slide.pending_tasks, task => `<li class="collection-item">${escapeHtml(task.description)} - <strong>${task.points} pts</strong></li>`, 'Aucune quête en cours.')}
+                        </ul>
+                    </div>
+                    <div class="col s12 m6">
+                        <h5 class="custom-title">Hauts Faits Accomplis ✅</h5>
+                        <ul class="collection">
+                            ${listItems(slide.completed_tasks, task => `<li class="collection-item">${escapeHtml(task.description)} (Terminée le ${formatDate(task.completed_at)})</li>`, 'Aucun haut fait à afficher.')}
+                        </ul>
+                    </div>
+                </div>
+                <div class="card-panel amber lighten-5 z-depth-2 chart-card">
+                    <h5 class="custom-title center-align">Suivi des Points Quotidiens</h5>
+                    <div class="chart-container"><canvas data-chart="daily-points"></canvas></div>
+                </div>
+                <h5 class="custom-title">Trésors Acquis 🎁</h5>
+                <ul class="collection">
+                    ${listItems(slide.claimed_rewards, reward => `<li class="collection-item">${escapeHtml(reward.name)} - <strong>Obtenu le ${formatDate(reward.claimed_at)}</strong></li>`, 'Aucun trésor acquis pour le moment.')}
+                </ul>
+            </div>`;
+        addChart(slot, slot.querySelector('[data-chart="daily-points"]'), {
+            type: 'line',
+            data: {
+                labels: slide.daily_points.map(item => formatDate(item.date, { day: 'numeric', month: 'short' })),
+                datasets: [{
+                    data: slide.daily_points.map(item => item.points),
+                    fill: true,
+                    borderColor: '#3e2723',
+                    backgroundColor: 'rgba(255, 159, 64, 0.2)',
+                    tension: 0.3,
+                    pointBackgroundColor: '#5d4037',
+                    pointRadius: 5
+                }]
+            },
+            options: { scales: { y: { beginAtZero: true } }, plugins: { legend: { display: false } } }
+        });
+    }
+
+    const renderers = { dashboard: renderDashboard, statistics: renderStatistics, hero: renderHero };
+
+    // Graphiques sans animation : les appareils de diffusion peu puissants saccadent sinon
+    function addChart(slot, canvas, config) {
+        if (!window.Chart) return;
+        config.options = { ...config.options, animation: false, responsive: true, maintainAspectRatio: false };
+        slot.charts.push(new Chart(canvas.getContext('2d'), config));
+    }
+
+    function renderInto(slot, index) {
+        slot.charts.forEach(chart => chart.destroy());
+        slot.charts = [];
+        const slide = manifest.slides[index];
+        renderers[slide.type](slot, slide);
+    }
+
+    function startProgressBar() {
+        // Transition CSS : pas de minuterie JavaScript pendant l'affichage
+        progressBar.style.transition = 'none';
+        progressBar.style.width = '0%';
+        void progressBar.offsetWidth;
+        progressBar.style.transition = `width ${slideDuration}ms linear`;
+        progressBar.style.width = '100%';
+    }
+
+    // Prépare la diapositive suivante dans l'emplacement caché
+    function prepareNext() {
+        if (!manifest || manifest.slides.length === 0) return;
+        preparedIndex = (currentIndex + 1) % manifest.slides.length;
+        renderInto(slots[1], preparedIndex);
+    }
+
+    async function showNext() {
+        const changed = await refreshManifest();
+        if (!manifest || manifest.slides.length === 0) return;
+        // Données modifiées ou liste raccourcie : la diapositive préparée est périmée
+        if (changed || preparedIndex === null || preparedIndex >= manifest.slides.length) {
+            prepareNext();
+        }
+        currentIndex = preparedIndex;
+        slots = [slots[1], slots[0]];
+        slots[0].classList.add('active');
+        slots[0].setAttribute('aria-hidden', 'false');
+        slots[1].classList.remove('active');
+        slots[1].setAttribute('aria-hidden', 'true');
+        startProgressBar();
+        // Rendu de la suivante une fois l'affichage de la courante terminé
+        window.requestAnimationFrame(() => setTimeout(prepareNext, 0));
+    }
+
+    function startIframeMode() {
+        container.innerHTML = '<iframe class="slideshow-iframe"></iframe>';
+        const iframe = container.querySelector('iframe');
+        async function loadSlide() {
+            await refreshManifest();
+            if (!manifest || manifest.slides.length === 0) return;
+            currentIndex = (currentIndex + 1) % manifest.slides.length;
+            iframe.src = manifest.slides[currentIndex].url;
+            startProgressBar();
+        }
+        loadSlide();
+        setInterval(loadSlide, slideDuration);
+    }
+
+    if (iframeMode) {
+        startIframeMode();
+        return;
+    }
+    slots.forEach(slot => { slot.charts = []; });
+    showNext().then(() => setInterval(showNext, slideDuration));
+});
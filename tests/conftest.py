@@ -1,20 +1,44 @@
+import os
 import pytest
+import tempfile
+from contextlib import contextmanager
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+from src.core.config import settings
 from src.main import app
-from src.data.database import get_db
+from src.data.database import get_db, get_read_db, instrument_engine
+from src.data.async_database import get_async_db, get_async_read_db
+from src.api.cache import response_cache
+from src.api.leaderboard import leaderboards
 from src.core.models import Base
 
-# Use an in-memory SQLite database for testing
-SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
-# SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:" # Use this for a truly in-memory database
+# No mDNS discovery nor background jobs during tests
+settings.cast_discovery_enabled = False
+settings.task_expiry_sweep_interval = 0
+settings.recurring_tasks_interval = 0
+settings.leaderboard_warm_up = False
+
+# Throwaway SQLite file shared by the sync and async engines, removed when the run ends
+_test_db_dir = tempfile.TemporaryDirectory(prefix="family-companion-tests-")
+SQLALCHEMY_DATABASE_URL = f"sqlite:///{os.path.join(_test_db_dir.name, 'test.db')}"
 
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
 )
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine on the same file; NullPool because each TestClient runs its own event loop
+async_engine = create_async_engine(
+    SQLALCHEMY_DATABASE_URL.replace("sqlite://", "sqlite+aiosqlite://"), poolclass=NullPool
+)
+# Same SQL instrumentation as the application engines (/metrics)
+instrument_engine(engine)
+instrument_engine(async_engine.sync_engine)
+TestingAsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
 @pytest.fixture(name="db_session")
 def db_session_fixture():
     Base.metadata.create_all(bind=engine)  # Create tables
@@ -29,7 +53,50 @@ def db_session_fixture():
 def client_fixture(db_session):
     def override_get_db():
         yield db_session
+    async def override_get_async_db():
+        async with TestingAsyncSessionLocal() as db:
+            yield db
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    # Read-only sessions are covered by test_read_only_sessions.py; here they share the test engines
+    app.dependency_overrides[get_read_db] = override_get_db
+    app.dependency_overrides[get_async_read_db] = override_get_async_db
+    response_cache.clear()
+    # Every test starts from a fresh database: leaderboards are rebuilt on first read
+    leaderboards.clear()
     with TestClient(app) as client:
         yield client
     app.dependency_overrides.clear()
+
+class QueryCounter:
+    """Compte les requêtes SQL émises sur les moteurs de test (synchrone et asynchrone)."""
+
+    def __init__(self):
+        self.statements = []
+
+    @property
+    def count(self):
+        return len(self.statements)
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    @contextmanager
+    def at_most(self, ceiling):
+        """Vérifie qu'un bloc n'émet pas plus de `ceiling` requêtes SQL."""
+        self.statements = []
+        engines = (engine, async_engine.sync_engine)
+        for target in engines:
+            event.listen(target, "before_cursor_execute", self._record)
+        try:
+            yield self
+        finally:
+            for target in engines:
+                event.remove(target, "before_cursor_execute", self._record)
+        assert self.count <= ceiling, (
+            f"{self.count} requêtes SQL émises (plafond : {ceiling}):\n" + "\n".join(self.statements)
+        )
+
+@pytest.fixture(name="query_counter")
+def query_counter_fixture():
+    return QueryCounter()
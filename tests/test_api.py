@@ -1,4 +1,5 @@
-from src.core.models import FamilyMember, Task, Reward
+from src.core import schemas
+from src.core.models import FamilyMember, Task, TaskCompletion, Reward
 
 def test_read_members(client, db_session):
     member1 = FamilyMember(name="Test Member 1", total_points=100)
@@ -358,3 +359,19 @@ def test_get_leaderboard(client, db_session):
     assert len(response.json()) == 2
     assert response.json()[0]["name"] == "Leader 1"
     assert response.json()[1]["name"] == "Leader 2"
+
+def test_task_list_projection_matches_orm_serialization(client, db_session):
+    member = FamilyMember(name="Projection Hero", total_points=0)
+    db_session.add(member)
+    db_session.commit()
+    tasks = [Task(description=f"Quest {i}", points=i, assigned_to_id=member.id) for i in range(3)]
+    tasks[0].completions = [TaskCompletion(member_id=member.id), TaskCompletion(member_id=member.id)]
+    db_session.add_all(tasks)
+    db_session.commit()
+
+    response = client.get("/api/tasks")
+    assert response.status_code == 200
+    # Les lignes projetées donnent le même JSON que les objets ORM validés par le schéma
+    expected = [schemas.TaskResponse.model_validate(task).model_dump(mode="json") for task in db_session.query(Task).all()]
+    assert sorted(response.json(), key=lambda task: task["id"]) == expected
+    assert len(response.json()[0]["completions"]) == 2
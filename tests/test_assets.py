@@ -0,0 +1,90 @@
+import brotli
+import gzip
+import pytest
+from starlette.applications import Starlette
+from starlette.routing import Mount
+from starlette.testclient import TestClient
+from src.web.assets import IMMUTABLE_CACHE_CONTROL, AssetFiles, AssetManifest, build_assets, preferred_encoding
+
+SCRIPT = b"console.log('Heros du Foyer');\n" * 100
+
+@pytest.fixture(name="build")
+def build_fixture(tmp_path):
+    source = tmp_path / "static"
+    (source / "js").mkdir(parents=True)
+    (source / "js" / "app.js").write_bytes(SCRIPT)
+    (source / "logo.png").write_bytes(b"\x89PNG fake image")
+    target = tmp_path / "build"
+    manifest = build_assets(str(source), str(target))
+    return source, target, manifest
+
+@pytest.fixture(name="asset_client")
+def asset_client_fixture(build):
+    source, target, _ = build
+    app = Starlette(routes=[Mount("/static", AssetFiles(AssetManifest(str(target)), directory=str(source)))])
+    with TestClient(app) as client:
+        yield client
+
+def test_build_fingerprints_and_precompresses(build):
+    _, target, manifest = build
+    entry = manifest["js/app.js"]
+    assert entry["path"].startswith("js/app.") and entry["path"].endswith(".js")
+    assert entry["encodings"] == ["br", "gzip"]
+    assert (target / entry["path"]).read_bytes() == SCRIPT
+    assert gzip.decompress((target / (entry["path"] + ".gz")).read_bytes()) == SCRIPT
+    assert brotli.decompress((target / (entry["path"] + ".br")).read_bytes()) == SCRIPT
+    # Les images ne sont pas recompressées
+    assert manifest["logo.png"]["encodings"] == []
+
+def test_build_warns_without_brotli(build, tmp_path, monkeypatch, caplog):
+    source, _, _ = build
+    monkeypatch.setattr("src.web.assets.brotli", None)
+
+    manifest = build_assets(str(source), str(tmp_path / "gzip-only"))
+
+    assert manifest["js/app.js"]["encodings"] == ["gzip"]
+    assert "brotli is not installed" in caplog.text
+
+def test_build_is_reproducible(build, tmp_path):
+    source, target, manifest = build
+    assert build_assets(str(source), str(tmp_path / "again")) == manifest
+    path = manifest["js/app.js"]["path"] + ".gz"
+    assert (tmp_path / "again" / path).read_bytes() == (target / path).read_bytes()
+
+def test_manifest_urls(build):
+    _, target, manifest = build
+    assets = AssetManifest(str(target))
+    assert assets.url("js/app.js") == "/static/" + manifest["js/app.js"]["path"]
+    # Fichier absent du manifeste, ou pas de build : le chemin source
+    assert assets.url("js/other.js") == "/static/js/other.js"
+    assert AssetManifest(str(target / "missing")).url("js/app.js") == "/static/js/app.js"
+
+def test_serves_precompressed_variant(asset_client, build):
+    url = "/static/" + build[2]["js/app.js"]["path"]
+    response = asset_client.get(url, headers={"Accept-Encoding": "gzip, deflate"})
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.headers["content-type"].startswith("text/javascript")
+    assert response.content == SCRIPT  # décompressé par le client
+
+    identity = asset_client.get(url, headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in identity.headers
+    assert identity.content == SCRIPT
+
+    revalidated = asset_client.get(url, headers={"Accept-Encoding": "gzip", "If-None-Match": response.headers["etag"]})
+    assert revalidated.status_code == 304
+
+def test_source_files_are_still_served(asset_client):
+    response = asset_client.get("/static/js/app.js")
+    assert response.status_code == 200
+    assert response.headers.get("cache-control") != IMMUTABLE_CACHE_CONTROL
+    assert asset_client.get("/static/js/missing.js").status_code == 404
+
+def test_preferred_encoding():
+    assert preferred_encoding("gzip, deflate, br", ["br", "gzip"]) == "br"
+    assert preferred_encoding("gzip, br;q=0", ["br", "gzip"]) == "gzip"
+    assert preferred_encoding("br", ["gzip"]) is None
+    assert preferred_encoding("*", ["gzip"]) == "gzip"
+    assert preferred_encoding("", ["br", "gzip"]) is None
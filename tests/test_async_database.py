@@ -0,0 +1,87 @@
+import asyncio
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.pool import NullPool
+from src.core import schemas
+from src.core.models import Base
+from src.data import async_database, async_statistics, database
+from src.data.async_database import create_async_sqlite_engine
+
+@pytest.fixture(name="async_session_factory")
+def async_session_factory_fixture(tmp_path):
+    engine = create_async_sqlite_engine(f"sqlite:///{tmp_path / 'async.db'}", poolclass=NullPool)
+
+    async def create_schema():
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+
+    asyncio.run(create_schema())
+    yield async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
+    asyncio.run(engine.dispose())
+
+def test_async_write_then_read(async_session_factory):
+    async def scenario():
+        async with async_session_factory() as db:
+            hero = await async_database.create_family_member(db, "Async Hero")
+            task = await async_database.create_task(db, "Async Quest", 40, assigned_to_id=hero.id)
+            completed = await async_database.complete_task(
+                db, task.id, [schemas.TaskCompletionData(member_id=hero.id, percentage=100)]
+            )
+            reward = await async_database.create_reward(db, "Async Cookie", 15)
+            claimed = await async_database.claim_reward(db, hero.id, reward.id)
+            return hero.id, completed, claimed
+
+    hero_id, completed, claimed = asyncio.run(scenario())
+    assert completed.status == "completed"
+    assert len(completed.completions) == 1
+    assert claimed.total_points == 25
+
+    async def read_back():
+        async with async_session_factory() as db:
+            return (
+                await async_database.get_family_members(db),
+                await async_database.get_task_rows_for_member_by_status(db, hero_id, "completed"),
+                await async_database.get_daily_points_for_member(db, hero_id, "weekly"),
+                await async_database.get_claimed_rewards_for_member(db, hero_id),
+                await async_statistics.get_points_by_user_per_period(db, "weekly"),
+                await async_statistics.get_most_used_rewards(db),
+            )
+
+    members, tasks, daily_points, claimed_rewards, points_stats, rewards_stats = asyncio.run(read_back())
+    assert [m.name for m in members] == ["Async Hero"]
+    assert len(members[0].completions) == 1
+    assert [t["description"] for t in tasks] == ["Async Quest"]
+    assert [d["points"] for d in daily_points] == [40]
+    assert [name for name, _ in claimed_rewards] == ["Async Cookie"]
+    assert points_stats == [{"name": "Async Hero", "points": 40}]
+    assert rewards_stats == [{"name": "Async Cookie", "count": 1}]
+
+def test_async_delete_returns_false_when_missing(async_session_factory):
+    async def scenario():
+        async with async_session_factory() as db:
+            return (
+                await async_database.delete_family_member(db, 999),
+                await async_database.delete_task(db, 999),
+                await async_database.delete_reward(db, 999),
+            )
+
+    assert asyncio.run(scenario()) == (False, False, False)
+
+def test_async_engine_applies_pragmas(async_session_factory):
+    async def scenario():
+        async with async_session_factory() as db:
+            return (await db.execute(text("PRAGMA journal_mode"))).scalar()
+
+    assert asyncio.run(scenario()) == "wal"
+
+def test_async_writes_begin_immediate_transactions(async_session_factory):
+    def begin(db):
+        database.begin_immediate(db)
+        return db.connection().connection.driver_connection.in_transaction
+
+    async def scenario():
+        async with async_session_factory() as db:
+            return await db.run_sync(begin)
+
+    assert asyncio.run(scenario())
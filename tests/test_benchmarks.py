@@ -0,0 +1,52 @@
+from datetime import datetime, UTC
+from sqlalchemy import func
+from benchmarks.compare import compare_results
+from benchmarks.generator import HouseholdSpec, generate_household
+from benchmarks.run import run_benchmarks
+from src.core.models import FamilyMember, MemberDailyPoints, PointsHistory, Task
+
+END = datetime(2024, 6, 1, tzinfo=UTC)
+
+def test_generated_household_is_consistent(db_session):
+    info = generate_household(db_session, HouseholdSpec(members=4, tasks=300, years=1), end=END)
+
+    assert info["rows"]["tasks"] == db_session.query(Task).count() == 300
+    balances = dict(db_session.query(PointsHistory.member_id, func.sum(PointsHistory.points_change)).group_by(PointsHistory.member_id))
+    assert {m.id: m.total_points for m in db_session.query(FamilyMember)} == balances
+    assert all(points >= 0 for points in balances.values())
+    earned = db_session.query(func.sum(MemberDailyPoints.points_earned) - func.sum(MemberDailyPoints.points_spent)).scalar()
+    assert earned == sum(balances.values())
+    assert db_session.query(func.max(PointsHistory.timestamp)).scalar() <= END.replace(tzinfo=None)
+
+def test_generator_is_deterministic(db_session):
+    first = generate_household(db_session, HouseholdSpec(tasks=200, seed=7), end=END)
+    tasks = [(t.points, t.status, t.assigned_to_id) for t in db_session.query(Task).order_by(Task.id)]
+    db_session.close()
+    for table in reversed(FamilyMember.metadata.sorted_tables):
+        db_session.execute(table.delete())
+    db_session.commit()
+
+    second = generate_household(db_session, HouseholdSpec(tasks=200, seed=7), end=END)
+
+    assert first["rows"] == second["rows"]
+    assert [(t.points, t.status, t.assigned_to_id) for t in db_session.query(Task).order_by(Task.id)] == tasks
+
+def test_compare_flags_regressions_above_threshold():
+    baseline = {"results": {"fast": {"median_ms": 0.1}, "slow": {"median_ms": 10.0}, "stable": {"median_ms": 10.0}, "gone": {"median_ms": 1.0}}}
+    current = {"results": {"fast": {"median_ms": 0.3}, "slow": {"median_ms": 13.0}, "stable": {"median_ms": 11.0}, "new": {"median_ms": 1.0}}}
+
+    rows = {row["name"]: row for row in compare_results(current, baseline, threshold=0.2, min_delta_ms=0.5)}
+
+    assert set(rows) == {"fast", "slow", "stable"}
+    assert rows["slow"]["regression"]
+    assert not rows["stable"]["regression"]
+    # Ratio élevé mais écart absolu sous le bruit de mesure
+    assert not rows["fast"]["regression"]
+
+def test_run_benchmarks_smoke():
+    results = run_benchmarks(HouseholdSpec(members=3, tasks=50, years=0.5), repeat=1)
+
+    assert results["household"]["rows"]["tasks"] == 50
+    assert "database.complete_task" in results["results"]
+    assert "GET /api/v1/dashboard" in results["results"]
+    assert all(result["runs"] == 1 for result in results["results"].values())
@@ -0,0 +1,127 @@
+import threading
+import time
+import uuid
+import pytest
+from pychromecast.models import CastInfo, HostServiceInfo
+from src.api import caster
+from src.api.cast_discovery import ChromecastRegistry
+
+LIVING_ROOM = uuid.UUID("11111111-1111-1111-1111-111111111111")
+KITCHEN = uuid.UUID("22222222-2222-2222-2222-222222222222")
+
+class FakeBrowser:
+    """Remplace CastBrowser : les appareils sont annoncés à la main."""
+
+    def __init__(self, listener, known_hosts):
+        self.listener = listener
+        self.known_hosts = known_hosts
+        self.devices = {}
+        self.started = False
+
+    def start_discovery(self):
+        self.started = True
+
+    def stop_discovery(self):
+        self.started = False
+
+    def announce(self, cast_uuid, name, host):
+        self.devices[cast_uuid] = CastInfo({HostServiceInfo(host, 8009)}, cast_uuid, "Chromecast", name, host, 8009, "cast", "Google")
+        self.listener.add_cast(cast_uuid, name)
+
+class FakeCast:
+    def __init__(self, info):
+        self.info = info
+        self.name = info.friendly_name
+
+    def disconnect(self, timeout=None):
+        pass
+
+@pytest.fixture(name="registry_factory")
+def registry_factory_fixture(tmp_path):
+    created = []
+
+    def factory(lookup_timeout=2):
+        browsers = []
+        connections = []
+
+        def browser_factory(listener, known_hosts):
+            browser = FakeBrowser(listener, known_hosts)
+            browsers.append(browser)
+            return browser
+
+        def connect(info):
+            time.sleep(0.05)  # une connexion prend du temps
+            connections.append(info)
+            return FakeCast(info)
+
+        registry = ChromecastRegistry(
+            known_hosts_path=str(tmp_path / "chromecasts.json"),
+            browser_factory=browser_factory,
+            connect=connect,
+            lookup_timeout=lookup_timeout,
+        )
+        registry.start()
+        created.append(registry)
+        return registry, browsers[0], connections
+
+    yield factory
+    for registry in created:
+        registry.stop()
+
+def test_devices_are_listed_from_memory(registry_factory):
+    registry, browser, _ = registry_factory()
+    assert registry.devices() == []
+    browser.announce(LIVING_ROOM, "Salon", "192.168.1.20")
+    browser.announce(KITCHEN, "Cuisine", "192.168.1.21")
+    assert registry.devices() == [
+        {"name": "Cuisine", "uuid": str(KITCHEN)},
+        {"name": "Salon", "uuid": str(LIVING_ROOM)},
+    ]
+
+def test_concurrent_lookups_share_one_connection(registry_factory):
+    registry, browser, connections = registry_factory()
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(registry.get_chromecast(str(LIVING_ROOM)))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.1)
+    browser.announce(LIVING_ROOM, "Salon", "192.168.1.20")
+    for thread in threads:
+        thread.join()
+
+    assert len(connections) == 1
+    assert len(results) == 8
+    assert all(cast is results[0] for cast in results)
+    assert registry.get_chromecast(str(LIVING_ROOM)) is results[0]
+
+def test_unknown_device_times_out(registry_factory):
+    registry, _, connections = registry_factory(lookup_timeout=0.1)
+    assert registry.get_chromecast(str(KITCHEN)) is None
+    assert connections == []
+
+def test_known_hosts_allow_cold_start_without_discovery(registry_factory):
+    registry, browser, _ = registry_factory()
+    browser.announce(LIVING_ROOM, "Salon", "192.168.1.20")
+    registry.stop()
+
+    cold_registry, cold_browser, connections = registry_factory(lookup_timeout=0.1)
+    assert cold_browser.known_hosts == ["192.168.1.20"]
+    assert cold_registry.devices() == [{"name": "Salon", "uuid": str(LIVING_ROOM)}]
+    assert cold_registry.get_chromecast(str(LIVING_ROOM)) is not None
+    assert connections[0].host == "192.168.1.20"
+
+def test_cast_devices_endpoint_uses_registry(client, registry_factory, monkeypatch):
+    registry, browser, _ = registry_factory()
+    browser.announce(LIVING_ROOM, "Salon", "192.168.1.20")
+    monkeypatch.setattr(caster, "cast_registry", registry)
+
+    response = client.get("/api/v1/cast/devices")
+    assert response.status_code == 200
+    assert response.json() == [{"name": "Salon", "uuid": str(LIVING_ROOM)}]
+
+def test_start_cast_unknown_device_returns_404(client, registry_factory, monkeypatch):
+    registry, _, _ = registry_factory(lookup_timeout=0.1)
+    monkeypatch.setattr(caster, "cast_registry", registry)
+
+    response = client.post("/api/v1/cast/start", json={"device_uuid": str(KITCHEN), "url": "http://example/"})
+    assert response.status_code == 404
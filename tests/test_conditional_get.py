@@ -0,0 +1,46 @@
+import pytest
+from src.core.models import FamilyMember, Task, Reward
+
+@pytest.mark.parametrize("url", ["/api/members", "/api/leaderboard", "/api/tasks", "/api/rewards"])
+def test_unchanged_list_answers_304_without_queries(client, db_session, query_counter, url):
+    hero = FamilyMember(name="Hero", total_points=10)
+    db_session.add_all([hero, Reward(name="Glace", cost=5, description=None)])
+    db_session.commit()
+    db_session.add(Task(description="Quest", points=10, assigned_to_id=hero.id))
+    db_session.commit()
+
+    first = client.get(url)
+    etag = first.headers["ETag"]
+    assert first.status_code == 200
+    assert first.headers["Cache-Control"] == "no-cache"
+
+    with query_counter.at_most(0):
+        response = client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["ETag"] == etag
+
+def test_write_changes_etag(client, db_session):
+    etag = client.get("/api/members").headers["ETag"]
+
+    client.post("/api/members", json={"name": "Nouveau"})
+
+    response = client.get("/api/members", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert [m["name"] for m in response.json()] == ["Nouveau"]
+
+def test_write_on_other_table_keeps_etag(client, db_session):
+    etag = client.get("/api/rewards").headers["ETag"]
+
+    client.post("/api/members", json={"name": "Nouveau"})
+
+    assert client.get("/api/rewards", headers={"If-None-Match": etag}).status_code == 304
+
+def test_etag_depends_on_query(client, db_session):
+    all_tasks = client.get("/api/tasks").headers["ETag"]
+    recent = client.get("/api/tasks?created_after=2024-01-01T00:00:00")
+
+    assert recent.headers["ETag"] != all_tasks
+    assert client.get("/api/tasks?created_after=2024-01-01T00:00:00", headers={"If-None-Match": recent.headers["ETag"]}).status_code == 304
+    assert client.get("/api/tasks", headers={"If-None-Match": f'"other", {all_tasks}'}).status_code == 304
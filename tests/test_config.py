@@ -0,0 +1,45 @@
+import pytest
+from sqlalchemy import text
+from src.core.config import Settings
+from src.data.database import create_sqlite_engine
+
+def test_settings_defaults(monkeypatch):
+    for name in ("DATABASE_URL", "SQLITE_JOURNAL_MODE", "SQLITE_SYNCHRONOUS", "DB_POOL_SIZE"):
+        monkeypatch.delenv(name, raising=False)
+    settings = Settings()
+    assert settings.database_url == "sqlite:///./db/heros_du_foyer.db"
+    assert settings.sqlite_journal_mode == "WAL"
+    assert settings.sqlite_synchronous == "NORMAL"
+    assert settings.db_pool_size == 5
+
+def test_settings_read_environment(monkeypatch):
+    monkeypatch.setenv("DATABASE_URL", "sqlite:///./autre.db")
+    monkeypatch.setenv("SQLITE_JOURNAL_MODE", "delete")
+    monkeypatch.setenv("SQLITE_BUSY_TIMEOUT", "1500")
+    monkeypatch.setenv("DB_POOL_SIZE", "12")
+    settings = Settings()
+    assert settings.database_url == "sqlite:///./autre.db"
+    assert settings.sqlite_journal_mode == "DELETE"
+    assert settings.sqlite_busy_timeout == 1500
+    assert settings.db_pool_size == 12
+
+@pytest.mark.parametrize("name, value", [
+    ("SQLITE_JOURNAL_MODE", "wal; DROP TABLE tasks"),
+    ("SQLITE_SYNCHRONOUS", "sometimes"),
+    ("SQLITE_MMAP_SIZE", "beaucoup"),
+])
+def test_settings_reject_invalid_values(monkeypatch, name, value):
+    monkeypatch.setenv(name, value)
+    with pytest.raises(ValueError):
+        Settings()
+
+def test_engine_applies_pragmas_on_connect(tmp_path):
+    engine = create_sqlite_engine(f"sqlite:///{tmp_path / 'pragmas.db'}")
+    try:
+        with engine.connect() as connection:
+            assert connection.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+            assert connection.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+            assert connection.execute(text("PRAGMA busy_timeout")).scalar() == 5000
+            assert connection.execute(text("PRAGMA cache_size")).scalar() == -16000
+    finally:
+        engine.dispose()
@@ -0,0 +1,52 @@
+from src.core import schemas
+from src.core.models import FamilyMember, Task, Reward, PointsHistory, MemberDailyPoints
+from src.data.database import complete_task, claim_reward
+from src.data.daily_points import rebuild_member_daily_points
+from datetime import datetime, timedelta, UTC
+
+def _rollup(db_session):
+    db_session.expire_all()
+    return {
+        (row.member_id, row.day): (row.points_earned, row.points_spent)
+        for row in db_session.query(MemberDailyPoints).all()
+    }
+
+def test_complete_and_claim_update_rollup(db_session):
+    hero = FamilyMember(name="Rollup Hero", total_points=0)
+    sidekick = FamilyMember(name="Rollup Sidekick", total_points=0)
+    reward = Reward(name="Rollup Cookie", cost=10)
+    db_session.add_all([hero, sidekick, reward])
+    db_session.commit()
+    task = Task(description="Shared Quest", points=50)
+    db_session.add(task)
+    db_session.commit()
+
+    complete_task(db_session, task.id, [
+        schemas.TaskCompletionData(member_id=hero.id, percentage=60),
+        schemas.TaskCompletionData(member_id=sidekick.id, percentage=40),
+    ])
+    claim_reward(db_session, hero.id, reward.id)
+
+    today = datetime.now(UTC).date()
+    assert _rollup(db_session) == {
+        (hero.id, today): (30, 10),
+        (sidekick.id, today): (20, 0),
+    }
+
+def test_rebuild_matches_incremental_rollup(db_session):
+    hero = FamilyMember(name="Backfill Hero", total_points=0)
+    db_session.add(hero)
+    db_session.commit()
+    now = datetime.now(UTC)
+    db_session.add_all([
+        PointsHistory(member_id=hero.id, points_change=10, reason="a", timestamp=now - timedelta(days=400)),
+        PointsHistory(member_id=hero.id, points_change=5, reason="b", timestamp=now - timedelta(days=1)),
+        PointsHistory(member_id=hero.id, points_change=7, reason="c", timestamp=now - timedelta(days=1)),
+        PointsHistory(member_id=hero.id, points_change=-4, reason="d", timestamp=now - timedelta(days=1)),
+    ])
+    db_session.commit()
+    incremental = _rollup(db_session)
+
+    assert incremental[(hero.id, (now - timedelta(days=1)).date())] == (12, 4)
+    assert rebuild_member_daily_points(db_session) == 2
+    assert _rollup(db_session) == incremental
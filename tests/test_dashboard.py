@@ -0,0 +1,61 @@
+from src.core.models import FamilyMember, Task, TaskCompletion, Reward
+from datetime import datetime, timedelta, UTC
+
+def _seed(db_session):
+    alice = FamilyMember(name="Alice", total_points=50)
+    bob = FamilyMember(name="bob", total_points=80)
+    chloe = FamilyMember(name="Chloé", total_points=50)
+    db_session.add_all([alice, bob, chloe])
+    db_session.commit()
+
+    recent = Task(description="Sortir les poubelles", points=10, assigned_to_id=alice.id, status='completed')
+    recent.completions.append(TaskCompletion(member_id=alice.id))
+    old = Task(description="Ranger le garage", points=30, created_at=datetime.now(UTC) - timedelta(days=30))
+    db_session.add_all([recent, old, Reward(name="Cinéma", cost=40, description=None)])
+    db_session.commit()
+    return alice, bob, chloe
+
+def test_dashboard_snapshot(client, db_session):
+    alice, _, _ = _seed(db_session)
+
+    response = client.get("/api/v1/dashboard")
+    assert response.status_code == 200
+    data = response.json()
+
+    assert [(e["name"], e["rank"]) for e in data["leaderboard"]] == [("bob", 1), ("Alice", 2), ("Chloé", 2)]
+    assert [m["name"] for m in data["members"]] == ["Alice", "bob", "Chloé"]
+    assert [t["description"] for t in data["tasks"]] == ["Sortir les poubelles"]
+    assert data["tasks"][0]["completions"][0]["member_id"] == alice.id
+    assert [r["name"] for r in data["rewards"]] == ["Cinéma"]
+
+def test_dashboard_days_window(client, db_session):
+    _seed(db_session)
+
+    response = client.get("/api/v1/dashboard?days=31")
+    assert len(response.json()["tasks"]) == 2
+    assert client.get("/api/v1/dashboard?days=0").status_code == 422
+
+def test_dashboard_is_invalidated_by_writes(client, db_session):
+    alice, _, _ = _seed(db_session)
+    client.get("/api/v1/dashboard")
+
+    client.post("/api/tasks", json={"description": "Arroser les plantes", "points": 5, "assigned_to_id": alice.id})
+
+    tasks = client.get("/api/v1/dashboard").json()["tasks"]
+    assert "Arroser les plantes" in [t["description"] for t in tasks]
+
+def test_dashboard_has_bounded_query_count(client, db_session, query_counter):
+    for i in range(20):
+        hero = FamilyMember(name=f"Hero {i}", total_points=i)
+        db_session.add(hero)
+        db_session.flush()
+        task = Task(description=f"Quest {i}", points=10, assigned_to_id=hero.id, status='completed')
+        task.completions.append(TaskCompletion(member_id=hero.id))
+        db_session.add_all([task, Reward(name=f"Reward {i}", cost=10, description=None)])
+    db_session.commit()
+    db_session.expunge_all()
+
+    with query_counter.at_most(4):
+        response = client.get("/api/v1/dashboard")
+    assert response.status_code == 200
+    assert len(response.json()["tasks"]) == 20
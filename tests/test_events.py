@@ -0,0 +1,120 @@
+import asyncio
+import json
+import threading
+import pytest
+from src.api.events import format_sse
+from src.core.events import EventBroker
+from src.core.models import FamilyMember, Task, Reward
+from src.data import changes
+
+@pytest.fixture(name="published_events")
+def published_events_fixture():
+    events = []
+    changes.on_event(events.append)
+    yield events
+    changes._event_listeners.remove(events.append)
+
+def test_broker_delivers_events_published_from_other_threads():
+    async def scenario():
+        broker = EventBroker(max_queue=10)
+        subscription = broker.subscribe()
+        thread = threading.Thread(target=broker.publish, args=({"type": "task.created", "task": {"id": 1}},))
+        thread.start()
+        thread.join()
+        event = await asyncio.wait_for(subscription.get(), timeout=1)
+        broker.unsubscribe(subscription)
+        return event, broker.subscriber_count
+
+    event, subscriber_count = asyncio.run(scenario())
+    assert event == {"id": 1, "type": "task.created", "task": {"id": 1}}
+    assert subscriber_count == 0
+
+def test_slow_subscriber_gets_a_single_resync_event():
+    async def scenario():
+        broker = EventBroker(max_queue=3)
+        subscription = broker.subscribe()
+        for i in range(10):
+            broker.publish({"type": "member.points", "member_id": 1, "total_points": i})
+        await asyncio.sleep(0)  # laisse la boucle livrer les événements
+        received = []
+        while not subscription.queue.empty():
+            received.append(subscription.queue.get_nowait())
+        return received, subscription.overflows
+
+    received, overflows = asyncio.run(scenario())
+    assert overflows == 3
+    assert [event["type"] for event in received] == ["resync"]
+
+def test_format_sse():
+    event = {"id": 7, "type": "reward.claimed", "member_id": 1, "reward_id": 2, "cost": 30}
+    frame = format_sse(event)
+    assert frame.startswith("id: 7\nevent: reward.claimed\ndata: ")
+    assert frame.endswith("\n\n")
+    assert json.loads(frame.split("data: ", 1)[1]) == {"member_id": 1, "reward_id": 2, "cost": 30}
+
+def test_write_endpoints_publish_compact_events(client, db_session, published_events):
+    member = FamilyMember(name="Evented Hero", total_points=100)
+    reward = Reward(name="Evented Reward", cost=30)
+    db_session.add_all([member, reward])
+    db_session.commit()
+
+    task_id = client.post("/api/tasks", json={"description": "Evented Quest", "points": 20, "assigned_to_id": member.id}).json()["id"]
+    client.post(f"/api/tasks/{task_id}/complete", json={"completions": [{"member_id": member.id, "percentage": 100}]})
+    client.post("/api/rewards/claim", json={"member_id": member.id, "reward_id": reward.id})
+
+    assert [event["type"] for event in published_events] == [
+        "task.created",
+        "task.completed",
+        "member.points",
+        "reward.claimed",
+        "member.points",
+    ]
+    created, completed, earned, claimed, spent = published_events
+    assert created["task"]["id"] == task_id
+    assert created["task"]["status"] == "pending"
+    assert completed["completions"] == [{"member_id": member.id, "points": 20}]
+    assert earned == {"type": "member.points", "member_id": member.id, "total_points": 120, "version": 1}
+    assert claimed == {"type": "reward.claimed", "member_id": member.id, "reward_id": reward.id, "cost": 30}
+    assert (spent["total_points"], spent["version"]) == (90, 2)
+
+def test_task_and_reward_edits_publish_events(client, db_session, published_events):
+    task = Task(description="Old Quest", points=10)
+    reward = Reward(name="Old Reward", cost=30)
+    db_session.add_all([task, reward])
+    db_session.commit()
+
+    client.put(f"/api/tasks/{task.id}", json={"description": "New Quest", "points": 15})
+    client.delete(f"/api/tasks/{task.id}")
+    new_reward_id = client.post("/api/rewards", json={"name": "New Reward", "cost": 10, "description": None}).json()["id"]
+    client.put(f"/api/rewards/{reward.id}", json={"name": "Old Reward", "cost": 25})
+    client.delete(f"/api/rewards/{reward.id}")
+
+    assert [event["type"] for event in published_events] == [
+        "task.updated", "task.deleted", "reward.created", "reward.updated", "reward.deleted",
+    ]
+    updated, deleted, created, reward_updated, reward_deleted = published_events
+    assert (updated["task"]["description"], updated["task"]["points"]) == ("New Quest", 15)
+    assert deleted == {"type": "task.deleted", "task_id": task.id}
+    assert created["reward"] == {"id": new_reward_id, "name": "New Reward", "cost": 10, "description": None}
+    assert reward_updated["reward"]["cost"] == 25
+    assert reward_deleted == {"type": "reward.deleted", "reward_id": reward.id}
+
+def test_failed_write_publishes_nothing(client, db_session, published_events):
+    member = FamilyMember(name="Poor Hero", total_points=0)
+    task = Task(description="Shared Quest", points=20)
+    db_session.add_all([member, task])
+    db_session.commit()
+
+    response = client.post(f"/api/tasks/{task.id}/complete", json={"completions": [{"member_id": member.id, "percentage": 50}]})
+    assert response.status_code == 400
+    assert published_events == []
+
+def test_subscribers_only_receive_their_topic():
+    async def scenario():
+        broker = EventBroker(max_queue=10)
+        martin, dupont, everyone = broker.subscribe("martin"), broker.subscribe("dupont"), broker.subscribe()
+        broker.publish({"type": "resync"}, topic="martin")
+        await asyncio.sleep(0)
+        return martin.queue.qsize(), dupont.queue.qsize(), everyone.queue.qsize()
+
+    assert asyncio.run(scenario()) == (1, 0, 1)
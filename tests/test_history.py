@@ -0,0 +1,102 @@
+import asyncio
+import csv
+import io
+import json
+from datetime import datetime, timedelta, UTC
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.pool import NullPool
+from src.core.models import FamilyMember, PointsHistory
+from src.data import async_database
+from src.data.async_database import create_async_sqlite_engine, get_async_read_db
+from src.main import app
+
+def _seed(db_session, entries=5):
+    alice = FamilyMember(name="Alice", total_points=0)
+    bob = FamilyMember(name="Bob", total_points=0)
+    db_session.add_all([alice, bob])
+    db_session.commit()
+    base = datetime(2024, 3, 1, tzinfo=UTC)
+    db_session.add_all(
+        PointsHistory(member_id=alice.id, points_change=i + 1, reason=f"Quest {i}", timestamp=base + timedelta(hours=i // 2))
+        for i in range(entries)
+    )
+    db_session.add(PointsHistory(member_id=bob.id, points_change=-7, reason="Reward 'Glace' claimed", timestamp=base))
+    db_session.commit()
+    return alice, bob
+
+def test_history_pages(client, db_session):
+    alice, _ = _seed(db_session)
+
+    reasons, cursor = [], None
+    while True:
+        url = f"/api/v1/members/{alice.id}/history?limit=2" + (f"&cursor={cursor}" if cursor else "")
+        data = client.get(url).json()
+        reasons += [entry["reason"] for entry in data["items"]]
+        cursor = data["next_cursor"]
+        if cursor is None:
+            break
+
+    assert reasons == ["Quest 4", "Quest 3", "Quest 2", "Quest 1", "Quest 0"]
+
+def test_history_unknown_member(client, db_session):
+    assert client.get("/api/v1/members/999/history").status_code == 404
+    assert client.get("/api/v1/members/999/history/export").status_code == 404
+
+def test_export_member_ndjson(client, db_session):
+    alice, _ = _seed(db_session)
+
+    response = client.get(f"/api/v1/members/{alice.id}/history/export")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["reason"] for line in lines] == [f"Quest {i}" for i in range(5)]
+    assert lines[0]["member_name"] == "Alice"
+    assert lines[0]["timestamp"] == "2024-03-01T00:00:00"
+
+def test_export_family_csv(client, db_session):
+    _seed(db_session)
+
+    response = client.get("/api/v1/history/export?format=csv")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "text/csv; charset=utf-8"
+    assert 'filename="points_history.csv"' in response.headers["content-disposition"]
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert len(rows) == 6
+    assert {row["member_name"] for row in rows} == {"Alice", "Bob"}
+    assert sum(int(row["points_change"]) for row in rows) == 15 - 7
+
+def test_export_streams_from_its_own_session(client, db_session):
+    alice, _ = _seed(db_session)
+
+    def closed_session_stream(*args, **kwargs):
+        raise AssertionError("Export lu depuis la session de la requête")
+
+    # Comme avec FastAPI < 0.118 : la session de la dépendance n'est plus utilisable pendant le corps
+    request_read_db = app.dependency_overrides[get_async_read_db]
+
+    async def read_db_closed_before_the_body():
+        async for db in request_read_db():
+            db.stream = closed_session_stream
+            yield db
+
+    app.dependency_overrides[get_async_read_db] = read_db_closed_before_the_body
+    response = client.get(f"/api/v1/members/{alice.id}/history/export")
+
+    assert response.status_code == 200
+    assert [json.loads(line)["reason"] for line in response.text.splitlines()] == [f"Quest {i}" for i in range(5)]
+
+def test_export_rejects_unknown_format(client, db_session):
+    assert client.get("/api/v1/history/export?format=xml").status_code == 422
+
+def test_stream_reads_in_bounded_batches(db_session):
+    _seed(db_session, entries=25)
+    engine = create_async_sqlite_engine(str(db_session.get_bind().url), poolclass=NullPool)
+
+    async def collect():
+        async with AsyncSession(engine) as db:
+            return [len(batch) async for batch in async_database.stream_points_history(db, batch_size=10)]
+
+    try:
+        assert asyncio.run(collect()) == [10, 10, 6]
+    finally:
+        asyncio.run(engine.dispose())
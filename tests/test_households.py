@@ -0,0 +1,96 @@
+import asyncio
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from src.api.cache import response_cache
+from src.core.config import settings
+from src.core.models import Base, FamilyMember
+from src.data import jobs
+from src.data.households import HouseholdRegistry, UnknownHousehold, household_ids
+from src.main import app
+
+HOUSEHOLDS = ("martin", "dupont")
+
+@pytest.fixture(name="households_dir")
+def households_dir_fixture(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "households_dir", str(tmp_path))
+    for household in HOUSEHOLDS:
+        engine = create_engine(f"sqlite:///{tmp_path / household}.db")
+        Base.metadata.create_all(engine)
+        engine.dispose()
+    yield tmp_path
+    # Les moteurs ouverts pointent vers ce dossier temporaire
+    asyncio.run(jobs.close_household_engines())
+
+@pytest.fixture(name="tenant_client")
+def tenant_client_fixture(households_dir):
+    # Pas de surcharge de get_db : les sessions passent par le routage par foyer
+    app.dependency_overrides.clear()
+    response_cache.clear()
+    with TestClient(app) as client:
+        yield client
+    response_cache.clear()
+
+def test_households_are_isolated(tenant_client):
+    created = tenant_client.post("/api/members", json={"name": "Alice"}, headers={"X-Household": "martin"})
+    assert created.status_code == 201
+
+    assert [m["name"] for m in tenant_client.get("/api/members", headers={"X-Household": "martin"}).json()] == ["Alice"]
+    # Même URL, autre foyer : ni la base ni le cache de réponses ne sont partagés
+    assert tenant_client.get("/api/members", headers={"X-Household": "dupont"}).json() == []
+
+def test_query_parameter_sets_household_cookie(tenant_client):
+    tenant_client.post("/api/members", json={"name": "Bob"}, headers={"X-Household": "dupont"})
+
+    response = tenant_client.get("/api/members?household=dupont")
+    assert [m["name"] for m in response.json()] == ["Bob"]
+    assert "household=dupont" in response.headers["set-cookie"]
+    # Les appels suivants du navigateur portent le cookie
+    assert [m["name"] for m in tenant_client.get("/api/v1/dashboard").json()["members"]] == ["Bob"]
+
+def test_unknown_and_invalid_households(tenant_client):
+    assert tenant_client.get("/api/members", headers={"X-Household": "inconnu"}).status_code == 404
+    assert tenant_client.get("/api/v1/tasks", headers={"X-Household": "inconnu"}).status_code == 404
+    assert tenant_client.get("/api/members", headers={"X-Household": "../secret"}).status_code == 400
+
+def test_jobs_run_on_every_household(households_dir):
+    assert household_ids() == sorted(HOUSEHOLDS)
+    seen = []
+
+    def job(db):
+        seen.append(db.query(FamilyMember).count())
+        return 1
+
+    assert jobs.for_each_household(job) == 2
+    assert seen == [0, 0]
+
+class FakeEngine:
+    def __init__(self, url):
+        self.url = url
+        self.disposed = False
+
+    def dispose(self):
+        self.disposed = True
+
+def test_registry_closes_least_recently_used_engines(households_dir):
+    (households_dir / "lefebvre.db").touch()
+    registry = HouseholdRegistry(FakeEngine, max_open=2)
+
+    martin = registry.get("martin")
+    registry.get("dupont")
+    assert registry.get("martin") is martin
+    lefebvre = registry.get("lefebvre")
+
+    # « dupont » était le moins récemment utilisé
+    assert registry.open_households() == ["martin", "lefebvre"]
+    assert asyncio.run(registry.close_retired()) == 1
+    assert registry.opened == 3
+    assert not martin.disposed
+
+    assert registry.retire_idle(0) == 2
+    asyncio.run(registry.close_retired())
+    assert martin.disposed and lefebvre.disposed
+    assert registry.open_households() == []
+
+    with pytest.raises(UnknownHousehold):
+        registry.get("inconnu")
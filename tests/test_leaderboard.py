@@ -0,0 +1,141 @@
+import random
+from bisect import bisect_left, insort
+from src.api.leaderboard import _warm_up, leaderboards
+from src.core.leaderboard import IndexableSkipList, Leaderboards, RankedLeaderboard
+from src.core.models import FamilyMember
+from src.data.households import current_household
+
+def _ranks(entries):
+    return [(entry["rank"], entry["name"]) for entry in entries]
+
+def test_ties_share_a_rank_and_are_ordered_by_name():
+    board = RankedLeaderboard([(1, "Chloé", 30, 0), (2, "Alice", 50, 0), (3, "Bob", 30, 0), (4, "Dan", 10, 0)])
+
+    assert _ranks(board.top(10)) == [(1, "Alice"), (2, "Bob"), (2, "Chloé"), (4, "Dan")]
+    assert board.rank_of(30) == 2
+    assert board.rank_of(40) == 2
+    assert board.rank_of(0) == 5
+
+def test_around_keeps_the_rank_of_ties_cut_by_the_window():
+    board = RankedLeaderboard([(1, "Alice", 50, 0), (2, "Bob", 30, 0), (3, "Chloé", 30, 0), (4, "Dan", 10, 0)])
+
+    # Chloé est ex aequo avec Bob, absent de l'extrait
+    assert _ranks(board.around(3, 0)) == [(2, "Chloé")]
+    assert _ranks(board.around(1, 1)) == [(1, "Alice"), (2, "Bob")]
+    assert _ranks(board.around(4, 1)) == [(2, "Chloé"), (4, "Dan")]
+    assert board.around(99, 1) is None
+
+def test_updates_move_members_in_the_ranking():
+    board = RankedLeaderboard([(1, "Alice", 50, 0), (2, "Bob", 30, 0)])
+
+    assert board.set_points(2, 70, 1)
+    board.upsert(3, "Chloé", 60)
+    assert board.rename(1, "Alicia")
+    assert _ranks(board.top(3)) == [(1, "Bob"), (2, "Chloé"), (3, "Alicia")]
+
+    board.remove(3)
+    assert len(board) == 2
+    assert not board.set_points(3, 10, 1)
+
+def test_events_applied_out_of_order_keep_the_latest_points():
+    board = RankedLeaderboard([(1, "Alice", 100, 4)])
+
+    # La validation (version 6) est publiée avant la réclamation (version 5)
+    assert board.set_points(1, 120, 6)
+    assert board.set_points(1, 90, 5)
+    assert board.top(1)[0]["total_points"] == 120
+    assert board.set_points(1, 100, 4)
+    assert board.top(1)[0]["total_points"] == 120
+
+def test_skip_list_matches_a_sorted_list():
+    rng = random.Random(7)
+    skip_list = IndexableSkipList((-rng.randrange(50), f"M{i}", i) for i in range(200))
+    expected = sorted(skip_list.iter_from(0))
+    assert len(expected) == len(skip_list) == 200
+
+    for i in range(200, 1200):
+        if expected and rng.random() < 0.4:
+            key = expected.pop(rng.randrange(len(expected)))
+            skip_list.remove(key)
+        else:
+            key = (-rng.randrange(50), f"M{i}", i)
+            insort(expected, key)
+            skip_list.add(key)
+        probe = (-rng.randrange(50),)
+        assert skip_list.index(probe) == bisect_left(expected, probe)
+    assert len(skip_list) == len(expected)
+    assert list(skip_list.iter_from(0)) == expected
+    assert list(skip_list.iter_from(37)) == expected[37:]
+    assert list(skip_list.iter_from(len(expected))) == []
+
+def test_a_board_read_during_a_write_is_not_installed():
+    registry = Leaderboards()
+    generation = registry.generation("default")
+    registry.apply("default", lambda board: board.set_points(1, 80, 1))
+
+    assert registry.install("default", [(1, "Alice", 50, 0)], generation) is None
+    assert registry.install("default", [(1, "Alice", 80, 1)], registry.generation("default")) is not None
+
+def test_top_and_around_endpoints(client, db_session):
+    db_session.add_all([
+        FamilyMember(name="Alice", total_points=50),
+        FamilyMember(name="Bob", total_points=30),
+        FamilyMember(name="Chloé", total_points=30),
+        FamilyMember(name="Dan", total_points=10),
+    ])
+    db_session.commit()
+
+    response = client.get("/api/v1/leaderboard?top=2")
+    assert response.status_code == 200
+    assert response.json()["total"] == 4
+    assert _ranks(response.json()["entries"]) == [(1, "Alice"), (2, "Bob")]
+
+    dan = db_session.query(FamilyMember).filter_by(name="Dan").one()
+    around = client.get(f"/api/v1/leaderboard?around={dan.id}&radius=1").json()["entries"]
+    assert _ranks(around) == [(2, "Chloé"), (4, "Dan")]
+    assert around[1] == {"rank": 4, "id": dan.id, "name": "Dan", "total_points": 10}
+
+    assert client.get("/api/v1/leaderboard?around=999").status_code == 404
+    assert client.get("/api/v1/leaderboard?top=0").status_code == 422
+
+def test_writes_update_the_leaderboard_without_reading_the_database(client, db_session, query_counter):
+    alice = FamilyMember(name="Alice", total_points=50)
+    db_session.add(alice)
+    db_session.commit()
+    client.get("/api/v1/leaderboard")
+
+    bob_id = client.post("/api/members", json={"name": "Bob"}).json()["id"]
+    chloe_id = client.post("/api/members", json={"name": "Chloé"}).json()["id"]
+    task_id = client.post("/api/tasks", json={"description": "Vaisselle", "points": 80, "assigned_to_id": bob_id}).json()["id"]
+    client.post(f"/api/tasks/{task_id}/complete", json={"completions": [{"member_id": bob_id, "percentage": 100}]})
+    client.put(f"/api/members/{alice.id}", json={"name": "Alicia"})
+
+    with query_counter.at_most(0):
+        entries = client.get("/api/v1/leaderboard").json()["entries"]
+    assert [(entry["name"], entry["total_points"]) for entry in entries] == [("Bob", 80), ("Alicia", 50), ("Chloé", 0)]
+
+    client.delete(f"/api/members/{chloe_id}")
+    assert _ranks(client.get("/api/v1/leaderboard").json()["entries"]) == [(1, "Bob"), (2, "Alicia")]
+
+def test_unknown_member_in_an_event_triggers_a_rebuild(client, db_session):
+    db_session.add(FamilyMember(name="Alice", total_points=50))
+    db_session.commit()
+    client.get("/api/v1/leaderboard")
+
+    # Ajouté sans passer par l'API : le classement ne le connaît pas
+    bob = FamilyMember(name="Bob", total_points=0)
+    db_session.add(bob)
+    db_session.commit()
+    client.put(f"/api/members/{bob.id}", json={"total_points": 90})
+
+    entries = client.get("/api/v1/leaderboard").json()["entries"]
+    assert [(entry["name"], entry["total_points"]) for entry in entries] == [("Bob", 90), ("Alice", 50)]
+
+def test_warm_up_builds_the_leaderboard_from_the_database(db_session):
+    leaderboards.clear()
+    db_session.add_all([FamilyMember(name="Alice", total_points=50), FamilyMember(name="Bob", total_points=70)])
+    db_session.commit()
+
+    assert _warm_up(db_session) == 2
+    assert _ranks(leaderboards.get(current_household.get()).top(2)) == [(1, "Bob"), (2, "Alice")]
+    leaderboards.clear()
@@ -0,0 +1,65 @@
+import re
+from src.core.metrics import MetricsRegistry
+from src.core.models import FamilyMember
+
+def _sample(text, name, **labels):
+    """Valeur d'un échantillon de l'export, ou None."""
+    for line in text.splitlines():
+        if line.startswith("#"):
+            continue
+        match = re.fullmatch(r"(\w+)(?:\{(.*)\})? (\S+)", line)
+        found = dict(re.findall(r'(\w+)="((?:[^"\\]|\\.)*)"', match.group(2) or ""))
+        if match.group(1) == name and found == labels:
+            return float(match.group(3))
+    return None
+
+def test_metrics_endpoint_reports_requests_and_sql(client, db_session):
+    hero = FamilyMember(name="Hero", total_points=0)
+    db_session.add(hero)
+    db_session.commit()
+    client.get("/api/members")
+    client.get(f"/api/members/{hero.id}")
+    client.get("/api/members/999")
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    text = response.text
+
+    assert _sample(text, "http_requests_total", method="GET", route="/api/members/{member_id}", status="200") >= 1
+    assert _sample(text, "http_requests_total", method="GET", route="/api/members/{member_id}", status="404") >= 1
+    assert _sample(text, "http_request_duration_seconds_count", method="GET", route="/api/members") >= 1
+    assert _sample(text, "http_request_duration_seconds_bucket", method="GET", route="/api/members", le="+Inf") >= 1
+    # La liste des membres interroge la base : au moins une requête SQL rattachée à la route
+    assert _sample(text, "http_request_sql_queries_sum", method="GET", route="/api/members") >= 1
+    assert _sample(text, "db_queries_total") >= 3
+    assert _sample(text, "response_cache_entries") is not None
+
+def test_unknown_paths_share_one_label(client, db_session):
+    client.get("/nope/1")
+    client.get("/nope/2")
+
+    text = client.get("/metrics").text
+
+    assert _sample(text, "http_requests_total", method="GET", route="unmatched", status="404") >= 2
+    assert "/nope/" not in text
+
+def test_debug_routes_endpoint_is_gone(client, db_session):
+    assert client.get("/debug/routes").status_code == 404
+
+def test_histogram_buckets_are_cumulative():
+    registry = MetricsRegistry()
+    histogram = registry.histogram("latency_seconds", "Latency.", buckets=(0.1, 1), labelnames=("route",))
+    for value in (0.05, 0.5, 0.5, 3):
+        histogram.observe(value, route='/a"b')
+
+    lines = registry.render().splitlines()
+
+    assert lines[:2] == ["# HELP latency_seconds Latency.", "# TYPE latency_seconds histogram"]
+    assert lines[2:] == [
+        'latency_seconds_bucket{route="/a\\"b",le="0.1"} 1',
+        'latency_seconds_bucket{route="/a\\"b",le="1"} 3',
+        'latency_seconds_bucket{route="/a\\"b",le="+Inf"} 4',
+        'latency_seconds_sum{route="/a\\"b"} 4.05',
+        'latency_seconds_count{route="/a\\"b"} 4',
+    ]
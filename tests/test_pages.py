@@ -0,0 +1,46 @@
+import pytest
+from src.api.web_routes import STATIC_PAGE_TEMPLATES
+from src.core.models import FamilyMember
+from src.web.pages import static_pages
+
+STATIC_PAGES = ("/", "/members", "/quests-rewards", "/statistiques", "/slideshow", "/caster", "/slideshow/dashboard", "/slideshow/statistiques")
+
+@pytest.mark.parametrize("path", STATIC_PAGES)
+def test_static_pages_are_served_with_an_etag(client, path):
+    response = client.get(path)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/html")
+    assert response.headers["cache-control"] == "no-cache"
+
+    revalidated = client.get(path, headers={"If-None-Match": response.headers["etag"]})
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+
+def test_static_pages_are_rendered_at_startup(client):
+    # Le démarrage de l'application (lifespan du client) a rendu les deux variantes de chaque page
+    for template in STATIC_PAGE_TEMPLATES:
+        for show_menu in (True, False):
+            assert static_pages.get(template, show_menu) is static_pages.get(template, show_menu)
+
+def test_show_menu_variant(client):
+    with_menu = client.get("/slideshow")
+    without_menu = client.get("/slideshow?showMenu=false")
+    assert "<header>" in with_menu.text
+    assert "<header>" not in without_menu.text
+    assert with_menu.headers["etag"] != without_menu.headers["etag"]
+
+def test_hero_pages_render_per_request(client, db_session):
+    hero = FamilyMember(name="Héroïne du jour", total_points=0)
+    db_session.add(hero)
+    db_session.commit()
+
+    page = client.get(f"/members/{hero.id}")
+    assert page.status_code == 200
+    assert "Héroïne du jour" in page.text
+    assert "<header>" in page.text
+
+    partial = client.get(f"/slideshow/hero/{hero.id}?showMenu=false")
+    assert partial.status_code == 200
+    assert "Héroïne du jour" in partial.text
+
+    assert client.get("/members/999").status_code == 404
@@ -0,0 +1,78 @@
+import random
+import threading
+from sqlalchemy import func
+from sqlalchemy.orm import sessionmaker
+from src.core import schemas
+from src.core.models import Base, FamilyMember, Task, Reward, PointsHistory
+from src.data import database
+
+THREADS = 8
+OPERATIONS_PER_THREAD = 40
+
+def test_balances_match_history_under_contention(tmp_path):
+    engine = database.create_sqlite_engine(f"sqlite:///{tmp_path / 'ledger.db'}")
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    with Session() as db:
+        members = [FamilyMember(name=f"Hero {i}", total_points=0) for i in range(3)]
+        reward = Reward(name="Gâteau", cost=15)
+        db.add_all(members + [reward])
+        db.flush()
+        tasks = [Task(description=f"Quest {i}", points=10) for i in range(THREADS * OPERATIONS_PER_THREAD)]
+        db.add_all(tasks)
+        db.commit()
+        member_ids = [m.id for m in members]
+        task_ids = [t.id for t in tasks]
+        reward_id = reward.id
+
+    errors = []
+    outcomes = {"completed": 0, "claimed": 0}
+    outcomes_lock = threading.Lock()
+    start = threading.Barrier(THREADS)
+
+    def worker(seed):
+        rng = random.Random(seed)
+        start.wait()
+        try:
+            for _ in range(OPERATIONS_PER_THREAD):
+                with Session() as db:
+                    if rng.random() < 0.6:
+                        # Plusieurs threads visent les mêmes tâches : une seule validation doit réussir
+                        task_id = rng.choice(task_ids)
+                        first, second = rng.sample(member_ids, 2)
+                        result = database.complete_task(db, task_id, [
+                            schemas.TaskCompletionData(member_id=first, percentage=50),
+                            schemas.TaskCompletionData(member_id=second, percentage=50),
+                        ])
+                        outcome = "completed"
+                    else:
+                        result = database.claim_reward(db, rng.choice(member_ids), reward_id)
+                        outcome = "claimed"
+                if result is not None:
+                    with outcomes_lock:
+                        outcomes[outcome] += 1
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(seed,)) for seed in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    with Session() as db:
+        history = dict(
+            db.query(PointsHistory.member_id, func.sum(PointsHistory.points_change))
+            .group_by(PointsHistory.member_id)
+            .all()
+        )
+        for member in db.query(FamilyMember):
+            assert member.total_points == history.get(member.id, 0)
+            assert member.total_points >= 0
+        assert db.query(Task).filter(Task.status == "completed").count() == outcomes["completed"]
+        assert db.query(PointsHistory).filter(PointsHistory.reward_id == reward_id).count() == outcomes["claimed"]
+        assert sum(history.values()) == outcomes["completed"] * 10 - outcomes["claimed"] * 15
+    assert outcomes["completed"] > 0 and outcomes["claimed"] > 0
+    engine.dispose()
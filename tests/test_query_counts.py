@@ -0,0 +1,43 @@
+import pytest
+from src.core.models import FamilyMember, Task, TaskCompletion
+from datetime import datetime, timedelta, UTC
+
+def _seed(db_session, members, tasks_per_member):
+    heroes = [FamilyMember(name=f"Hero {i}", total_points=i * 10) for i in range(members)]
+    db_session.add_all(heroes)
+    db_session.commit()
+    for hero in heroes:
+        for j in range(tasks_per_member):
+            task = Task(description=f"Quest {hero.id}-{j}", points=10, assigned_to_id=hero.id, status='completed')
+            task.completions.append(TaskCompletion(member_id=hero.id))
+            db_session.add(task)
+    db_session.commit()
+    db_session.expunge_all()
+
+@pytest.mark.parametrize("members", [2, 25])
+@pytest.mark.parametrize("url", ["/api/members", "/api/leaderboard", "/api/tasks"])
+def test_list_endpoints_have_bounded_query_count(client, db_session, query_counter, url, members):
+    _seed(db_session, members, tasks_per_member=3)
+
+    with query_counter.at_most(2):
+        response = client.get(url)
+    assert response.status_code == 200
+    assert all(len(item["completions"]) > 0 for item in response.json())
+
+def test_tasks_created_after_has_bounded_query_count(client, db_session, query_counter):
+    _seed(db_session, 20, tasks_per_member=2)
+    created_after = (datetime.now(UTC) - timedelta(days=1)).replace(tzinfo=None).isoformat()
+
+    with query_counter.at_most(2):
+        response = client.get(f"/api/tasks?created_after={created_after}")
+    assert response.status_code == 200
+    assert len(response.json()) == 40
+
+def test_member_details_has_bounded_query_count(client, db_session, query_counter):
+    _seed(db_session, 1, tasks_per_member=30)
+    member_id = db_session.query(FamilyMember.id).scalar()
+
+    with query_counter.at_most(8):
+        response = client.get(f"/api/v1/members/{member_id}/details")
+    assert response.status_code == 200
+    assert len(response.json()["completed_tasks"]) == 30
@@ -0,0 +1,63 @@
+import re
+import pytest
+from sqlalchemy import event
+from src.core.models import FamilyMember
+from src.data import database, statistics
+from datetime import datetime, timedelta, UTC
+
+# Tables volumineuses qui ne doivent jamais être parcourues intégralement
+HOT_TABLES = ("points_history", "tasks", "member_daily_points")
+FULL_SCAN = re.compile(r"^SCAN (%s)\b" % "|".join(HOT_TABLES))
+
+def _capture_statements(engine, fn):
+    captured = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        captured.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        fn()
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    return captured
+
+def _full_scans(engine, statements):
+    scans = []
+    raw = engine.raw_connection()
+    try:
+        cursor = raw.cursor()
+        for statement, parameters in statements:
+            for row in cursor.execute(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall():
+                detail = row[-1]
+                if FULL_SCAN.match(detail):
+                    scans.append(f"{detail}\n  <- {statement}")
+    finally:
+        raw.close()
+    return scans
+
+@pytest.mark.parametrize("query", [
+    lambda db, member_id: database.get_daily_points_for_member(db, member_id, 'weekly'),
+    lambda db, member_id: database.get_claimed_rewards_for_member(db, member_id),
+    lambda db, member_id: database.get_tasks_for_member_by_status(db, member_id, 'pending'),
+    lambda db, member_id: database.get_tasks_created_after(db, datetime.now(UTC) - timedelta(days=7)),
+    lambda db, member_id: statistics.get_points_by_user_per_period(db, 'weekly'),
+    lambda db, member_id: database.expire_overdue_tasks(db),
+], ids=[
+    "get_daily_points_for_member",
+    "get_claimed_rewards_for_member",
+    "get_tasks_for_member_by_status",
+    "get_tasks_created_after",
+    "get_points_by_user_per_period",
+    "expire_overdue_tasks",
+])
+def test_hot_queries_use_indexes(db_session, query):
+    member = FamilyMember(name="Plan Hero", total_points=0)
+    db_session.add(member)
+    db_session.commit()
+
+    engine = db_session.get_bind()
+    statements = _capture_statements(engine, lambda: query(db_session, member.id))
+
+    assert statements
+    assert _full_scans(engine, statements) == []
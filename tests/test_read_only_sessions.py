@@ -0,0 +1,68 @@
+import asyncio
+import time
+import pytest
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import OperationalError
+from src.core.models import Base, FamilyMember
+from src.data.async_database import create_async_sqlite_engine
+from src.data.database import create_sqlite_engine, read_only_url
+
+@pytest.fixture(name="engines")
+def engines_fixture(tmp_path):
+    url = f"sqlite:///{tmp_path / 'family.db'}"
+    primary = create_sqlite_engine(url)
+    Base.metadata.create_all(primary)
+    reader = create_sqlite_engine(url, read_only=True)
+    yield url, primary, reader
+    reader.dispose()
+    primary.dispose()
+
+def test_read_only_url():
+    url = make_url(read_only_url("sqlite:///./db/family.db"))
+    assert url.database == "file:./db/family.db"
+    assert dict(url.query) == {"mode": "ro", "uri": "true"}
+
+def test_read_only_engine_rejects_writes(engines):
+    _, _, reader = engines
+    with reader.connect() as connection:
+        with pytest.raises(OperationalError, match="readonly"):
+            connection.execute(text("INSERT INTO family_members (name, total_points) VALUES ('Alice', 0)"))
+
+def test_reads_do_not_wait_for_a_write_transaction(engines):
+    _, primary, reader = engines
+    with primary.begin() as connection:
+        connection.execute(text("INSERT INTO family_members (name, total_points) VALUES ('Alice', 10)"))
+
+    with primary.connect() as writer:
+        # Verrou d'écriture tenu (transaction non validée) par le moteur principal
+        writer.exec_driver_sql("BEGIN IMMEDIATE")
+        writer.exec_driver_sql("UPDATE family_members SET total_points = 20")
+        start = time.perf_counter()
+        with reader.connect() as connection:
+            points = connection.execute(text("SELECT total_points FROM family_members")).scalar_one()
+        assert time.perf_counter() - start < 1
+        # Le lecteur voit le dernier état validé
+        assert points == 10
+        writer.exec_driver_sql("COMMIT")
+
+    with reader.connect() as connection:
+        assert connection.execute(text("SELECT total_points FROM family_members")).scalar_one() == 20
+
+def test_async_read_only_engine(engines):
+    url, primary, _ = engines
+    with primary.begin() as connection:
+        connection.execute(FamilyMember.__table__.insert(), [{"name": "Alice", "total_points": 5}])
+
+    async def scenario():
+        reader = create_async_sqlite_engine(url, read_only=True)
+        try:
+            async with reader.connect() as connection:
+                names = (await connection.execute(text("SELECT name FROM family_members"))).scalars().all()
+                with pytest.raises(OperationalError, match="readonly"):
+                    await connection.execute(text("DELETE FROM family_members"))
+            return names
+        finally:
+            await reader.dispose()
+
+    assert asyncio.run(scenario()) == ["Alice"]
@@ -0,0 +1,110 @@
+from datetime import datetime, timedelta, UTC
+from src.core.models import FamilyMember, Task, TaskTemplate
+from src.data import recurring
+from src.data.database import as_utc
+
+START = datetime(2024, 1, 1, 8, 0, tzinfo=UTC)
+
+def _occurrences(db_session, template_id):
+    return [
+        as_utc(task.occurrence_at)
+        for task in db_session.query(Task).filter(Task.template_id == template_id).order_by(Task.occurrence_at)
+    ]
+
+def test_generate_occurrences(db_session):
+    template = recurring.create_task_template(db_session, "Sortir les poubelles", 5, "weeks", starts_at=START)
+
+    result = recurring.generate_recurring_tasks(db_session, START + timedelta(days=20))
+
+    assert result["templates"] == 1
+    assert result["created"] == 3
+    assert _occurrences(db_session, template.id) == [START, START + timedelta(weeks=1), START + timedelta(weeks=2)]
+    task = db_session.query(Task).filter(Task.template_id == template.id).first()
+    assert task.status == "pending"
+    assert as_utc(task.expires_at) - as_utc(task.created_at) == timedelta(weeks=1)
+
+def test_occurrence_dates_keep_microseconds(db_session):
+    starts_at = START.replace(microsecond=123456)
+    template = recurring.create_task_template(db_session, "Lit", 1, "months", starts_at=starts_at)
+
+    recurring.generate_recurring_tasks(db_session, starts_at + timedelta(days=45))
+
+    assert _occurrences(db_session, template.id) == [starts_at, starts_at + timedelta(days=30)]
+    task = db_session.query(Task).filter(Task.template_id == template.id).order_by(Task.occurrence_at).first()
+    assert as_utc(task.expires_at) == starts_at + timedelta(days=30)
+
+def test_generation_is_idempotent(db_session):
+    template = recurring.create_task_template(db_session, "Arroser", 3, "days", duration_value=2, starts_at=START)
+    until = START + timedelta(days=10)
+    recurring.generate_recurring_tasks(db_session, until)
+
+    assert recurring.generate_recurring_tasks(db_session, until)["created"] == 0
+
+    # Même en perdant le curseur, l'index unique empêche les doublons
+    db_session.query(TaskTemplate).update({TaskTemplate.generated_until: None})
+    db_session.commit()
+    assert recurring.generate_recurring_tasks(db_session, until)["created"] == 0
+
+    assert recurring.generate_recurring_tasks(db_session, until + timedelta(days=2))["created"] == 1
+    assert len(_occurrences(db_session, template.id)) == 7
+
+def test_inactive_templates_are_skipped(db_session):
+    template = recurring.create_task_template(db_session, "Vaisselle", 2, "days", starts_at=START)
+    assert recurring.delete_task_template(db_session, template.id)
+    assert not recurring.delete_task_template(db_session, template.id)
+
+    assert recurring.generate_recurring_tasks(db_session, START + timedelta(days=5))["created"] == 0
+    assert recurring.get_task_templates(db_session) == []
+
+def test_task_templates_api(client, db_session):
+    hero = FamilyMember(name="Hero", total_points=0)
+    db_session.add(hero)
+    db_session.commit()
+
+    response = client.post("/api/v1/task-templates", json={"description": "Lit", "points": 4, "assigned_to_id": hero.id, "duration_unit": "days"})
+    assert response.status_code == 201
+    template = response.json()
+    assert client.post("/api/v1/task-templates", json={"description": "Lit", "points": 4, "assigned_to_id": 999, "duration_unit": "days"}).status_code == 400
+
+    generated = client.post("/api/v1/task-templates/generate?horizon_days=3").json()
+    assert generated["created"] == 4
+    tasks = client.get("/api/v1/tasks").json()["items"]
+    assert {task["template_id"] for task in tasks} == {template["id"]}
+    assert all(task["assigned_to_id"] == hero.id for task in tasks)
+
+    assert client.delete(f"/api/v1/task-templates/{template['id']}").status_code == 204
+    assert client.delete(f"/api/v1/task-templates/{template['id']}").status_code == 404
+    assert client.get("/api/v1/task-templates").json() == []
+
+def test_generation_scales_with_bulk_inserts(db_session, query_counter):
+    db_session.add_all(
+        TaskTemplate(description=f"Quête {i}", points=1, duration_value=1, duration_unit="days", starts_at=START, active=True)
+        for i in range(300)
+    )
+    db_session.commit()
+
+    # Un seul INSERT ... SELECT, quel que soit le nombre d'occurrences ; la durée est suivie
+    # par le cas `recurring.generate_recurring_tasks[300 templates x 180 days]` de benchmarks.run
+    with query_counter.at_most(5):
+        result = recurring.generate_recurring_tasks(db_session, START + timedelta(days=179))
+
+    assert result["created"] == 300 * 180
+
+def test_future_occurrences_cannot_be_completed_early(client, db_session):
+    hero = FamilyMember(name="Hero", total_points=0)
+    db_session.add(hero)
+    db_session.commit()
+    starts_at = datetime.now(UTC) - timedelta(hours=1)
+    template = recurring.create_task_template(db_session, "Lit", 4, "days", assigned_to_id=hero.id, starts_at=starts_at)
+    recurring.generate_recurring_tasks(db_session, starts_at + timedelta(days=2))
+
+    current, future, _ = db_session.query(Task).filter(Task.template_id == template.id).order_by(Task.occurrence_at).all()
+    assert (current.status, future.status) == ("pending", "scheduled")
+
+    completion = {"completions": [{"member_id": hero.id, "percentage": 100}]}
+    assert client.post(f"/api/tasks/{future.id}/complete", json=completion).status_code == 404
+    response = client.post("/api/v1/tasks/complete-bulk", json={"items": [{"task_id": future.id, **completion}]})
+    assert response.json()["results"][0]["error"] == "Task not found or already completed"
+
+    assert recurring.release_due_tasks(db_session, starts_at + timedelta(days=1)) == [future.id]
+    assert client.post(f"/api/tasks/{future.id}/complete", json=completion).status_code == 200
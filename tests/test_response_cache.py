@@ -0,0 +1,56 @@
+from src.core.cache import ResponseCache
+from src.core.models import FamilyMember, Reward
+
+def test_lru_eviction_by_entries_and_bytes():
+    cache = ResponseCache(max_entries=2, max_bytes=10)
+    cache.set("a", b"1234", ["members"])
+    cache.set("b", b"1234", ["members"])
+    assert cache.get("a") == b"1234"  # "a" devient le plus récent
+    cache.set("c", b"1234", ["rewards"])
+    assert cache.get("b") is None
+    cache.set("d", b"123456", ["rewards"])
+    assert cache.stats()["bytes"] <= 10
+    assert cache.stats()["evictions"] == 2
+    cache.set("huge", b"x" * 11, ["rewards"])
+    assert cache.get("huge") is None
+
+def test_invalidate_by_tag():
+    cache = ResponseCache()
+    cache.set("members", b"[]", ["members"])
+    cache.set("stats", b"{}", ["members", "points_history"])
+    cache.set("rewards", b"[]", ["rewards"])
+    cache.invalidate({"points_history"})
+    assert cache.get("stats") is None
+    assert cache.get("members") == b"[]"
+    assert cache.get("rewards") == b"[]"
+
+def test_stale_generation_is_not_stored():
+    cache = ResponseCache()
+    generation = cache.generation(["members"])
+    cache.invalidate({"members"})  # écriture pendant le calcul de la réponse
+    cache.set("members", b"[]", ["members"], generation)
+    assert cache.get("members") is None
+
+def test_read_endpoints_hit_cache_until_write(client, db_session, query_counter):
+    db_session.add_all([FamilyMember(name="Cached Hero", total_points=10), Reward(name="Cached Reward", cost=5)])
+    db_session.commit()
+
+    assert len(client.get("/api/members").json()) == 1
+    with query_counter.at_most(0):
+        assert len(client.get("/api/members").json()) == 1
+    stats = client.get("/api/v1/cache/stats").json()
+    assert stats["hits"] >= 1
+
+    response = client.post("/api/members", json={"name": "New Hero"})
+    assert response.status_code == 201
+    assert len(client.get("/api/members").json()) == 2
+
+def test_reward_claim_invalidates_statistics(client, db_session):
+    member = FamilyMember(name="Claimer", total_points=100)
+    reward = Reward(name="Cache Cookie", cost=30)
+    db_session.add_all([member, reward])
+    db_session.commit()
+
+    assert client.get("/api/v1/statistiques").json()["most_used_rewards"] == []
+    client.post("/api/rewards/claim", json={"member_id": member.id, "reward_id": reward.id})
+    assert client.get("/api/v1/statistiques").json()["most_used_rewards"] == [{"name": "Cache Cookie", "count": 1}]
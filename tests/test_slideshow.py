@@ -0,0 +1,76 @@
+from datetime import datetime, timedelta, UTC
+from src.api.slideshow import SLIDESHOW_RECENT_ITEMS
+from src.core.models import FamilyMember, PointsHistory, Reward, Task, TaskCompletion
+
+def _seed(db_session, extra_members=0):
+    alice = FamilyMember(name="Alice", total_points=40)
+    bob = FamilyMember(name="Bob", total_points=90)
+    db_session.add_all([alice, bob] + [FamilyMember(name=f"Héros {i}", total_points=i) for i in range(extra_members)])
+    db_session.commit()
+
+    now = datetime.now(UTC)
+    completed = []
+    for i in range(SLIDESHOW_RECENT_ITEMS + 2):
+        task = Task(description=f"Quête {i}", points=5, assigned_to_id=alice.id, status="completed", completed_at=now - timedelta(hours=i))
+        task.completions.append(TaskCompletion(member_id=alice.id))
+        completed.append(task)
+    pending = Task(description="Arroser les plantes", points=10, assigned_to_id=bob.id, status="pending")
+    reward = Reward(name="Cinéma", cost=20, description=None)
+    db_session.add_all(completed + [pending, reward])
+    db_session.commit()
+    db_session.add_all([
+        PointsHistory(member_id=alice.id, points_change=60, reason="Quêtes", timestamp=now),
+        PointsHistory(member_id=alice.id, reward_id=reward.id, points_change=-20, reason="Récompense", timestamp=now),
+    ])
+    db_session.commit()
+    return alice, bob
+
+def test_manifest_contains_every_slide_and_its_data(client, db_session):
+    alice, bob = _seed(db_session)
+
+    response = client.get("/api/v1/slideshow/manifest")
+    assert response.status_code == 200
+    manifest = response.json()
+    assert manifest["version"]
+
+    slides = manifest["slides"]
+    assert [slide["type"] for slide in slides] == ["dashboard", "statistics", "hero", "hero"]
+    assert [entry["name"] for entry in slides[0]["dashboard"]["leaderboard"]] == ["Bob", "Alice"]
+    assert slides[1]["points_by_user"] == [{"name": "Alice", "points": 60}]
+    assert slides[1]["most_used_rewards"] == [{"name": "Cinéma", "count": 1}]
+
+    # Un héros par membre, du plus au moins de points
+    bob_slide, alice_slide = slides[2], slides[3]
+    assert bob_slide["url"] == f"/slideshow/hero/{bob.id}"
+    assert [task["description"] for task in bob_slide["pending_tasks"]] == ["Arroser les plantes"]
+    assert bob_slide["completed_tasks"] == []
+
+    assert alice_slide["member"] == {"id": alice.id, "name": "Alice", "total_points": 40}
+    # Seules les plus récentes, de la plus récente à la plus ancienne
+    assert [task["description"] for task in alice_slide["completed_tasks"]] == [f"Quête {i}" for i in range(SLIDESHOW_RECENT_ITEMS)]
+    assert alice_slide["completed_tasks"][0]["completions"][0]["member_id"] == alice.id
+    assert [day["points"] for day in alice_slide["daily_points"]] == [60]
+    assert [reward["name"] for reward in alice_slide["claimed_rewards"]] == ["Cinéma"]
+
+def test_manifest_is_revalidated_until_a_write(client, db_session):
+    _, bob = _seed(db_session)
+
+    first = client.get("/api/v1/slideshow/manifest")
+    etag = first.headers["etag"]
+    assert client.get("/api/v1/slideshow/manifest", headers={"If-None-Match": etag}).status_code == 304
+
+    client.post("/api/tasks", json={"description": "Nouvelle quête", "points": 5, "assigned_to_id": bob.id})
+    second = client.get("/api/v1/slideshow/manifest", headers={"If-None-Match": etag})
+    assert second.status_code == 200
+    assert second.json()["version"] != first.json()["version"]
+    assert "Nouvelle quête" in [task["description"] for task in second.json()["slides"][2]["pending_tasks"]]
+
+def test_manifest_query_count_does_not_grow_with_members(client, db_session, query_counter):
+    _seed(db_session, extra_members=8)
+
+    with query_counter.at_most(12):
+        response = client.get("/api/v1/slideshow/manifest?period=monthly")
+    assert len(response.json()["slides"]) == 2 + 10
+
+def test_manifest_period_is_validated(client):
+    assert client.get("/api/v1/slideshow/manifest?period=yearly").status_code == 422
@@ -0,0 +1,45 @@
+from datetime import datetime, timedelta, UTC
+from src.core.models import FamilyMember, Task
+from src.data import database
+
+def test_create_task_stores_expires_at(client, db_session):
+    response = client.post("/api/tasks", json={"description": "Tondre", "points": 10, "duration_value": 2, "duration_unit": "days"})
+    data = response.json()
+
+    created_at = datetime.fromisoformat(data["created_at"])
+    assert datetime.fromisoformat(data["expires_at"]) - created_at == timedelta(days=2)
+
+    no_duration = client.post("/api/tasks", json={"description": "Ranger", "points": 5}).json()
+    assert no_duration["expires_at"] is None
+
+def test_update_task_recomputes_expires_at(client, db_session):
+    task = client.post("/api/tasks", json={"description": "Tondre", "points": 10, "duration_value": 2, "duration_unit": "days"}).json()
+
+    updated = client.put(f"/api/tasks/{task['id']}", json={"duration_value": 1, "duration_unit": "weeks"}).json()
+
+    assert datetime.fromisoformat(updated["expires_at"]) - datetime.fromisoformat(updated["created_at"]) == timedelta(weeks=1)
+
+def test_expire_overdue_tasks(db_session):
+    now = datetime.now(UTC)
+    overdue = Task(description="En retard", points=10, expires_at=now - timedelta(minutes=1))
+    upcoming = Task(description="À venir", points=10, expires_at=now + timedelta(days=1))
+    no_deadline = Task(description="Sans durée", points=10)
+    done = Task(description="Finie", points=10, status="completed", expires_at=now - timedelta(days=1))
+    db_session.add_all([overdue, upcoming, no_deadline, done])
+    db_session.commit()
+
+    assert database.expire_overdue_tasks(db_session, now) == [overdue.id]
+    assert database.expire_overdue_tasks(db_session, now) == []
+
+    db_session.expire_all()
+    statuses = {t.description: t.status for t in db_session.query(Task)}
+    assert statuses == {"En retard": "expired", "À venir": "pending", "Sans durée": "pending", "Finie": "completed"}
+
+def test_expired_task_cannot_be_completed(client, db_session):
+    hero = FamilyMember(name="Hero", total_points=0)
+    task = Task(description="Trop tard", points=10, expires_at=datetime.now(UTC) - timedelta(hours=1))
+    db_session.add_all([hero, task])
+    db_session.commit()
+
+    response = client.post(f"/api/tasks/{task.id}/complete", json={"completions": [{"member_id": hero.id, "percentage": 100}]})
+    assert response.status_code == 404
@@ -0,0 +1,114 @@
+from sqlalchemy import func
+from src.core.models import FamilyMember, Task, TaskCompletion, PointsHistory, MemberDailyPoints
+
+def _members(db_session, *names):
+    members = [FamilyMember(name=name, total_points=0) for name in names]
+    db_session.add_all(members)
+    db_session.commit()
+    return members
+
+def test_bulk_create_tasks(client, db_session):
+    alice, = _members(db_session, "Alice")
+
+    response = client.post("/api/v1/tasks/bulk", json={"tasks": [
+        {"description": "Vaisselle", "points": 10, "assigned_to_id": alice.id},
+        {"description": "Courses", "points": 20, "assigned_to_id": 999},
+        {"description": "Linge", "points": 15, "duration_value": 2},
+        {"description": "Poubelles", "points": 5, "duration_value": 1, "duration_unit": "weeks"},
+    ]})
+    assert response.status_code == 200
+    data = response.json()
+    assert (data["succeeded"], data["failed"]) == (2, 2)
+    assert [r["status"] for r in data["results"]] == ["created", "error", "error", "created"]
+    assert data["results"][1]["error"] == "Member not found"
+
+    created_ids = [r["task_id"] for r in data["results"] if r["status"] == "created"]
+    tasks = db_session.query(Task).order_by(Task.id).all()
+    assert [t.id for t in tasks] == created_ids
+    assert [t.description for t in tasks] == ["Vaisselle", "Poubelles"]
+    assert all(t.status == "pending" and t.created_at is not None for t in tasks)
+
+def test_bulk_update_tasks(client, db_session, query_counter):
+    alice, = _members(db_session, "Alice")
+    tasks = [Task(description=f"Quest {i}", points=10) for i in range(300)]
+    timed = Task(description="Arroser", points=5)
+    db_session.add_all(tasks + [timed])
+    db_session.commit()
+
+    items = [{"task_id": task.id, "points": 20, "assigned_to_id": alice.id} for task in tasks[:-2]]
+    items += [
+        {"task_id": timed.id, "duration_value": 2, "duration_unit": "days"},
+        {"task_id": tasks[0].id, "description": "Doublon"},
+        {"task_id": 999, "points": 1},
+        {"task_id": tasks[-2].id, "assigned_to_id": 999},
+        {"task_id": timed.id, "duration_unit": "weeks"},
+        {"task_id": tasks[-1].id, "duration_value": 3},
+    ]
+    with query_counter.at_most(8):
+        response = client.post("/api/v1/tasks/update-bulk", json={"items": items})
+    data = response.json()
+    assert (data["succeeded"], data["failed"]) == (299, 5)
+    assert [r["error"] for r in data["results"][-5:]] == [
+        "Duplicate task_id in request",
+        "Task not found",
+        "Member not found",
+        "Duplicate task_id in request",
+        "duration_value and duration_unit must be provided together",
+    ]
+    assert data["results"][-6]["status"] == "updated"
+
+    db_session.expire_all()
+    assert db_session.query(func.sum(Task.points)).filter(Task.assigned_to_id == alice.id).scalar() == 20 * 298
+    assert db_session.get(Task, tasks[0].id).description == "Quest 0"
+    updated = db_session.get(Task, timed.id)
+    assert (updated.duration_value, updated.duration_unit, updated.status) == (2, "days", "pending")
+    assert updated.expires_at is not None
+
+def test_bulk_complete_tasks(client, db_session):
+    alice, bob = _members(db_session, "Alice", "Bob")
+    tasks = [Task(description=f"Quest {i}", points=10) for i in range(3)]
+    done = Task(description="Déjà faite", points=10, status="completed")
+    db_session.add_all(tasks + [done])
+    db_session.commit()
+
+    response = client.post("/api/v1/tasks/complete-bulk", json={"items": [
+        {"task_id": tasks[0].id, "completions": [{"member_id": alice.id, "percentage": 100}]},
+        {"task_id": tasks[1].id, "completions": [{"member_id": alice.id, "percentage": 50}, {"member_id": bob.id, "percentage": 50}]},
+        {"task_id": tasks[2].id, "completions": [{"member_id": alice.id, "percentage": 60}]},
+        {"task_id": done.id, "completions": [{"member_id": bob.id, "percentage": 100}]},
+        {"task_id": tasks[0].id, "completions": [{"member_id": bob.id, "percentage": 100}]},
+        {"task_id": 999, "completions": [{"member_id": bob.id, "percentage": 100}]},
+    ]})
+    assert response.status_code == 200
+    data = response.json()
+    assert [r["status"] for r in data["results"]] == ["completed", "completed", "error", "error", "error", "error"]
+    assert data["results"][2]["error"] == "Total percentage must be 100"
+    assert data["results"][3]["error"] == "Task not found or already completed"
+    assert data["results"][4]["error"] == "Duplicate task_id in request"
+
+    db_session.expire_all()
+    assert db_session.get(FamilyMember, alice.id).total_points == 15
+    assert db_session.get(FamilyMember, bob.id).total_points == 5
+    assert [t.status for t in db_session.query(Task).order_by(Task.id)] == ["completed", "completed", "pending", "completed"]
+    assert db_session.query(TaskCompletion).count() == 3
+    history = db_session.query(PointsHistory).filter(PointsHistory.task_completion_id.isnot(None)).count()
+    assert history == 3
+    assert db_session.query(func.sum(MemberDailyPoints.points_earned)).scalar() == 20
+
+def test_bulk_complete_scales_without_per_row_queries(client, db_session, query_counter):
+    members = _members(db_session, *[f"Hero {i}" for i in range(10)])
+    tasks = [Task(description=f"Quest {i}", points=10) for i in range(1200)]
+    db_session.add_all(tasks)
+    db_session.commit()
+    items = [
+        {"task_id": task.id, "completions": [{"member_id": members[i % 10].id, "percentage": 100}]}
+        for i, task in enumerate(tasks)
+    ]
+
+    with query_counter.at_most(25):
+        response = client.post("/api/v1/tasks/complete-bulk", json={"items": items})
+    assert response.json()["succeeded"] == 1200
+
+    db_session.expire_all()
+    assert db_session.query(func.sum(FamilyMember.total_points)).scalar() == 12000
+    assert db_session.query(func.sum(PointsHistory.points_change)).scalar() == 12000
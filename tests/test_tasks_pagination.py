@@ -0,0 +1,71 @@
+from datetime import datetime, timedelta, UTC
+from src.core.models import FamilyMember, Task, TaskCompletion
+
+def _seed(db_session, count=7):
+    hero = FamilyMember(name="Hero", total_points=0)
+    db_session.add(hero)
+    db_session.commit()
+    base = datetime(2024, 1, 1, tzinfo=UTC)
+    tasks = []
+    for i in range(count):
+        # Deux tâches partagent chaque date de création pour exercer le départage par id
+        task = Task(description=f"Quest {i}", points=10, created_at=base + timedelta(days=i // 2))
+        if i % 3 == 0:
+            task.status = "completed"
+            task.assigned_to_id = hero.id
+            task.completed_at = base + timedelta(days=10 + i)
+            task.completions.append(TaskCompletion(member_id=hero.id))
+        tasks.append(task)
+    db_session.add_all(tasks)
+    db_session.commit()
+    return hero, tasks
+
+def _all_pages(client, url):
+    descriptions, cursor, pages = [], None, 0
+    while True:
+        separator = "&" if "?" in url else "?"
+        response = client.get(url + (f"{separator}cursor={cursor}" if cursor else ""))
+        assert response.status_code == 200
+        data = response.json()
+        descriptions += [t["description"] for t in data["items"]]
+        pages += 1
+        cursor = data["next_cursor"]
+        if cursor is None:
+            return descriptions, pages
+
+def test_keyset_pages_cover_every_task_once(client, db_session):
+    _seed(db_session)
+
+    descriptions, pages = _all_pages(client, "/api/v1/tasks?limit=2")
+
+    assert pages == 4
+    assert descriptions == ["Quest 6", "Quest 5", "Quest 4", "Quest 3", "Quest 2", "Quest 1", "Quest 0"]
+
+def test_filters(client, db_session):
+    hero, _ = _seed(db_session)
+
+    completed = client.get(f"/api/v1/tasks?status=completed&assigned_to_id={hero.id}").json()
+    assert [t["description"] for t in completed["items"]] == ["Quest 6", "Quest 3", "Quest 0"]
+    assert completed["items"][0]["completions"][0]["member_id"] == hero.id
+
+    created = client.get("/api/v1/tasks?created_after=2024-01-02T00:00:00Z&created_before=2024-01-03T00:00:00%2B00:00").json()
+    assert [t["description"] for t in created["items"]] == ["Quest 3", "Quest 2"]
+
+    finished = client.get("/api/v1/tasks?completed_after=2024-01-12T00:00:00&completed_before=2024-01-15T00:00:00").json()
+    assert [t["description"] for t in finished["items"]] == ["Quest 3"]
+
+def test_page_size_is_capped(client, db_session):
+    assert client.get("/api/v1/tasks?limit=0").status_code == 422
+    assert client.get("/api/v1/tasks?limit=100000").status_code == 422
+
+def test_invalid_cursor(client, db_session):
+    response = client.get("/api/v1/tasks?cursor=pas-un-curseur")
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
+
+def test_page_query_count_is_bounded(client, db_session, query_counter):
+    _seed(db_session, count=60)
+
+    with query_counter.at_most(2):
+        response = client.get("/api/v1/tasks?limit=20")
+    assert len(response.json()["items"]) == 20